@@ -37,7 +37,11 @@ class UserList(Resource):
         if existing_user:
             return {'error': 'Email already registered'}, 400
 
-        new_user = facade.create_user(user_data)
+        try:
+            new_user = facade.create_user(user_data)
+        except ValueError as e:
+            # Lost a race with a concurrent registration of the same email
+            return {'error': str(e)}, 400
         return {'id': new_user.id, 'first_name': new_user.first_name,
                 'last_name': new_user.last_name, 'email': new_user.email}, 201
 
@@ -74,7 +78,10 @@ class UserResource(Resource):
                 return {'error': 'Email already registered'}, 400
 
         # Update the user
-        updated_user = facade.update_user(user_id, user_data)
+        try:
+            updated_user = facade.update_user(user_id, user_data)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         return {'id': updated_user.id,
                 'first_name': updated_user.first_name,
                 'last_name': updated_user.last_name,
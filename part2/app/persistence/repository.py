@@ -1,4 +1,8 @@
+import copy
+import operator
+import threading
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 
 class Repository(ABC):
@@ -52,3 +56,193 @@ class InMemoryRepository(Repository):
     def get_by_attribute(self, attr_name, attr_value):
         return next((obj for obj in self._storage.values()
                     if getattr(obj, attr_name) == attr_value), None)
+
+
+class ConcurrentInMemoryRepository(Repository):
+    """Thread-safe in-memory repository with lock striping.
+
+    Objects are spread over ``stripes`` buckets, each guarded by its own
+    lock, so writers to different ids do not block each other. A bucket
+    is never modified in place: writers build a new dict and swap it in,
+    so readers (``get``, ``get_all``, lookups) take no lock and always
+    see a consistent bucket.
+
+    Updates are validated first and then applied to the stored object in
+    a single step, so other objects holding a reference to it (a place's
+    owner, a review's place) keep seeing the current version.
+
+    Secondary indexes map a key (an attribute name, or a function of the
+    object) to object ids and are maintained under the writer's bucket
+    lock. Keys listed in ``unique`` are enforced on add and update.
+    """
+
+    def __init__(self, stripes=16, indexes=None, unique=()):
+        """
+        Args:
+            stripes: number of lock stripes
+            indexes: {index name: key function, or None to index the
+                attribute of that name}
+            unique: names of indexes whose keys must be unique
+        """
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stripes = [{} for _ in range(stripes)]
+        self._index_keys = {
+            name: key if key is not None else operator.attrgetter(name)
+            for name, key in (indexes or {}).items()}
+        self._indexes = {name: {} for name in self._index_keys}
+        self._index_lock = threading.Lock()
+        self._unique = set(unique)
+
+    def _stripe(self, obj_id):
+        return hash(obj_id) % len(self._locks)
+
+    def _keys(self, obj):
+        return {name: key(obj) for name, key in self._index_keys.items()}
+
+    def _reindex(self, obj_id, old_keys, new_keys):
+        """Move ``obj_id`` between index entries; caller holds _index_lock"""
+        for name in self._indexes:
+            old, new = old_keys.get(name), new_keys.get(name)
+            if old == new:
+                continue
+            index = self._indexes[name]
+            if old is not None:
+                remaining = index.get(old, frozenset()) - {obj_id}
+                if remaining:
+                    index[old] = remaining
+                else:
+                    index.pop(old, None)
+            if new is not None:
+                index[new] = index.get(new, frozenset()) | {obj_id}
+
+    def _check_unique(self, obj_id, new_keys):
+        """Raise ValueError on a duplicate unique key; caller holds _index_lock"""
+        for name in self._unique:
+            value = new_keys.get(name)
+            if value is not None and self._indexes[name].get(value, frozenset()) - {obj_id}:
+                raise ValueError(f"Duplicate {name}: {value}")
+
+    def add(self, obj):
+        stripe = self._stripe(obj.id)
+        new_keys = self._keys(obj)
+        with self._locks[stripe]:
+            with self._index_lock:
+                self._check_unique(obj.id, new_keys)
+                old = self._stripes[stripe].get(obj.id)
+                self._reindex(obj.id, self._keys(old) if old else {}, new_keys)
+            updated = dict(self._stripes[stripe])
+            updated[obj.id] = obj
+            self._stripes[stripe] = updated
+
+    def bulk_load(self, objects):
+        """
+        Add many new objects at once; returns how many were added.
+
+        ``add`` copies a whole bucket per object, which makes loading
+        large datasets quadratic. Here every bucket is copied once and the
+        index entries are built after the objects are sorted into buckets,
+        then merged in a single step. All stripe locks are held meanwhile,
+        so the load is atomic for readers too: if an id is already stored
+        or a unique key is duplicated, ValueError is raised and nothing
+        is added.
+        """
+        objects = list(objects)
+        buckets = [{} for _ in self._locks]
+        for obj in objects:
+            buckets[self._stripe(obj.id)][obj.id] = obj
+        entries = {}
+        for name, key in self._index_keys.items():
+            index = entries[name] = {}
+            for obj in objects:
+                value = key(obj)
+                if value is not None:
+                    index.setdefault(value, []).append(obj.id)
+
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            for stripe, bucket in zip(self._stripes, buckets):
+                for obj_id in bucket:
+                    if obj_id in stripe:
+                        raise ValueError(f"Duplicate id: {obj_id}")
+            if sum(map(len, buckets)) != len(objects):
+                raise ValueError("Duplicate id in the loaded objects")
+            with self._index_lock:
+                for name in self._unique:
+                    for value, ids in entries[name].items():
+                        if len(ids) > 1 or value in self._indexes[name]:
+                            raise ValueError(f"Duplicate {name}: {value}")
+                for name, index in entries.items():
+                    current = self._indexes[name]
+                    for value, ids in index.items():
+                        current[value] = current.get(value, frozenset()).union(ids)
+            for position, bucket in enumerate(buckets):
+                if bucket:
+                    self._stripes[position] = {**self._stripes[position], **bucket}
+        finally:
+            for lock in self._locks:
+                lock.release()
+        return len(objects)
+
+    def get(self, obj_id):
+        return self._stripes[self._stripe(obj_id)].get(obj_id)
+
+    def get_all(self):
+        return [obj for stripe in list(self._stripes) for obj in stripe.values()]
+
+    def update(self, obj_id, data):
+        """
+        Apply ``data`` to the attributes the object already has.
+        Returns the updated object, or None if it does not exist.
+        """
+        stripe = self._stripe(obj_id)
+        with self._locks[stripe]:
+            obj = self._stripes[stripe].get(obj_id)
+            if obj is None:
+                return None
+            changes = {key: value for key, value in data.items()
+                       if hasattr(obj, key) and key not in ('id', 'created_at')}
+            changes['updated_at'] = datetime.now()
+            old_keys = self._keys(obj)
+            # Work out the new index keys on a copy before touching the original
+            preview = copy.copy(obj)
+            preview.__dict__.update(changes)
+            new_keys = self._keys(preview)
+            with self._index_lock:
+                self._check_unique(obj_id, new_keys)
+                self._reindex(obj_id, old_keys, new_keys)
+                obj.__dict__.update(changes)
+            return obj
+
+    def delete(self, obj_id):
+        """Remove an object; returns True if it existed"""
+        stripe = self._stripe(obj_id)
+        with self._locks[stripe]:
+            obj = self._stripes[stripe].get(obj_id)
+            if obj is None:
+                return False
+            with self._index_lock:
+                self._reindex(obj_id, self._keys(obj), {})
+            updated = dict(self._stripes[stripe])
+            del updated[obj_id]
+            self._stripes[stripe] = updated
+            return True
+
+    def find_by_index(self, name, value):
+        """All objects whose index ``name`` currently has key ``value``"""
+        with self._index_lock:
+            ids = self._indexes[name].get(value, frozenset())
+        key = self._index_keys[name]
+        # Re-check the key: the object may have changed since the lookup
+        return [obj for obj in map(self.get, ids)
+                if obj is not None and key(obj) == value]
+
+    def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes:
+            matches = self.find_by_index(attr_name, attr_value)
+            return matches[0] if matches else None
+        return next((obj for obj in self.get_all()
+                    if getattr(obj, attr_name) == attr_value), None)
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in list(self._stripes))
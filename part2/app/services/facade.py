@@ -1,16 +1,19 @@
-from app.persistence.repository import InMemoryRepository
+from app.persistence.repository import ConcurrentInMemoryRepository
 from app.models.user import User
 from app.models.amenities import Amenity
 from app.models.place import Place
 from app.models.reviews import Review
+from app.services.seeding import load_dataset
 
 
 class HBnBFacade:
     def __init__(self):
-        self.user_repo = InMemoryRepository()
-        self.place_repo = InMemoryRepository()
-        self.review_repo = InMemoryRepository()
-        self.amenity_repo = InMemoryRepository()
+        self.user_repo = ConcurrentInMemoryRepository(
+            indexes={'email': None}, unique=('email',))
+        self.place_repo = ConcurrentInMemoryRepository()
+        self.review_repo = ConcurrentInMemoryRepository(
+            indexes={'place_id': lambda review: review.place.id if review.place else None})
+        self.amenity_repo = ConcurrentInMemoryRepository()
 
     def create_user(self, user_data):
         """Create new usr and store in the repo."""
@@ -24,11 +27,7 @@ class HBnBFacade:
 
     def get_user_by_email(self, email):
         """Find usr by email."""
-        users = self.user_repo.get_all()
-        for user in users:
-            if user.email == email:
-                return user
-        return None
+        return self.user_repo.get_by_attribute('email', email)
 
     def get_all_users(self):
         """Retrieve all users."""
@@ -36,11 +35,7 @@ class HBnBFacade:
 
     def update_user(self, user_id, user_data):
         """Update a user's information."""
-        user = self.user_repo.get(user_id)
-        if user:
-            self.user_repo.update(user_id, user_data)
-            return user
-        return None
+        return self.user_repo.update(user_id, user_data)
 
     def create_amenity(self, amenity_data):
         """Create a new amenity and store in the repository."""
@@ -58,11 +53,7 @@ class HBnBFacade:
 
     def update_amenity(self, amenity_id, amenity_data):
         """Update an amenity's information."""
-        amenity = self.amenity_repo.get(amenity_id)
-        if amenity:
-            self.amenity_repo.update(amenity_id, amenity_data)
-            return amenity
-        return None
+        return self.amenity_repo.update(amenity_id, amenity_data)
 
     def create_place(self, place_data):
         """Create a new place and store in the repository."""
@@ -105,12 +96,14 @@ class HBnBFacade:
         place = self.place_repo.get(place_id)
         if not place:
             return None
+        # Collect every change first; the repository applies them at once
+        changes = {}
         # Validate owner  provided
         if 'owner_id' in place_data:
             owner = self.user_repo.get(place_data['owner_id'])
             if not owner:
                 raise ValueError("Owner not found")
-            place.owner = owner
+            changes['owner'] = owner
         # Validate amenities  provided
         if 'amenities' in place_data:
             amenities = []
@@ -119,21 +112,15 @@ class HBnBFacade:
                 if not amenity:
                     raise ValueError(f"Amenity {amenity_id} not found")
                 amenities.append(amenity)
-            place.amenities = amenities
+            changes['amenities'] = amenities
         # Update other fields
         if 'title' in place_data:
-            place.name = place_data['title']  # Map title
-        if 'description' in place_data:
-            place.description = place_data['description']
-        if 'price' in place_data:
-            place.price = place_data['price']
-        if 'latitude' in place_data:
-            place.latitude = place_data['latitude']
-        if 'longitude' in place_data:
-            place.longitude = place_data['longitude']
+            changes['name'] = place_data['title']  # Map title
+        for field in ('description', 'price', 'latitude', 'longitude'):
+            if field in place_data:
+                changes[field] = place_data[field]
         # Update the place in the repository
-        self.place_repo.update(place_id, place_data)
-        return place
+        return self.place_repo.update(place_id, changes)
 
     def create_review(self, review_data):
         """Create a new review and store in the repository."""
@@ -178,55 +165,48 @@ class HBnBFacade:
         if not place:
             raise ValueError("Place not found")
 
-        # Get all reviews and filter by place_id
-        all_reviews = self.review_repo.get_all()
-        place_reviews = []
-        for review in all_reviews:
-            if review.place.id == place_id:
-                place_reviews.append(review)
-        return place_reviews
+        # Reviews are indexed by place id
+        return self.review_repo.find_by_index('place_id', place_id)
 
     def update_review(self, review_id, review_data):
         """Update a review's information."""
         review = self.review_repo.get(review_id)
         if not review:
             return None
+        changes = {}
 
         # Validate user if provided
         if 'user_id' in review_data:
             user = self.user_repo.get(review_data['user_id'])
             if not user:
                 raise ValueError("User not found")
-            review.user = user
+            changes['user'] = user
 
         # Validate place if provided
         if 'place_id' in review_data:
             place = self.place_repo.get(review_data['place_id'])
             if not place:
                 raise ValueError("Place not found")
-            review.place = place
+            changes['place'] = place
 
         # Validat rating if provided
         if 'rating' in review_data:
             rating = review_data['rating']
             if not isinstance(rating, int) or rating < 1 or rating > 5:
                 raise ValueError("Rating must be an integer between 1 and 5")
-            review.rating = rating
+            changes['rating'] = rating
 
         # Update text\commnt if provided
         if 'text' in review_data:
-            review.comment = review_data['text']
-
-        # Save updates the updated_at timestamp
-        review.save()
+            changes['comment'] = review_data['text']
 
-        return review
+        # The repository also updates the updated_at timestamp
+        return self.review_repo.update(review_id, changes)
 
     def delete_review(self, review_id):
         """Delete a review by ID."""
-        review = self.review_repo.get(review_id)
-        if not review:
-            return False
+        return self.review_repo.delete(review_id)
 
-        self.review_repo.delete(review_id)
-        return True
+    def seed_dataset(self, dataset):
+        """Bulk-load a SyntheticDataset into the repositories."""
+        return load_dataset(self, dataset)
@@ -0,0 +1,261 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+from app.models.user import User
+from app.models.place import Place
+from app.models.reviews import Review
+from app.models.amenities import Amenity
+
+
+# Timestamps are spread over the HISTORY_DAYS before EPOCH rather than
+# "now", so that a seed always produces identical rows
+EPOCH = datetime(2025, 1, 1)
+HISTORY_DAYS = 730
+
+# Places cluster around these cities; earlier ones get more places
+CITIES = (
+    ('Paris', 48.8566, 2.3522), ('London', 51.5074, -0.1278),
+    ('New York', 40.7128, -74.0060), ('Tokyo', 35.6762, 139.6503),
+    ('Barcelona', 41.3874, 2.1686), ('Rome', 41.9028, 12.4964),
+    ('Lisbon', 38.7223, -9.1393), ('Berlin', 52.5200, 13.4050),
+    ('Bangkok', 13.7563, 100.5018), ('Mexico City', 19.4326, -99.1332),
+    ('Sydney', -33.8688, 151.2093), ('Cape Town', -33.9249, 18.4241),
+    ('Rio de Janeiro', -22.9068, -43.1729), ('Marrakesh', 31.6295, -7.9811),
+    ('Montreal', 45.5019, -73.5674), ('Reykjavik', 64.1466, -21.9426),
+)
+CITY_SPREAD_DEGREES = 0.08  # standard deviation around the city centre
+
+# Most common first: amenity k is offered by AMENITY_SHARE * AMENITY_DECAY**k of places
+AMENITIES = (
+    'Wi-Fi', 'Kitchen', 'Heating', 'Washer', 'TV', 'Air conditioning', 'Hair dryer',
+    'Iron', 'Workspace', 'Free parking', 'Dryer', 'Elevator', 'Balcony', 'Crib',
+    'Garden', 'Pool', 'Gym', 'Breakfast', 'BBQ grill', 'Fireplace', 'Hot tub',
+    'Pets allowed', 'EV charger', 'Beach access',
+)
+AMENITY_SHARE = 0.9
+AMENITY_DECAY = 0.85
+
+FIRST_NAMES = ('Alice', 'Bruno', 'Chloe', 'David', 'Emma', 'Farid', 'Giulia', 'Hugo',
+               'Ines', 'Jonas', 'Keiko', 'Liam', 'Maya', 'Noah', 'Olga', 'Pedro',
+               'Quinn', 'Rosa', 'Sami', 'Tara', 'Umar', 'Vera', 'Wei', 'Yara', 'Zoe')
+LAST_NAMES = ('Martin', 'Smith', 'Garcia', 'Rossi', 'Muller', 'Silva', 'Kowalski',
+              'Tanaka', 'Dubois', 'Nguyen', 'Haddad', 'Jensen', 'Costa', 'Novak',
+              'Okafor', 'Larsen', 'Moreau', 'Ivanova', 'Schmidt', 'Lopez')
+PLACE_KINDS = ('Studio', 'Loft', 'Apartment', 'Cottage', 'Villa', 'Cabin', 'House', 'Room')
+PLACE_ADJECTIVES = ('Cosy', 'Sunny', 'Quiet', 'Modern', 'Charming', 'Spacious', 'Bright',
+                    'Central', 'Rustic', 'Elegant')
+REVIEW_PHRASES = ('Great location.', 'Very clean.', 'Host was helpful.', 'Would stay again.',
+                  'A bit noisy at night.', 'Smaller than the photos.', 'Lovely view.',
+                  'Easy check-in.', 'Good value for money.', 'Bed was comfortable.')
+
+REVIEW_TEXTS = tuple(f'{first} {second}' for first in REVIEW_PHRASES
+                     for second in REVIEW_PHRASES if first != second)
+
+# Ratings lean positive, as they do on real listings
+RATINGS = (1, 2, 3, 4, 5)
+RATING_WEIGHTS = (4, 6, 15, 35, 40)
+
+
+def _cumulative(weights):
+    total, cumulative = 0.0, []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+class SyntheticDataset:
+    """Deterministic, realistically skewed users, places, amenities and reviews.
+
+    The same seed and sizes always give the same rows, ids included, and
+    every table draws from its own random stream, so the tables can be
+    generated in any order. Rows are produced lazily and one place at a
+    time, so memory does not grow with the size of the dataset. Part 3
+    seeds its database with the same generator, so a seed describes the
+    same dataset in both stores.
+
+    Distributions:
+        * prices are log-normal around ``median_price``;
+        * places cluster around CITIES, busier cities first (Zipf);
+        * hosts are the first ``users // 20`` users, and a few of them own
+          most places (Zipf);
+        * reviews per place follow a power law (Pareto) with mean about
+          ``reviews_per_place``, capped at ``max_reviews_per_place``; a
+          user reviews a place at most once and never their own place.
+    """
+
+    def __init__(self, seed=0, users=1000, places=1000, amenities=len(AMENITIES),
+                 reviews_per_place=4.0, max_reviews_per_place=500, median_price=110.0):
+        """Initialize the dataset.
+
+        Args:
+            seed (int): Seed of every random stream
+            users (int): Number of users (at least 2, so places can be reviewed)
+            places (int): Number of places
+            amenities (int): Number of amenities; names repeat with a suffix
+                beyond the built-in list
+            reviews_per_place (float): Mean number of reviews per place
+            max_reviews_per_place (int): Cap of the review distribution
+            median_price (float): Median nightly price
+
+        Raises:
+            ValueError: If a size is out of range
+        """
+        if users < 2:
+            raise ValueError("At least 2 users are needed")
+        if places < 0 or amenities < 0 or reviews_per_place < 0:
+            raise ValueError("Sizes must not be negative")
+        self.seed = seed
+        self.users_count = users
+        self.places_count = places
+        self.amenities_count = amenities
+        self.reviews_per_place = reviews_per_place
+        self.max_reviews_per_place = min(max_reviews_per_place, users - 1)
+        self.median_price = median_price
+        self._namespace = uuid.uuid5(uuid.NAMESPACE_URL, f'hbnb-seed:{seed}')
+        self._prefixes = {}
+        self._hosts = max(1, users // 20)
+        self._host_weights = _cumulative(1 / (rank + 1) for rank in range(self._hosts))
+        self._city_weights = _cumulative(1 / (rank + 1) for rank in range(len(CITIES)))
+
+    def _random(self, stream):
+        return random.Random(f'{self.seed}:{stream}')
+
+    def _id(self, kind, index):
+        """
+        A UUID-shaped id: a prefix derived from the seed and ``kind``, then
+        ``index`` in hex. Ids of a table increase in insertion order, so
+        the primary key index is appended to rather than split at random.
+        """
+        prefix = self._prefixes.get(kind)
+        if prefix is None:
+            prefix = self._prefixes[kind] = str(uuid.uuid5(self._namespace, kind))[:24]
+        return f'{prefix}{index:012x}'
+
+    def user_id(self, index):
+        return self._id('user', index)
+
+    def place_id(self, index):
+        return self._id('place', index)
+
+    def amenity_id(self, index):
+        return self._id('amenity', index)
+
+    @staticmethod
+    def _timestamp(rng, after=None):
+        """A moment in the history window, after ``after`` when given"""
+        start = after or EPOCH - timedelta(days=HISTORY_DAYS)
+        span = int((EPOCH - start).total_seconds())
+        return start + timedelta(seconds=rng.randrange(max(1, span)))
+
+    def users(self):
+        """Yield user rows (without a password)"""
+        rng = self._random('users')
+        for index in range(self.users_count):
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            created_at = self._timestamp(rng)
+            yield {'id': self.user_id(index), 'first_name': first_name, 'last_name': last_name,
+                   'email': f'{first_name}.{last_name}.{index}@seed.test'.lower(),
+                   'is_admin': False, 'created_at': created_at, 'updated_at': created_at}
+
+    def amenities(self):
+        """Yield amenity rows"""
+        for index in range(self.amenities_count):
+            name = AMENITIES[index % len(AMENITIES)]
+            if index >= len(AMENITIES):
+                name = f'{name} {index // len(AMENITIES) + 1}'
+            yield {'id': self.amenity_id(index), 'name': name,
+                   'created_at': EPOCH, 'updated_at': EPOCH}
+
+    def places(self):
+        """Yield ``(place row, amenity ids, review rows)`` for every place"""
+        rng = self._random('places')
+        amenity_shares = [(self.amenity_id(index),
+                           AMENITY_SHARE * AMENITY_DECAY ** (index % len(AMENITIES)))
+                          for index in range(self.amenities_count)]
+        rating_weights = _cumulative(RATING_WEIGHTS)
+        # Pareto(1.5) - 1 has mean 2
+        review_scale = self.reviews_per_place / 2
+        hosts, users = range(self._hosts), range(self.users_count)
+        review_count = 0
+        for index in range(self.places_count):
+            city, latitude, longitude = rng.choices(CITIES, cum_weights=self._city_weights)[0]
+            owner = rng.choices(hosts, cum_weights=self._host_weights)[0]
+            created_at = self._timestamp(rng)
+            place = {
+                'id': self.place_id(index),
+                'title': f'{rng.choice(PLACE_ADJECTIVES)} {rng.choice(PLACE_KINDS)} in {city}',
+                'description': f'Seeded place {index}',
+                'price': round(min(10000.0, max(10.0, rng.lognormvariate(0, 0.6)
+                                                * self.median_price)), 2),
+                'latitude': round(max(-90.0, min(90.0, rng.gauss(latitude, CITY_SPREAD_DEGREES))), 6),
+                'longitude': round((rng.gauss(longitude, CITY_SPREAD_DEGREES) + 180) % 360 - 180, 6),
+                'owner_id': self.user_id(owner),
+                'created_at': created_at,
+                'updated_at': created_at,
+            }
+            amenity_ids = [amenity_id for amenity_id, share in amenity_shares
+                           if rng.random() < share]
+
+            count = min(self.max_reviews_per_place,
+                        int(review_scale * (rng.paretovariate(1.5) - 1)))
+            reviewers = ([user for user in rng.sample(users, count + 1) if user != owner][:count]
+                         if count else ())
+            reviews = []
+            for user in reviewers:
+                reviewed_at = self._timestamp(rng, after=created_at)
+                reviews.append({
+                    'id': self._id('review', review_count),
+                    'text': rng.choice(REVIEW_TEXTS),
+                    'rating': rng.choices(RATINGS, cum_weights=rating_weights)[0],
+                    'user_id': self.user_id(user),
+                    'place_id': place['id'],
+                    'created_at': reviewed_at,
+                    'updated_at': reviewed_at,
+                })
+                review_count += 1
+            yield place, amenity_ids, reviews
+
+
+def load_dataset(facade, dataset):
+    """Bulk-load a SyntheticDataset into the facade's repositories.
+
+    Objects are built with the model constructors, so the usual field
+    validation applies, and then given the dataset's ids and timestamps.
+    Each repository is filled with one ``bulk_load``, which builds the
+    indexes once instead of once per object.
+
+    Returns:
+        dict: Objects loaded per kind
+    """
+    def restore(obj, row):
+        obj.id = row['id']
+        obj.created_at = row['created_at']
+        obj.updated_at = row['updated_at']
+        return obj
+
+    users = {row['id']: restore(User(row['first_name'], row['last_name'], row['email']), row)
+             for row in dataset.users()}
+    amenities = {row['id']: restore(Amenity(row['name']), row) for row in dataset.amenities()}
+    counts = {'users': facade.user_repo.bulk_load(users.values()),
+              'amenities': facade.amenity_repo.bulk_load(amenities.values())}
+
+    places, reviews, links = [], [], 0
+    for row, amenity_ids, review_rows in dataset.places():
+        owner = users[row['owner_id']]
+        place = restore(Place(name=row['title'], description=row['description'],
+                              price=row['price'], latitude=row['latitude'],
+                              longitude=row['longitude'], owner=owner), row)
+        for amenity_id in amenity_ids:
+            place.add_amenity(amenities[amenity_id])
+        links += len(amenity_ids)
+        places.append(place)
+        reviews.extend(
+            restore(Review(user=users[review['user_id']], place=place,
+                           rating=review['rating'], comment=review['text']), review)
+            for review in review_rows)
+    counts['places'] = facade.place_repo.bulk_load(places)
+    counts['place_amenities'] = links
+    counts['reviews'] = facade.review_repo.bulk_load(reviews)
+    return counts
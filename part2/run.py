@@ -1,6 +1,28 @@
+import argparse
+import time
+
 from app import create_app
+from app.services import facade
 
 app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5001)
+    parser = argparse.ArgumentParser(description='Run the HBnB API')
+    parser.add_argument('--seed-places', type=int, default=0,
+                        help='start with this many synthetic places (default: none)')
+    parser.add_argument('--seed-users', type=int,
+                        help='synthetic users (default: a tenth of the places)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed of the synthetic data (default: 0)')
+    args = parser.parse_args()
+
+    if args.seed_places:
+        from app.services.seeding import SyntheticDataset
+
+        start = time.perf_counter()
+        counts = facade.seed_dataset(SyntheticDataset(
+            seed=args.seed, users=args.seed_users or max(2, args.seed_places // 10),
+            places=args.seed_places))
+        print(f"Seeded {counts} in {time.perf_counter() - start:.1f}s")
+    # The reloader would start a second process that has to seed again
+    app.run(debug=True, port=5001, use_reloader=not args.seed_places)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Thread-safety test for ConcurrentInMemoryRepository
+Tests concurrent add/delete, unique email races and mixed reads/writes.
+Run directly for an ops/sec report against InMemoryRepository.
+"""
+
+from app.persistence.repository import (ConcurrentInMemoryRepository,
+                                        InMemoryRepository)
+from app.models.user import User
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_threads(count, target):
+    """Start ``count`` threads on ``target(index)`` and wait for them"""
+    errors = []
+    barrier = threading.Barrier(count)
+
+    def worker(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,))
+               for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def make_repo():
+    return ConcurrentInMemoryRepository(indexes={'email': None},
+                                        unique=('email',))
+
+
+def make_user(email):
+    return User(first_name="Test", last_name="User", email=email)
+
+
+def test_concurrent_add_delete():
+    """Concurrent adds and deletes keep length and index consistent"""
+    print("🧵 Testing concurrent add/delete...")
+    repo = make_repo()
+
+    def target(index):
+        users = [make_user(f"user{index}-{i}@example.com")
+                 for i in range(200)]
+        for user in users:
+            repo.add(user)
+        # Delete every other user this thread added
+        for user in users[::2]:
+            assert repo.delete(user.id)
+
+    errors = run_threads(8, target)
+    assert not errors, errors
+    assert len(repo) == 8 * 100
+    assert len(repo.get_all()) == 8 * 100
+    for user in repo.get_all():
+        assert repo.get_by_attribute('email', user.email) is user
+    assert repo.get_by_attribute('email', "user0-0@example.com") is None
+    print("✅ Concurrent add/delete test passed")
+
+
+def test_unique_email_race():
+    """Exactly one of many simultaneous registrations of an email wins"""
+    print("🧵 Testing unique email race...")
+    repo = make_repo()
+    winners = []
+
+    def target(index):
+        try:
+            repo.add(make_user("race@example.com"))
+            winners.append(index)
+        except ValueError:
+            pass
+
+    errors = run_threads(16, target)
+    assert not errors, errors
+    assert len(winners) == 1
+    assert len(repo) == 1
+
+    # Changing an email to one that is taken is rejected too
+    other = make_user("other@example.com")
+    repo.add(other)
+    try:
+        repo.update(other.id, {'email': "race@example.com"})
+        assert False, "Duplicate email update should fail"
+    except ValueError:
+        pass
+    assert other.email == "other@example.com"
+    print("✅ Unique email race test passed")
+
+
+def test_mixed_reads_and_writes():
+    """Readers never fail while writers update indexed attributes"""
+    print("🧵 Testing mixed reads and writes...")
+    repo = make_repo()
+    users = [make_user(f"mixed{i}@example.com") for i in range(50)]
+    for user in users:
+        repo.add(user)
+
+    def target(index):
+        for i in range(500):
+            user = users[(index * 7 + i) % len(users)]
+            if index % 2:
+                # Writer: rename the email, then restore it
+                original = f"mixed{users.index(user)}@example.com"
+                repo.update(user.id, {'email': f"t{index}-{i}@example.com"})
+                repo.update(user.id, {'email': original})
+            else:
+                # Reader: lookups must return the object or nothing
+                found = repo.get(user.id)
+                assert found is user
+                match = repo.get_by_attribute('email', found.email)
+                assert match is None or match is user
+                repo.get_all()
+
+    errors = run_threads(8, target)
+    assert not errors, errors
+    assert len(repo) == len(users)
+    for i, user in enumerate(users):
+        assert user.email == f"mixed{i}@example.com"
+        assert repo.get_by_attribute('email', user.email) is user
+    print("✅ Mixed reads and writes test passed")
+
+
+def stress(repo, threads, duration=1.0):
+    """Run a 90% read / 10% write mix on ``repo``; returns ops per second"""
+    users = [make_user(f"stress{i}@example.com") for i in range(1000)]
+    for user in users:
+        repo.add(user)
+    counts = [0] * threads
+    stop = time.perf_counter() + duration
+
+    def target(index):
+        i = index
+        while time.perf_counter() < stop:
+            user = users[i % len(users)]
+            if i % 10 == 0:
+                repo.update(user.id, {'last_name': f"L{i}"})
+            else:
+                repo.get(user.id)
+            i += threads
+            counts[index] += 1
+
+    run_threads(threads, target)
+    return sum(counts) / duration
+
+
+if __name__ == "__main__":
+    test_concurrent_add_delete()
+    test_unique_email_race()
+    test_mixed_reads_and_writes()
+
+    print("\n📊 Throughput (90% get / 10% update, ops/sec)")
+    print(f"{'threads':>7} {'striped':>12} {'plain':>12}")
+    for threads in (1, 2, 4, 8, 16):
+        striped = stress(ConcurrentInMemoryRepository(), threads)
+        plain = stress(InMemoryRepository(), threads)
+        print(f"{threads:>7} {striped:>12,.0f} {plain:>12,.0f}")
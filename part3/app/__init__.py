@@ -1,35 +1,131 @@
 from flask import Flask
-from flask_restx import Api
 from flask_bcrypt import Bcrypt
-from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 
+from app.utils.jwt_cache import CachingJWTManager
+
 db = SQLAlchemy()
 bcrypt = Bcrypt()
-jwt = JWTManager()
+jwt = CachingJWTManager()
+
 
+def create_app(config_class="config.DevelopmentConfig", with_api=True):
+    """Create the application.
 
-def create_app(config_class="config.DevelopmentConfig"):
+    Command line tools that never serve HTTP pass ``with_api=False`` to
+    skip importing the API namespaces and the response hooks.
+    """
     app = Flask(__name__)
     app.config.from_object(config_class)
     
     # Initialize SQLAlchemy
     db.init_app(app)
     
-    # Initialize Bcrypt
+    # Initialize Bcrypt and the process pool that runs it
     bcrypt.init_app(app)
+    from app.utils import password_hashing
+    password_hashing.init_app(app)
     
-    # Initialize JWT
+    # Initialize JWT (verified tokens are cached until they expire)
     jwt.init_app(app)
+    from app.utils import jwt_keys
+    jwt_keys.init_app(app, jwt)
 
     # Import models to ensure they are registered with SQLAlchemy
     from app.models.user import User
     from app.models.place import Place
     from app.models.reviews import Review
     from app.models.amenities import Amenity
-    
+    from app.models.refresh_token import RefreshToken
+    from app.models.revoked_token import RevokedToken
+    from app.models.job import Job
+
+    # Denylist of revoked access tokens, checked in memory
+    from app.services import revocation
+    revocation.init_app(app, jwt)
+
+    # Background job queue for deferred work
+    from app.services import jobs
+    jobs.init_app(app)
+
+    if with_api:
+        _register_http(app)
+
+    return app
+
+
+def _register_http(app):
+    """Register the API and the HTTP request/response hooks."""
+    # Latency, status and in-flight metrics: first, so shed requests count too
+    from app.utils import metrics
+    metrics.init_app(app)
+
+    # Load shedding: runs before any other request work
+    from app.utils import admission
+    admission.init_app(app)
+
     # Register API blueprint
     from app.api.v1 import blueprint as api_v1
     app.register_blueprint(api_v1)
 
-    return app
+    # Thread pool running the reads of POST /api/v1/batch concurrently
+    from app.utils import batch
+    batch.init_app(app)
+
+    # swagger.json from a precomputed document instead of flask_restx's view
+    from app.utils import api_spec
+    api_spec.init_app(app)
+
+    # Response post-processing: timings first so it runs after compression
+    from app.utils import timing, compression
+    timing.init_app(app)
+    compression.init_app(app)
+
+    # Query count, database time and N+1 warnings per request
+    from app.utils import query_stats
+    query_stats.init_app(app)
+
+    # cProfile of single requests on demand (admins) or sampled
+    from app.utils import profiling
+    profiling.init_app(app)
+
+    # Optional static frontend with precompressed assets
+    from app import frontend
+    frontend.init_app(app)
+
+    # Readiness check for the process manager / load balancer
+    from app import health
+    health.init_app(app)
+
+
+def warm_up(app):
+    """Do the one-off work that is otherwise deferred to the first requests.
+
+    Mapper configuration and the Swagger spec (also used to validate
+    payloads) are built lazily so that create_app() stays fast for tests
+    and command line tools. A prebuilt swagger.json is validated against
+    the live models here. A preloading server calls this once in the
+    parent, so forked workers start with them ready.
+    """
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
+    if 'api' in app.blueprints:
+        from app.api.v1 import api
+        from app.utils.api_spec import validate_spec
+        # Loads or builds the served spec and checks it against the live models
+        validate_spec(app)
+        with app.test_request_context():
+            api.refresolver
+
+
+def reset_after_fork(app):
+    """Make state inherited from a preloading parent safe in a forked worker.
+
+    Pooled database connections are left for the parent to close
+    (``close=False``) so no two processes ever share a socket or SQLite
+    handle, and the bcrypt process pool is recreated on first use.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    app.extensions['password_hasher'].after_fork()
@@ -1,11 +1,16 @@
 from flask_restx import Api
 from flask import Blueprint
 
+from app.utils.password_hashing import PasswordHasherBusy
+
 from .user import api as user_ns
 from .amenities import api as amenity_ns
 from .places import api as place_ns
 from .reviews import api as review_ns
 from .auth import api as auth_ns
+from .batch import api as batch_ns
+from .bulk_import import api as import_ns
+from .admin import api as admin_ns
 
 blueprint = Blueprint('api', __name__, url_prefix='/api/v1')
 api = Api(blueprint, version='1.0', title='HBnB API',
@@ -17,3 +22,13 @@ api.add_namespace(amenity_ns, path='/amenities')
 api.add_namespace(place_ns, path='/places')
 api.add_namespace(review_ns, path='/reviews')
 api.add_namespace(auth_ns, path='/auth')
+api.add_namespace(batch_ns, path='/batch')
+api.add_namespace(import_ns, path='/import')
+api.add_namespace(admin_ns, path='/admin')
+
+
+@api.errorhandler(PasswordHasherBusy)
+def handle_password_hasher_busy(error):
+    """Shed load with 503 when password hashing is saturated outside the
+    endpoints that handle it themselves"""
+    return {'error': str(error)}, 503, {'Retry-After': str(error.retry_after)}
@@ -0,0 +1,159 @@
+from flask_restx import Namespace, Resource
+from flask import Response, current_app, request, send_file, stream_with_context
+from flask_jwt_extended import jwt_required
+from app.services import facade
+from app.services.export import EXPORT_TABLES, gzip_stream
+from app.utils.admission import get_admission_controller
+from app.utils.profiling import list_profiles, load_profile, profile_path
+from app.utils.rbac import admin_required
+from app.utils.streaming import NDJSON_MIMETYPE, coalesce_chunks, stream_chunk_size
+
+api = Namespace('admin', description='Administrative operations')
+
+EXPORT_MIMETYPES = {'ndjson': NDJSON_MIMETYPE, 'csv': 'text/csv'}
+
+
+@api.route('/export')
+class DatasetExport(Resource):
+    @api.doc(params={
+        'format': 'ndjson (default) or csv',
+        'table': 'Table to export; repeat for several. CSV takes exactly one. '
+                 f'One of: {", ".join(EXPORT_TABLES)}',
+        'compress': 'gzip to download a .gz file'
+    })
+    @api.response(200, 'Export streamed')
+    @api.response(400, 'Invalid format or table')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def get(self):
+        """Stream a consistent snapshot of the dataset (Admin only)
+
+        Password hashes are never exported. Multi-table NDJSON lines are
+        wrapped as {"table": ..., "data": {...}}.
+        """
+        fmt = request.args.get('format', 'ndjson')
+        tables = request.args.getlist('table')
+        compress = request.args.get('compress')
+        if compress not in (None, 'gzip'):
+            return {'error': 'compress must be gzip'}, 400
+
+        try:
+            chunks = facade.export_dataset(
+                fmt, tables, chunk_size=stream_chunk_size())
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        name = '-'.join(tables) if tables else 'hbnb'
+        filename = f'{name}.{fmt}'
+        body = coalesce_chunks(chunks)
+        if compress:
+            body = gzip_stream(body)
+            mimetype = 'application/gzip'
+            filename += '.gz'
+        else:
+            mimetype = EXPORT_MIMETYPES[fmt]
+
+        return Response(stream_with_context(body), mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename="{filename}"'
+        })
+
+
+@api.route('/statistics')
+class Statistics(Resource):
+    @api.response(200, 'Latest statistics snapshot')
+    @api.response(202, 'Statistics are being computed, retry shortly')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def get(self):
+        """Dashboard statistics, computed in the background (Admin only)
+
+        A snapshot older than STATISTICS_MAX_AGE is returned as-is while a
+        refresh is queued.
+        """
+        statistics, computed_at = facade.get_statistics(
+            current_app.config.get('STATISTICS_MAX_AGE', 60))
+        if statistics is None:
+            return {'status': 'pending'}, 202, {'Retry-After': '1'}
+        return {'computed_at': computed_at.isoformat(), **statistics}, 200
+
+
+@api.route('/jobs')
+class JobQueue(Resource):
+    @api.response(200, 'Background job queue state')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def get(self):
+        """Queue depth, lag and per-task counters of the job queue (Admin only)
+
+        Counters (enqueued/completed/retried/failed, wait and run times)
+        cover the process that answers the request.
+        """
+        return facade.get_job_statistics(), 200
+
+
+@api.route('/admission')
+class Admission(Resource):
+    @api.response(200, 'Admission control state')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def get(self):
+        """Concurrency, queue depth and rejections per route class (Admin only)
+
+        Limits and counters are per process; the rate limiter reports the
+        clients it tracks and how many requests it turned away.
+        """
+        controller = get_admission_controller()
+        if controller is None:
+            return {'enabled': False}, 200
+        return {'enabled': True, **controller.stats()}, 200
+
+
+@api.route('/profiles')
+class ProfileList(Resource):
+    @api.response(200, 'Stored request profiles')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def get(self):
+        """Profiles of single requests, newest first (Admin only)
+
+        With PROFILING_ENABLED, send ``X-Profile: 1`` (or ``?_profile=1``)
+        on any request as an admin; its response carries X-Profile-Id.
+        """
+        return {'enabled': current_app.config.get('PROFILING_ENABLED', False),
+                'profiles': list_profiles()}, 200
+
+
+@api.route('/profiles/<string:profile_id>')
+class Profile(Resource):
+    @api.response(200, 'Profile summary with the SQL it ran')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @api.response(404, 'Profile not found')
+    @jwt_required()
+    @admin_required
+    def get(self, profile_id):
+        """Request details, captured SQL and the slowest functions (Admin only)"""
+        profile = load_profile(profile_id)
+        if profile is None:
+            return {'error': 'Profile not found'}, 404
+        return profile, 200
+
+
+@api.route('/profiles/<string:profile_id>/download')
+class ProfileDownload(Resource):
+    @api.response(200, 'cProfile data (pstats format)')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @api.response(404, 'Profile not found')
+    @jwt_required()
+    @admin_required
+    def get(self, profile_id):
+        """Download the raw profile for pstats, snakeviz and the like (Admin only)"""
+        path = profile_path(profile_id, '.prof')
+        if path is None:
+            return {'error': 'Profile not found'}, 404
+        return send_file(path, mimetype='application/octet-stream', as_attachment=True,
+                         download_name=f'{profile_id}.prof')
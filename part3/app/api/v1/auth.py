@@ -1,6 +1,9 @@
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask import current_app
+from datetime import datetime
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
+from app.utils.password_hashing import PasswordHasherBusy
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -10,25 +13,82 @@ login_model = api.model('Login', {
     'password': fields.String(required=True, description='User password')
 })
 
+refresh_model = api.model('Refresh', {
+    'refresh_token': fields.String(required=True, description='Refresh token from login or a previous refresh')
+})
+
+logout_model = api.model('Logout', {
+    'refresh_token': fields.String(description='Refresh token to revoke along with the access token')
+})
+
+
+def issue_tokens(user, refresh_token=None):
+    """Access token for a user, paired with a new or rotated refresh token."""
+    if refresh_token is None:
+        refresh_token = facade.issue_refresh_token(
+            user.id, current_app.config['JWT_REFRESH_TOKEN_EXPIRES'])
+    access_token = create_access_token(identity={'id': str(user.id), 'is_admin': user.is_admin})
+    return {'access_token': access_token, 'refresh_token': refresh_token}
+
+
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model)
+    @api.response(503, 'Too many concurrent logins, retry later')
     def post(self):
-        """Authenticate user and return a JWT token"""
+        """Authenticate user and return a JWT access token and a refresh token"""
         credentials = api.payload  # Get the email and password from the request payload
         
         # Step 1: Retrieve the user based on the provided email
         user = facade.get_user_by_email(credentials['email'])
         
         # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
-            return {'error': 'Invalid credentials'}, 401
+        try:
+            if not user or not user.verify_password(credentials['password']):
+                return {'error': 'Invalid credentials'}, 401
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': str(e.retry_after)}
 
-        # Step 3: Create a JWT token with the user's id and is_admin flag
-        access_token = create_access_token(identity={'id': str(user.id), 'is_admin': user.is_admin})
-        
-        # Step 4: Return the JWT token to the client
-        return {'access_token': access_token}, 200
+        # Step 3: Create a JWT token with the user's id and is_admin flag,
+        # plus a refresh token so the password is not needed again
+        return issue_tokens(user), 200
+
+
+@api.route('/refresh')
+class Refresh(Resource):
+    @api.expect(refresh_model, validate=True)
+    @api.response(200, 'New access and refresh tokens issued')
+    @api.response(401, 'Invalid, expired or reused refresh token')
+    def post(self):
+        """Exchange a refresh token for a new access token (no password check)
+
+        The refresh token is rotated: the one presented stops working, and
+        presenting it again revokes every token issued since that login.
+        """
+        try:
+            user, refresh_token = facade.rotate_refresh_token(
+                api.payload['refresh_token'], current_app.config['JWT_REFRESH_TOKEN_EXPIRES'])
+        except ValueError as e:
+            return {'error': str(e)}, 401
+        return issue_tokens(user, refresh_token), 200
+
+
+@api.route('/logout')
+class Logout(Resource):
+    @jwt_required()
+    @api.expect(logout_model)
+    @api.response(200, 'Access token (and refresh token, if given) revoked')
+    def post(self):
+        """Revoke the current access token, and optionally its refresh token"""
+        claims = get_jwt()
+        expires_at = datetime.utcfromtimestamp(claims['exp']) if 'exp' in claims \
+            else datetime.utcnow() + current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+        facade.revoke_access_token(claims['jti'], expires_at)
+
+        refresh_token = (api.payload or {}).get('refresh_token')
+        if refresh_token:
+            facade.revoke_refresh_token(refresh_token)
+        return {'message': 'Logged out'}, 200
 
 
 @api.route('/protected')
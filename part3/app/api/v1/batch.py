@@ -0,0 +1,50 @@
+from flask_restx import Namespace, Resource, fields
+from flask import current_app
+from flask_jwt_extended import jwt_required
+from app.utils.batch import execute_batch
+
+api = Namespace('batch', description='Batch request operations')
+
+# Define the sub-request model for input validation and documentation
+sub_request_model = api.model('BatchSubRequest', {
+    'method': fields.String(required=True, description='HTTP method',
+                            enum=['GET', 'POST', 'PUT', 'PATCH', 'DELETE']),
+    'path': fields.String(required=True,
+                          description='Path relative to /api/v1, e.g. /places/<place_id>'),
+    'body': fields.Raw(description='JSON body for POST, PUT and PATCH')
+})
+
+batch_model = api.model('Batch', {
+    'requests': fields.List(fields.Nested(sub_request_model), required=True,
+                            description='Sub-requests, executed in order'),
+    'parallel': fields.Boolean(default=True,
+                               description='Run consecutive GET sub-requests concurrently')
+})
+
+
+@api.route('/')
+class Batch(Resource):
+    @api.expect(batch_model, validate=True)
+    @api.response(200, 'Sub-requests executed; see each item for its own status')
+    @api.response(400, 'Invalid batch')
+    @jwt_required(optional=True)
+    def post(self):
+        """Execute several API calls in one round trip
+
+        Sub-requests run in-process. Each one carries the caller's
+        Authorization header and is authorized on its own, so a revoked
+        token fails every item; repeat decodes hit the verified-token cache.
+        Writes and single reads share the batch's database session, while
+        each concurrent GET runs with a session of its own.
+        """
+        data = api.payload
+        sub_requests = data.get('requests') or []
+        if not sub_requests:
+            return {'error': 'At least one sub-request is required'}, 400
+
+        max_requests = current_app.config.get('BATCH_MAX_REQUESTS', 20)
+        if len(sub_requests) > max_requests:
+            return {'error': f'A batch may contain at most {max_requests} requests'}, 400
+
+        results = execute_batch(sub_requests, parallel=data.get('parallel', True))
+        return {'responses': results}, 200
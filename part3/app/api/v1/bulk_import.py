@@ -0,0 +1,34 @@
+from flask_restx import Namespace, Resource
+from flask import current_app, request
+from flask_jwt_extended import jwt_required
+from app.services import facade
+from app.utils.rbac import admin_required, get_current_user_info
+
+api = Namespace('import', description='Bulk import operations')
+
+
+@api.route('/<kind>')
+@api.param('kind', 'What to import: places, reviews or amenities')
+class BulkImport(Resource):
+    @api.doc(consumes=['application/x-ndjson'])
+    @api.response(200, 'Import finished; see the report for per-line errors')
+    @api.response(400, 'Unsupported kind')
+    @api.response(403, 'Forbidden - Admin privileges required')
+    @jwt_required()
+    @admin_required
+    def post(self, kind):
+        """Import newline-delimited JSON objects, one entity per line (Admin only)
+
+        Places without owner_id are owned by the importing administrator.
+        """
+        if kind not in ('places', 'reviews', 'amenities'):
+            return {'error': f'Unsupported import kind: {kind}'}, 400
+
+        user_info = get_current_user_info()
+        report = facade.bulk_import(
+            kind,
+            request.stream,
+            batch_size=current_app.config.get('IMPORT_BATCH_SIZE', 1000),
+            default_owner_id=user_info['user_id']
+        )
+        return report, 200
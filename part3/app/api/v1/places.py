@@ -2,7 +2,10 @@ from flask_restx import Namespace, Resource, fields
 from flask import request
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
-from app.utils.rbac import check_admin_or_owner, get_current_user_info
+from app.utils.rbac import check_resource_access, get_current_user_info
+from app.utils.streaming import requested_stream_format, stream_collection, stream_chunk_size
+from app.utils.concurrency import requested_version, version_conflict, version_etag
+from app.persistence.repository import VersionConflictError
 
 api = Namespace('places', description='Place operations')
 
@@ -57,17 +60,22 @@ place_update_model = api.model('PlaceUpdate', {
 })
 
 
-def serialize_place(place):
-    """Serialize a place object to a dictionary for JSON response."""
+def serialize_place(place, reviews=None):
+    """Serialize a place object to a dictionary for JSON response.
+
+    ``reviews`` may be passed in by callers that have already loaded them
+    (the ASGI app cannot lazy-load); otherwise they are fetched here.
+    """
     # Get reviews for this place
     try:
-        reviews = facade.get_reviews_by_place(place.id)
+        if reviews is None:
+            reviews = facade.get_reviews_by_place(place.id)
         reviews_data = [
             {
                 'id': review.id,
                 'text': review.text,
                 'rating': review.rating,
-                'user_id': review.user.id
+                'user_id': review.user_id
             }
             for review in reviews
         ]
@@ -175,8 +183,14 @@ class PlaceList(Resource):
             return {'error': str(e)}, 500
 
     @api.response(200, 'List of places retrieved successfully')
+    @api.doc(params={'stream': 'Stream the list incrementally (json or ndjson)'})
     def get(self):
         """Retrieve a list of all places"""
+        stream_format = requested_stream_format()
+        if stream_format:
+            places = facade.iter_all_places(stream_chunk_size())
+            return stream_collection(places, serialize_place, stream_format)
+
         try:
             places = facade.get_all_places()
             return [serialize_place(place) for place in places], 200
@@ -195,15 +209,17 @@ class PlaceResource(Resource):
             if not place:
                 return {'error': 'Place not found'}, 404
 
-            return serialize_place(place), 200
+            return serialize_place(place), 200, version_etag(place)
         except Exception as e:
             return {'error': str(e)}, 500
 
     @api.expect(place_update_model)
+    @api.doc(params={'If-Match': {'in': 'header', 'description': 'ETag of the version being updated'}})
     @api.response(200, 'Place updated successfully')
     @api.response(404, 'Place not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Forbidden - Unauthorized action')
+    @api.response(409, 'Place was modified by another request')
     @jwt_required()
     def put(self, place_id):
         """Update a place's information - Admin bypass ownership restrictions"""
@@ -220,13 +236,14 @@ class PlaceResource(Resource):
             return {'error': 'No data provided for update'}, 400
 
         try:
-            # Check the place exists
-            place = facade.get_place(place_id)
-            if not place:
+            # Check the place exists and who owns it, without loading it
+            owner_id, is_authorized, _ = check_resource_access(
+                'place', place_id, facade.get_place_owner_id)
+            if owner_id is None:
                 return {'error': 'Place not found'}, 404
                 
             # Admin bypass ownership restrictions - exact implementation as specified
-            if not is_admin and place.owner.id != user_id:
+            if not is_authorized:
                 return {'error': 'Unauthorized action'}, 403
 
             # Logic to update the place - comprehensive validation
@@ -268,8 +285,13 @@ class PlaceResource(Resource):
                 if not isinstance(place_data['amenities'], list):
                     return {'error': 'Amenities must be a list'}, 400
 
+            try:
+                expected_version = requested_version()
+            except ValueError as e:
+                return {'error': str(e)}, 400
+
             # Update the place using facade
-            updated_place = facade.update_place(place_id, place_data)
+            updated_place = facade.update_place(place_id, place_data, expected_version)
 
             if not updated_place:
                 return {'error': 'Failed to update place'}, 400
@@ -278,14 +300,16 @@ class PlaceResource(Resource):
             response_data = serialize_place(updated_place)
             
             # Add admin modification tracking if admin performed the update
-            if is_admin and place.owner.id != user_id:
+            if is_admin and owner_id != user_id:
                 response_data['message'] = 'Place successfully modified by administrator'
                 response_data['modified_by_admin'] = True
             else:
                 response_data['message'] = 'Place successfully updated'
 
-            return response_data, 200
+            return response_data, 200, version_etag(updated_place)
 
+        except VersionConflictError as e:
+            return version_conflict('Place', e)
         except ValueError as ve:
             return {'error': f'Invalid data: {str(ve)}'}, 400
         except Exception as e:
@@ -303,13 +327,13 @@ class PlaceResource(Resource):
         is_admin = user_info['is_admin']
         
         try:
-            # Check if the place exists
-            existing_place = facade.get_place(place_id)
-            if not existing_place:
+            # Check existence and ownership from the owner_id column only
+            owner_id, is_authorized, admin_status = check_resource_access(
+                'place', place_id, facade.get_place_owner_id)
+            if owner_id is None:
                 return {'error': 'Place not found'}, 404
             
             # Enhanced authorization check using RBAC
-            is_authorized, current_user, admin_status = check_admin_or_owner(existing_place.owner.id)
             if not is_authorized:
                 return {'error': 'Unauthorized action.'}, 403
             
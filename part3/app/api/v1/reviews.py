@@ -2,7 +2,10 @@ from flask_restx import Namespace, Resource, fields
 from flask import request
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
-from app.utils.rbac import check_admin_or_owner, get_current_user_info
+from app.utils.rbac import check_resource_access, get_current_user_info
+from app.utils.streaming import requested_stream_format, stream_collection, stream_chunk_size
+from app.utils.concurrency import requested_version, version_conflict, version_etag
+from app.persistence.repository import VersionConflictError
 
 api = Namespace('reviews', description='Review operations')
 
@@ -24,6 +27,39 @@ review_update_model = api.model('ReviewUpdate', {
 })
 
 
+def serialize_review(review):
+    """Serialize a review object to a dictionary for list responses.
+
+    Uses the foreign key columns directly so that listing reviews does not
+    lazily load the related user and place rows.
+    """
+    return {
+        'id': review.id,
+        'text': review.text,
+        'rating': review.rating,
+        'user_id': review.user_id,
+        'place_id': review.place_id,
+        'created_at': review.created_at.isoformat(),
+        'updated_at': review.updated_at.isoformat()
+    }
+
+
+def new_review_error(current_user_id, place_owner_id, already_reviewed):
+    """Checks on a new review shared by the WSGI and ASGI endpoints.
+
+    Returns:
+        tuple: (error body, status) or None if the review may be created
+    """
+    if place_owner_id is None:
+        return {'error': 'Place not found'}, 404
+    # Users cannot review their own places
+    if place_owner_id == current_user_id:
+        return {'error': 'You cannot review your own place.'}, 400
+    if already_reviewed:
+        return {'error': 'You have already reviewed this place.'}, 400
+    return None
+
+
 @api.route('/')
 class ReviewList(Resource):
     @api.expect(review_model)
@@ -40,52 +76,34 @@ class ReviewList(Resource):
         if review_data.get('user_id') != current_user['id']:
             return {'error': 'Cannot create review for another user'}, 403
         
-        # Check if the place exists and get place details
-        place = facade.get_place(review_data.get('place_id'))
-        if not place:
-            return {'error': 'Place not found'}, 404
-            
-        # Users cannot review their own places
-        if place.owner.id == current_user['id']:
-            return {'error': 'You cannot review your own place.'}, 400
-            
-        # Check if user has already reviewed this place
-        existing_reviews = facade.get_reviews_by_place(review_data.get('place_id'))
-        for review in existing_reviews:
-            if review.user.id == current_user['id']:
-                return {'error': 'You have already reviewed this place.'}, 400
+        # Check the place exists without loading it
+        place_owner_id = facade.get_place_owner_id(review_data.get('place_id'))
+        error = new_review_error(
+            current_user['id'], place_owner_id,
+            place_owner_id is not None and place_owner_id != current_user['id']
+            and facade.user_has_reviewed(current_user['id'], review_data.get('place_id')))
+        if error:
+            return error
 
         try:
             new_review = facade.create_review(review_data)
-            return {
-                'id': new_review.id,
-                'text': new_review.text,
-                'rating': new_review.rating,
-                'user_id': new_review.user.id,
-                'place_id': new_review.place.id,
-                'created_at': new_review.created_at.isoformat(),
-                'updated_at': new_review.updated_at.isoformat()
-            }, 201
+            return serialize_review(new_review), 201
         except ValueError as e:
             return {'error': str(e)}, 400
         except Exception as e:
             return {'error': 'An unexpected error occurred'}, 400
 
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.doc(params={'stream': 'Stream the list incrementally (json or ndjson)'})
     def get(self):
         """Retrieve a list of all reviews"""
+        stream_format = requested_stream_format()
+        if stream_format:
+            reviews = facade.iter_all_reviews(stream_chunk_size())
+            return stream_collection(reviews, serialize_review, stream_format)
+
         reviews = facade.get_all_reviews()
-        return [
-            {
-                'id': review.id,
-                'text': review.text,
-                'rating': review.rating,
-                'user_id': review.user.id,
-                'place_id': review.place.id,
-                'created_at': review.created_at.isoformat(),
-                'updated_at': review.updated_at.isoformat()
-            } for review in reviews
-        ], 200
+        return [serialize_review(review) for review in reviews], 200
 
 
 @api.route('/<review_id>')
@@ -106,13 +124,15 @@ class ReviewResource(Resource):
             'place_id': review.place.id,
             'created_at': review.created_at.isoformat(),
             'updated_at': review.updated_at.isoformat()
-        }, 200
+        }, 200, version_etag(review)
 
     @api.expect(review_update_model, validate=True)
+    @api.doc(params={'If-Match': {'in': 'header', 'description': 'ETag of the version being updated'}})
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Forbidden - Unauthorized action')
+    @api.response(409, 'Review was modified by another request')
     @jwt_required()
     def put(self, review_id):
         """Update a review's information - Admin bypass ownership restrictions"""
@@ -128,49 +148,48 @@ class ReviewResource(Resource):
         if not review_data:
             return {'error': 'No data provided'}, 400
 
-        # Get the existing review to check ownership
-        review = facade.get_review(review_id)
-        if not review:
+        # Check the review exists and who wrote it, without loading it
+        author_id, is_authorized, _ = check_resource_access(
+            'review', review_id, facade.get_review_author_id)
+        if author_id is None:
             return {'error': 'Review not found'}, 404
             
         # Admin bypass ownership restrictions - exact implementation as specified
-        if not is_admin and review.user.id != user_id:
+        if not is_authorized:
             return {'error': 'Unauthorized action'}, 403
 
         try:
             # Logic to update the review - comprehensive validation
             
             # Prevent changing user_id and place_id in updates
-            if 'user_id' in review_data and review_data['user_id'] != review.user.id:
+            if 'user_id' in review_data and review_data['user_id'] != author_id:
                 return {'error': 'Cannot change review ownership'}, 403
-            if 'place_id' in review_data and review_data['place_id'] != review.place.id:
-                return {'error': 'Cannot change review place'}, 403
+            if 'place_id' in review_data:
+                review = facade.get_review(review_id)
+                if review_data['place_id'] != review.place_id:
+                    return {'error': 'Cannot change review place'}, 403
             
+            expected_version = requested_version()
+
             # Update the review using facade
-            updated_review = facade.update_review(review_id, review_data)
+            updated_review = facade.update_review(review_id, review_data, expected_version)
 
             if not updated_review:
                 return {'error': 'Failed to update review'}, 400
 
             # Prepare response with admin bypass tracking
-            response_data = {
-                'id': updated_review.id,
-                'text': updated_review.text,
-                'rating': updated_review.rating,
-                'user_id': updated_review.user.id,
-                'place_id': updated_review.place.id,
-                'created_at': updated_review.created_at.isoformat(),
-                'updated_at': updated_review.updated_at.isoformat()
-            }
+            response_data = serialize_review(updated_review)
 
             # Add admin modification tracking if admin performed the update
-            if is_admin and review.user.id != user_id:
+            if is_admin and author_id != user_id:
                 response_data['message'] = 'Review successfully modified by administrator'
                 response_data['updated_by_admin'] = True
             else:
                 response_data['message'] = 'Review successfully updated'
 
-            return response_data, 200
+            return response_data, 200, version_etag(updated_review)
+        except VersionConflictError as e:
+            return version_conflict('Review', e)
         except ValueError as ve:
             return {'error': f'Invalid data: {str(ve)}'}, 400
         except Exception as e:
@@ -189,13 +208,14 @@ class ReviewResource(Resource):
         is_admin = current_user.get('is_admin', False) or jwt_claims.get('is_admin', False)
         user_id = current_user.get('id')
         
-        # Get the existing review to check ownership
-        review = facade.get_review(review_id)
-        if not review:
+        # Check the review exists and who wrote it, without loading it
+        author_id, is_authorized, _ = check_resource_access(
+            'review', review_id, facade.get_review_author_id)
+        if author_id is None:
             return {'error': 'Review not found'}, 404
             
         # Admin bypass ownership restrictions - exact implementation as specified
-        if not is_admin and review.user.id != user_id:
+        if not is_authorized:
             return {'error': 'Unauthorized action'}, 403
         
         try:
@@ -208,7 +228,7 @@ class ReviewResource(Resource):
             response_data = {'message': 'Review deleted successfully'}
             
             # Add admin deletion tracking if admin performed the deletion
-            if is_admin and review.user.id != user_id:
+            if is_admin and author_id != user_id:
                 response_data['deleted_by_admin'] = True
                 response_data['message'] = 'Review deleted by administrator'
             
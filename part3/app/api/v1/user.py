@@ -2,7 +2,9 @@ from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from flask import request
 from app.services import facade
+from app.utils.password_hashing import PasswordHasherBusy
 from app.utils.rbac import admin_required, check_admin_or_owner, get_current_user_info
+from app.utils.streaming import requested_stream_format, stream_collection, stream_chunk_size
 
 api = Namespace('users', description='User operations')
 
@@ -35,21 +37,32 @@ user_update_model = api.model('UserUpdate', {
 })
 
 
+def serialize_user(user):
+    """Serialize a user object to a dictionary for list responses."""
+    return {'id': user.id, 'first_name': user.first_name,
+            'last_name': user.last_name, 'email': user.email}
+
+
 @api.route('/')
 class UserList(Resource):
     @api.response(200, 'List of users retrieved successfully')
+    @api.doc(params={'stream': 'Stream the list incrementally (json or ndjson)'})
     def get(self):
         """Retrieve a list of all users"""
+        stream_format = requested_stream_format()
+        if stream_format:
+            users = facade.iter_all_users(stream_chunk_size())
+            return stream_collection(users, serialize_user, stream_format)
+
         users = facade.get_all_users()
-        return [{'id': user.id, 'first_name': user.first_name,
-                 'last_name': user.last_name,
-                 'email': user.email} for user in users], 200
+        return [serialize_user(user) for user in users], 200
 
     @api.expect(user_model, validate=True)
     @api.response(201, 'User successfully created')
     @api.response(400, 'Email already registered')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Forbidden - Admin privileges required')
+    @api.response(503, 'Password hashing saturated, retry later')
     @jwt_required()
     @admin_required
     def post(self):
@@ -72,6 +85,8 @@ class UserList(Resource):
                 'is_admin': new_user.is_admin,
                 'message': 'User successfully created'
             }, 201
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': str(e.retry_after)}
         except Exception as e:
             return {'error': f'Failed to create user: {str(e)}'}, 400
 
@@ -169,5 +184,7 @@ class UserResource(Resource):
             
         except ValueError as ve:
             return {'error': f'Invalid data: {str(ve)}'}, 400
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': str(e.retry_after)}
         except Exception as e:
             return {'error': f'Update failed: {str(e)}'}, 400
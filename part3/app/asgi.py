@@ -0,0 +1,249 @@
+"""
+ASGI entry point: hot read paths and review creation on async SQLAlchemy,
+everything else served by the Flask app through a WSGI adapter
+"""
+
+import asyncio
+import json
+import re
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi
+from flask import request
+from flask_jwt_extended import verify_jwt_in_request
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from werkzeug.exceptions import BadRequest
+from werkzeug.test import EnvironBuilder
+
+from app import db
+from app.api.v1.places import serialize_place
+from app.api.v1.reviews import new_review_error, serialize_review
+from app.services.async_facade import AsyncHBnBFacade
+from app.utils import admission
+from app.utils.concurrency import version_etag
+from app.utils.rbac import get_identity
+
+# Sync steps of a native request share one thread, like a WSGI request
+run_sync = partial(sync_to_async, thread_sensitive=True)
+
+# Async drivers substituted for the sync ones in SQLALCHEMY_DATABASE_URI
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+}
+
+
+def async_database_url(app):
+    """
+    URL of the application database with an async driver, or None if the
+    database cannot be shared (in-memory SQLite) or has no async driver
+    """
+    if app.config.get('ASYNC_DATABASE_URI'):
+        return app.config['ASYNC_DATABASE_URI']
+    with app.app_context():
+        url = db.engine.url
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        return None
+    if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+        return None
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+class AsyncRoute:
+    def __init__(self, method, pattern, handler, auth=False):
+        self.method = method
+        self.pattern = re.compile(pattern)
+        self.handler = handler
+        self.auth = auth
+
+
+class HBnBASGI:
+    """
+    ASGI application wrapping the Flask app.
+
+    Routes listed in ``routes`` run natively on an async engine while
+    sharing the Flask request context, so JWT verification (including the
+    revocation check), RBAC helpers, before/after-request hooks such as
+    Server-Timing and compression, and the serializers are the same code
+    as the WSGI path. Any other request, including streamed listings, is
+    handed to the Flask app via asgiref's WsgiToAsgi (run in a thread).
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        url = async_database_url(flask_app)
+        self.engine = create_async_engine(url) if url is not None else None
+        self.facade = AsyncHBnBFacade(
+            async_sessionmaker(self.engine, expire_on_commit=False)) if self.engine else None
+        self.routes = [
+            AsyncRoute('GET', r'/api/v1/places/', self.list_places),
+            AsyncRoute('GET', r'/api/v1/places/(?P<place_id>[^/]+)', self.get_place),
+            AsyncRoute('GET', r'/api/v1/reviews/', self.list_reviews),
+            AsyncRoute('GET', r'/api/v1/reviews/(?P<review_id>[^/]+)', self.get_review),
+            AsyncRoute('POST', r'/api/v1/reviews/', self.create_review, auth=True),
+        ]
+
+    def match(self, scope):
+        if self.engine is None or b'stream=' in scope.get('query_string', b''):
+            return None, None
+        for route in self.routes:
+            if route.method == scope['method']:
+                match = route.pattern.fullmatch(scope['path'])
+                if match:
+                    return route, match.groupdict()
+        return None, None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        route, params = self.match(scope) if scope['type'] == 'http' else (None, None)
+        if route is None:
+            return await self.wsgi(scope, receive, send)
+        body = await read_body(receive)
+        response = await self.dispatch(route, params, scope, body)
+        await send({'type': 'http.response.start', 'status': response.status_code,
+                    'headers': [(k.lower().encode('latin-1'), v.encode('latin-1'))
+                                for k, v in response.headers.items()]})
+        await send({'type': 'http.response.body', 'body': response.get_data()})
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.engine is not None:
+                    await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def dispatch(self, route, params, scope, body):
+        app = self.flask_app
+        environ = EnvironBuilder(
+            path=scope['path'], method=scope['method'],
+            query_string=scope.get('query_string', b'').decode('latin-1'),
+            headers=[(k.decode('latin-1'), v.decode('latin-1'))
+                     for k, v in scope.get('headers', [])],
+            data=body).get_environ()
+        environ['hbnb.asgi'] = True
+        # Admission control queues native requests on this loop
+        environ['hbnb.loop'] = asyncio.get_running_loop()
+        with app.request_context(environ):
+            # The request hooks, token and revocation checks and response
+            # hooks run synchronous database work, so they go to asgiref's
+            # sync thread (with this request context copied over); waiting
+            # for an admission slot and the native handler run on the loop
+            try:
+                rv = await run_sync(self.preprocess)(route)
+                if rv is None:
+                    rv = await admission.wait_for_slot()
+                if rv is None:
+                    rv = await route.handler(**params)
+            except Exception as e:
+                rv = await run_sync(self.handle_error)(e)
+            return await run_sync(self.finish)(rv)
+
+    def preprocess(self, route):
+        """before_request hooks, then the token check of authenticated routes"""
+        rv = self.flask_app.preprocess_request()
+        if rv is None and route.auth:
+            verify_jwt_in_request()
+        return rv
+
+    def handle_error(self, e):
+        """Same error responses as the WSGI path"""
+        try:
+            return self.flask_app.handle_user_exception(e)
+        except Exception as unhandled:
+            return self.flask_app.handle_exception(unhandled)
+
+    def finish(self, rv):
+        """
+        Build the response and run the after_request hooks. The sync
+        session is released here too, so the teardown left to the event
+        loop does no database work.
+        """
+        response = self.flask_app.process_response(
+            self.flask_app.make_response(json_response(rv)))
+        db.session.remove()
+        return response
+
+    async def list_places(self):
+        places = await self.facade.get_all_places()
+        # facade.get_reviews_by_place does not return reviews yet; match it
+        return [serialize_place(place, reviews=[]) for place in places], 200
+
+    async def get_place(self, place_id):
+        place = await self.facade.get_place(place_id)
+        if not place:
+            return {'error': 'Place not found'}, 404
+        return serialize_place(place, reviews=[]), 200, version_etag(place)
+
+    async def list_reviews(self):
+        reviews = await self.facade.get_all_reviews()
+        return [serialize_review(review) for review in reviews], 200
+
+    async def get_review(self, review_id):
+        review = await self.facade.get_review(review_id)
+        if not review:
+            return {'error': 'Review not found'}, 404
+        return serialize_review(review), 200, version_etag(review)
+
+    async def create_review(self):
+        review_data = request.get_json(silent=True)
+        if not isinstance(review_data, dict):
+            return {'message': BadRequest.description}, 400
+        current_user, _, _ = get_identity()
+
+        # Ensure the user_id in the payload matches the current user
+        if review_data.get('user_id') != current_user.get('id'):
+            return {'error': 'Cannot create review for another user'}, 403
+
+        place_owner_id = await self.facade.get_place_owner_id(review_data.get('place_id'))
+        already_reviewed = (
+            place_owner_id is not None and place_owner_id != current_user['id']
+            and await self.facade.user_has_reviewed(current_user['id'],
+                                                    review_data.get('place_id')))
+        error = new_review_error(current_user['id'], place_owner_id, already_reviewed)
+        if error:
+            return error
+
+        try:
+            new_review = await self.facade.create_review(review_data)
+            return serialize_review(new_review), 201
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        except Exception:
+            return {'error': 'An unexpected error occurred'}, 400
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+def json_response(rv):
+    """
+    Encode a (body, status[, headers]) handler result the way restx does
+    """
+    if not isinstance(rv, tuple) or not isinstance(rv[0], (dict, list)):
+        return rv
+    body, status, *rest = rv
+    headers = {'Content-Type': 'application/json', **(rest[0] if rest else {})}
+    return json.dumps(body) + '\n', status, headers
+
+
+def create_asgi_app(flask_app):
+    """
+    Wrap a Flask app created by create_app() for an ASGI server, e.g.
+    ``uvicorn asgi:app``
+    """
+    return HBnBASGI(flask_app)
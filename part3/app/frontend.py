@@ -0,0 +1,71 @@
+"""
+Serving of the prebuilt part4 frontend with precompressed variants
+"""
+
+import json
+import mimetypes
+import os
+from flask import Blueprint, abort, current_app, send_file
+
+from app.utils.compression import choose_encoding
+
+blueprint = Blueprint('frontend', __name__)
+
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+
+def _dist_dir():
+    return os.path.abspath(current_app.config['FRONTEND_DIST_DIR'])
+
+
+def _fingerprinted_files():
+    """
+    Set of fingerprinted paths listed in the build manifest
+    """
+    cache = current_app.extensions.setdefault('hbnb_frontend', {})
+    if 'fingerprinted' not in cache:
+        manifest_path = os.path.join(_dist_dir(), 'manifest.json')
+        try:
+            with open(manifest_path) as manifest:
+                cache['fingerprinted'] = set(json.load(manifest)['assets'].values())
+        except (OSError, ValueError, KeyError):
+            cache['fingerprinted'] = set()
+    return cache['fingerprinted']
+
+
+@blueprint.route('/', defaults={'path': 'index.html'})
+@blueprint.route('/<path:path>')
+def serve_asset(path):
+    """Serve a built frontend file, preferring a precompressed variant"""
+    root = _dist_dir()
+    full_path = os.path.abspath(os.path.join(root, path))
+    if not full_path.startswith(root + os.sep) or not os.path.isfile(full_path):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+    available = [encoding for encoding, suffix in PRECOMPRESSED_SUFFIXES.items()
+                 if os.path.isfile(full_path + suffix)]
+    encoding = choose_encoding(available) if available else None
+
+    file_path = full_path + PRECOMPRESSED_SUFFIXES[encoding] if encoding else full_path
+    response = send_file(file_path, mimetype=mimetype, conditional=True, etag=True)
+    if available:
+        response.vary.add('Accept-Encoding')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+
+    if path in _fingerprinted_files():
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    else:
+        response.headers['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+    return response
+
+
+def init_app(app):
+    """
+    Mount the frontend when a build directory is configured
+    """
+    if app.config.get('FRONTEND_DIST_DIR'):
+        app.register_blueprint(blueprint)
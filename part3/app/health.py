@@ -0,0 +1,55 @@
+"""
+Readiness check for load balancers and process managers
+"""
+
+import os
+from flask import current_app, jsonify
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+
+
+def _check_database():
+    db.session.execute(text('SELECT 1'))
+    return 'ok'
+
+
+def _check_signing_keys():
+    keys = current_app.extensions.get('jwt_keys')
+    # HS256 and verification-only (JWT_JWKS_URL) nodes have no key set to check
+    if keys is None or current_app.config.get('JWT_JWKS_URL'):
+        return 'ok'
+    keys.signing_key()
+    return 'ok'
+
+
+CHECKS = {
+    'database': (_check_database, SQLAlchemyError),
+    'signing_keys': (_check_signing_keys, RuntimeError),
+}
+
+
+def healthz():
+    """Report ready (200) only if every dependency answers, otherwise 503"""
+    results = {}
+    ready = True
+    for name, (check, errors) in CHECKS.items():
+        try:
+            results[name] = check()
+        except errors as e:
+            current_app.logger.warning('Health check %s failed: %s', name, e)
+            results[name] = 'failing'
+            ready = False
+    response = jsonify({'status': 'ok' if ready else 'unavailable',
+                        'checks': results, 'pid': os.getpid()})
+    response.status_code = 200 if ready else 503
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def init_app(app):
+    """
+    Register GET /healthz
+    """
+    app.add_url_rule('/healthz', 'healthz', healthz)
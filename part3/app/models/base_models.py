@@ -1,6 +1,7 @@
 from app import db
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import declared_attr
 
 
 class BaseModel(db.Model):
@@ -14,6 +15,13 @@ class BaseModel(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Row version for optimistic concurrency: every ORM UPDATE checks and bumps it,
+    # and raises StaleDataError if another writer got there first
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+
+    @declared_attr
+    def __mapper_args__(cls):
+        return {'version_id_col': cls.version}
 
     def __init__(self, **kwargs):
         """Initialize the BaseModel with optional keyword arguments.
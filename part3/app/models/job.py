@@ -0,0 +1,35 @@
+from app import db
+from datetime import datetime
+
+
+class Job(db.Model):
+    """Deferred unit of work in the persistent local job queue.
+
+    A job is ``pending`` until a worker claims it (``running``), then ends
+    up ``done`` or, after ``max_attempts`` failures, ``failed``. Failed
+    attempts before that go back to ``pending`` with a later ``run_at``.
+    ``dedupe_key`` lets callers avoid queueing the same work twice.
+    """
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        db.Index('ix_jobs_status_run_at', 'status', 'run_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    name = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.Text, nullable=True)  # JSON arguments
+    status = db.Column(db.String(16), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    dedupe_key = db.Column(db.String(128), nullable=True, index=True)
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    worker = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    result = db.Column(db.Text, nullable=True)  # JSON return value
+
+    def __repr__(self):
+        """Return string representation of Job instance."""
+        return f"<Job(id={self.id}, name='{self.name}', status='{self.status}')>"
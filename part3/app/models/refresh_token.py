@@ -0,0 +1,43 @@
+from app import db
+from .base_models import BaseModel
+import hashlib
+import secrets
+
+
+class RefreshToken(BaseModel):
+    """Refresh token issued at login and rotated on every use.
+    
+    Only the SHA-256 digest of the opaque token is stored. Tokens that
+    descend from the same login share a ``family_id``, so presenting a
+    token that was already rotated (a sign that it leaked) revokes the
+    whole family at once.
+    """
+    __tablename__ = 'refresh_tokens'
+    
+    # Column definitions; every lookup path is indexed
+    token_hash = db.Column(db.String(64), nullable=False, unique=True, index=True)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id', ondelete='CASCADE'),
+                        nullable=False, index=True)
+    family_id = db.Column(db.String(36), nullable=False, index=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime, nullable=True)
+    replaced_by = db.Column(db.String(36), nullable=True)
+
+    @staticmethod
+    def generate():
+        """Return a new opaque token and its digest.
+        
+        Returns:
+            tuple: (token, token_hash)
+        """
+        token = secrets.token_urlsafe(32)
+        return token, RefreshToken.hash_token(token)
+
+    @staticmethod
+    def hash_token(token):
+        """Digest under which a token is stored and looked up."""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def __repr__(self):
+        """Return string representation of RefreshToken instance."""
+        return f"<RefreshToken(id='{self.id}', user_id='{self.user_id}', family='{self.family_id}')>"
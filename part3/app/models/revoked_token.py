@@ -0,0 +1,27 @@
+from app import db
+from datetime import datetime
+
+
+class RevokedToken(db.Model):
+    """Append-only log of revoked access tokens.
+    
+    A row either revokes a single token (``jti``) or every token of a user
+    issued before ``revoked_before`` (logout everywhere, admin demotion,
+    password change). Rows are only needed until ``expires_at``, after
+    which every token they cover has expired on its own.
+    
+    The integer primary key doubles as a sequence number, so workers can
+    fetch only the rows added since their last sync.
+    """
+    __tablename__ = 'revoked_tokens'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    jti = db.Column(db.String(36), nullable=True, unique=True, index=True)
+    user_id = db.Column(db.String(36), nullable=True, index=True)
+    revoked_before = db.Column(db.DateTime, nullable=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        """Return string representation of RevokedToken instance."""
+        return f"<RevokedToken(id={self.id}, jti='{self.jti}', user_id='{self.user_id}')>"
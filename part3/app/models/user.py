@@ -1,5 +1,6 @@
-from app import db, bcrypt
+from app import db
 from app.models.base_models import BaseModel
+from app.utils.password_hashing import check_password, hash_password
 from sqlalchemy.orm import relationship
 import re
 
@@ -73,15 +74,18 @@ class User(BaseModel):
     def hash_password(self, password):
         """Hash the password before storing it.
         
+        Hashing runs on the application's bcrypt process pool.
+        
         Args:
             password (str): Plain text password to hash
         
         Raises:
             ValueError: If password is empty or None
+            PasswordHasherBusy: If the hashing queue is full
         """
         if not password:
             raise ValueError("Password cannot be empty")
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password = hash_password(password)
 
     def verify_password(self, password):
         """Verify the hashed password.
@@ -91,10 +95,13 @@ class User(BaseModel):
             
         Returns:
             bool: True if password matches, False otherwise
+            
+        Raises:
+            PasswordHasherBusy: If the hashing queue is full
         """
         if not password or not self.password:
             return False
-        return bcrypt.check_password_hash(self.password, password)
+        return check_password(self.password, password)
     
     def to_dict(self):
         """Convert User instance to dictionary, excluding sensitive data.
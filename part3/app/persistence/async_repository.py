@@ -0,0 +1,137 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app.models.amenities import Amenity
+from app.models.place import Place
+from app.models.reviews import Review
+from app.models.user import User
+
+
+class AsyncSQLAlchemyRepository:
+    """Async counterpart of SQLAlchemyRepository for the ASGI entry point.
+
+    Each call opens a short-lived ``AsyncSession`` from the given factory,
+    so one repository instance can be shared by concurrent tasks. Lazy
+    loading is not available on async sessions: anything a serializer
+    touches must be listed in ``load_options``.
+    """
+
+    # Name of the foreign key column holding the owning user's id, if any
+    owner_column = None
+
+    def __init__(self, model, session_factory):
+        """Initialize the repository.
+
+        Args:
+            model: SQLAlchemy model class (e.g., User, Place, Review)
+            session_factory: ``async_sessionmaker`` bound to an async engine
+        """
+        self.model = model
+        self.session_factory = session_factory
+
+    def load_options(self):
+        """Eager loaders applied to every entity query."""
+        return ()
+
+    async def add(self, obj):
+        """Add a new object to the database.
+
+        Args:
+            obj: Model instance to add to the database
+
+        Returns:
+            The added instance
+        """
+        async with self.session_factory() as session:
+            session.add(obj)
+            await session.commit()
+        return obj
+
+    async def get(self, obj_id):
+        """Retrieve an object by its ID, or None if not found."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(self.model).options(*self.load_options())
+                .where(self.model.id == obj_id))
+            return result.scalar_one_or_none()
+
+    async def get_all(self):
+        """Retrieve all objects of this model type."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(self.model).options(*self.load_options()))
+            return result.scalars().all()
+
+    async def get_by_attribute(self, attr_name, attr_value):
+        """Find the first object with a specific attribute value, or None."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(self.model).options(*self.load_options())
+                .filter_by(**{attr_name: attr_value}).limit(1))
+            return result.scalar_one_or_none()
+
+    async def exists(self, obj_id):
+        """Check whether an object exists without loading it."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(self.model.id).where(self.model.id == obj_id))
+            return result.first() is not None
+
+    async def get_owner_id(self, obj_id):
+        """Return the owning user's id of an object without loading it.
+
+        Returns:
+            str: Owner id, or None if the object does not exist
+        """
+        if self.owner_column is None:
+            raise NotImplementedError(f"{self.model.__name__} has no owner column")
+        column = getattr(self.model, self.owner_column)
+        async with self.session_factory() as session:
+            result = await session.execute(select(column).where(self.model.id == obj_id))
+            return result.scalar_one_or_none()
+
+
+class AsyncUserRepository(AsyncSQLAlchemyRepository):
+    """Async user repository."""
+
+    def __init__(self, session_factory):
+        super().__init__(User, session_factory)
+
+
+class AsyncPlaceRepository(AsyncSQLAlchemyRepository):
+    """Async place repository; loads everything serialize_place needs."""
+
+    owner_column = 'owner_id'
+
+    def __init__(self, session_factory):
+        super().__init__(Place, session_factory)
+
+    def load_options(self):
+        return (
+            selectinload(Place.owner),
+            selectinload(Place.amenities).lazyload(Amenity.places),
+        )
+
+
+class AsyncReviewRepository(AsyncSQLAlchemyRepository):
+    """Async review repository."""
+
+    owner_column = 'user_id'
+
+    def __init__(self, session_factory):
+        super().__init__(Review, session_factory)
+
+    async def user_has_reviewed(self, user_id, place_id):
+        """Check whether a user already reviewed a place (single-column lookup).
+
+        Args:
+            user_id (str): ID of the user
+            place_id (str): ID of the place
+
+        Returns:
+            bool: True if a review exists
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Review.id).where(Review.user_id == user_id,
+                                        Review.place_id == place_id).limit(1))
+            return result.first() is not None
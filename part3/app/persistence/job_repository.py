@@ -0,0 +1,160 @@
+from datetime import datetime
+from sqlalchemy import func, select, update
+from app.models.job import Job
+from app import db
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class JobRepository(SQLAlchemyRepository):
+    """Job queue repository.
+
+    Claiming is a conditional UPDATE on ``status = 'pending'``, so several
+    worker threads or processes can poll the same table and each job still
+    runs once.
+    """
+
+    def __init__(self):
+        """Initialize the JobRepository with the Job model."""
+        super().__init__(Job)
+
+    def enqueue(self, name, payload=None, run_at=None, max_attempts=3, dedupe_key=None):
+        """Queue a job.
+
+        Args:
+            name (str): Registered task name
+            payload (str): JSON-encoded arguments
+            run_at (datetime): Earliest start time (default: now)
+            max_attempts (int): Attempts before the job is marked failed
+            dedupe_key (str): Skip queueing if a pending job has this key
+
+        Returns:
+            tuple: (Job, created) - the existing pending job when deduplicated
+        """
+        if dedupe_key is not None:
+            existing = self.model.query.filter_by(
+                dedupe_key=dedupe_key, status='pending').first()
+            if existing:
+                return existing, False
+        now = datetime.utcnow()
+        job = Job(name=name, payload=payload, run_at=run_at or now, created_at=now,
+                  max_attempts=max_attempts, dedupe_key=dedupe_key, status='pending',
+                  attempts=0)
+        db.session.add(job)
+        db.session.commit()
+        return job, True
+
+    def claim_next(self, worker, now=None):
+        """Claim the oldest due pending job for a worker.
+
+        Args:
+            worker (str): Identifier of the claiming worker
+
+        Returns:
+            Job: The claimed job, or None if nothing is due
+        """
+        now = now or datetime.utcnow()
+        for _ in range(5):
+            job_id = db.session.execute(
+                select(Job.id).where(Job.status == 'pending', Job.run_at <= now)
+                .order_by(Job.run_at, Job.id).limit(1)
+            ).scalar_one_or_none()
+            if job_id is None:
+                db.session.rollback()
+                return None
+            job = self.claim(job_id, worker, now)
+            if job is not None:
+                return job
+        # Lost every race; try again on the next poll
+        return None
+
+    def claim(self, job_id, worker, now=None):
+        """Claim one job if it is still pending.
+
+        Args:
+            job_id (int): ID of the job
+            worker (str): Identifier of the claiming worker
+
+        Returns:
+            Job: The claimed job, or None if another worker took it first
+        """
+        now = now or datetime.utcnow()
+        claimed = db.session.execute(
+            update(Job).where(Job.id == job_id, Job.status == 'pending')
+            .values(status='running', started_at=now, worker=worker,
+                    attempts=Job.attempts + 1)
+        ).rowcount == 1
+        db.session.commit()
+        return self.get(job_id) if claimed else None
+
+    def mark_done(self, job_id, result=None):
+        """Record a successful run."""
+        db.session.execute(
+            update(Job).where(Job.id == job_id)
+            .values(status='done', finished_at=datetime.utcnow(), result=result,
+                    last_error=None))
+        db.session.commit()
+
+    def mark_failed(self, job_id, error, retry_at=None):
+        """Record a failed attempt.
+
+        Args:
+            job_id (int): ID of the job
+            error (str): Error description
+            retry_at (datetime): When to retry, or None to give up
+        """
+        values = {'last_error': error, 'finished_at': datetime.utcnow()}
+        if retry_at is None:
+            values['status'] = 'failed'
+        else:
+            values.update(status='pending', run_at=retry_at)
+        db.session.execute(update(Job).where(Job.id == job_id).values(**values))
+        db.session.commit()
+
+    def requeue_stale(self, started_before):
+        """Put back jobs left running by a worker that died.
+
+        Returns:
+            int: Number of jobs requeued
+        """
+        result = db.session.execute(
+            update(Job).where(Job.status == 'running', Job.started_at < started_before)
+            .values(status='pending', worker=None))
+        db.session.commit()
+        return result.rowcount
+
+    def count_by_status(self):
+        """Return {status: count} over the whole queue."""
+        return dict(db.session.execute(
+            select(Job.status, func.count()).group_by(Job.status)).tuples().all())
+
+    def oldest_pending_run_at(self, now=None):
+        """Return the run_at of the oldest due pending job, or None."""
+        return db.session.execute(
+            select(func.min(Job.run_at))
+            .where(Job.status == 'pending', Job.run_at <= (now or datetime.utcnow()))
+        ).scalar_one_or_none()
+
+    def latest_result(self, name):
+        """Return (result, finished_at) of the newest successful run of a task.
+
+        Returns:
+            tuple: (str, datetime), or None if the task never succeeded
+        """
+        row = db.session.execute(
+            select(Job.result, Job.finished_at)
+            .where(Job.name == name, Job.status == 'done')
+            .order_by(Job.finished_at.desc()).limit(1)
+        ).first()
+        return tuple(row) if row else None
+
+    def purge_finished(self, before):
+        """Delete done and failed jobs that finished before a point in time.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = self.model.query.filter(
+            Job.status.in_(('done', 'failed')), Job.finished_at < before
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
@@ -1,4 +1,8 @@
+from sqlalchemy import delete
+from sqlalchemy.orm import joinedload, selectinload
 from app.models.place import Place
+from app.models.amenities import Amenity, place_amenities
+from app.models.reviews import Review
 from app import db
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -11,10 +15,45 @@ class PlaceRepository(SQLAlchemyRepository):
     location-based searches, and pricing queries.
     """
     
+    owner_column = 'owner_id'
+    
     def __init__(self):
         """Initialize the PlaceRepository with the Place model."""
         super().__init__(Place)
     
+    def _stream_query(self):
+        """Eager-load owner and amenities in a way compatible with yield_per.
+        
+        The default ``subquery`` loader on ``Place.amenities`` cannot be used
+        with ``yield_per``; ``selectinload`` loads amenities once per chunk.
+        """
+        return self.model.query.options(
+            joinedload(self.model.owner),
+            selectinload(self.model.amenities).lazyload(Amenity.places)
+        )
+    
+    def delete(self, place_id):
+        """Delete a place together with its reviews and amenity links.
+        
+        The ORM default would try to null out ``reviews.place_id`` (which
+        is NOT NULL), so the dependent rows are removed with bulk DELETEs
+        in the same transaction instead of being loaded one by one.
+        
+        Args:
+            place_id (str): ID of the place to delete
+            
+        Returns:
+            bool: True if deleted, False if the place was not found
+        """
+        db.session.execute(delete(Review).where(Review.place_id == place_id))
+        db.session.execute(delete(place_amenities).where(place_amenities.c.place_id == place_id))
+        deleted = db.session.execute(delete(Place).where(Place.id == place_id)).rowcount == 1
+        if deleted:
+            db.session.commit()
+        else:
+            db.session.rollback()
+        return deleted
+    
     def get_places_by_price_range(self, min_price, max_price):
         """Find places within a specific price range.
         
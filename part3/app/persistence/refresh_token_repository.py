@@ -0,0 +1,133 @@
+from datetime import datetime
+from sqlalchemy import update
+from app.models.refresh_token import RefreshToken
+from app import db
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class RefreshTokenRepository(SQLAlchemyRepository):
+    """Refresh token repository handling issue, rotation and revocation bookkeeping.
+    
+    Rotation is done with a conditional UPDATE so that two concurrent
+    refreshes with the same token cannot both succeed.
+    """
+    
+    owner_column = 'user_id'
+    
+    def __init__(self):
+        """Initialize the RefreshTokenRepository with the RefreshToken model."""
+        super().__init__(RefreshToken)
+    
+    def get_by_token(self, token):
+        """Find a refresh token by its opaque value.
+        
+        Args:
+            token (str): Token as presented by the client
+            
+        Returns:
+            RefreshToken: Matching token (revoked or not), or None
+        """
+        if not token:
+            return None
+        return self.model.query.filter_by(token_hash=RefreshToken.hash_token(token)).first()
+    
+    def issue(self, user_id, expires_at, family_id=None):
+        """Store a new refresh token, starting a new family unless one is given.
+        
+        Args:
+            user_id (str): Owner of the token
+            expires_at (datetime): Expiry of the token
+            family_id (str, optional): Family the token belongs to
+            
+        Returns:
+            tuple: (token, RefreshToken) where token is the opaque value for the client
+        """
+        token, token_hash = RefreshToken.generate()
+        record = RefreshToken(token_hash=token_hash, user_id=user_id, expires_at=expires_at)
+        record.family_id = family_id or record.id
+        db.session.add(record)
+        db.session.commit()
+        return token, record
+    
+    def rotate(self, current, expires_at, now=None):
+        """Replace a token by a successor of the same family in one transaction.
+        
+        Args:
+            current (RefreshToken): Token presented by the client
+            expires_at (datetime): Expiry of the successor
+            
+        Returns:
+            str: Opaque successor token, or None if ``current`` was already rotated
+        """
+        token, token_hash = RefreshToken.generate()
+        successor = RefreshToken(token_hash=token_hash, user_id=current.user_id,
+                                 family_id=current.family_id, expires_at=expires_at)
+        db.session.add(successor)
+        if not self.mark_rotated(current.id, successor.id, now):
+            db.session.rollback()
+            return None
+        db.session.commit()
+        return token
+    
+    def mark_rotated(self, token_id, replaced_by, now=None):
+        """Revoke a token in favour of its successor, if nobody else did first.
+        
+        Args:
+            token_id (str): ID of the token being rotated
+            replaced_by (str): ID of the successor token
+            
+        Returns:
+            bool: True if this call rotated the token, False if it was already revoked
+        """
+        result = db.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == token_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now or datetime.utcnow(), replaced_by=replaced_by)
+        )
+        return result.rowcount == 1
+    
+    def revoke_family(self, family_id, now=None):
+        """Revoke every token descending from the same login.
+        
+        Args:
+            family_id (str): Family to revoke
+            
+        Returns:
+            int: Number of tokens revoked
+        """
+        result = db.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now or datetime.utcnow())
+        )
+        db.session.commit()
+        return result.rowcount
+    
+    def revoke_for_user(self, user_id, now=None):
+        """Revoke all refresh tokens of a user.
+        
+        Args:
+            user_id (str): ID of the user
+            
+        Returns:
+            int: Number of tokens revoked
+        """
+        result = db.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now or datetime.utcnow())
+        )
+        db.session.commit()
+        return result.rowcount
+    
+    def delete_expired(self, before=None):
+        """Delete tokens that expired before the given time.
+        
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = self.model.query.filter(
+            RefreshToken.expires_at < (before or datetime.utcnow())
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
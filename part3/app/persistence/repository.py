@@ -1,5 +1,23 @@
+import functools
+import inspect
+import time
 from abc import ABC, abstractmethod
+from sqlalchemy import select
+from sqlalchemy.orm.exc import StaleDataError
 from app import db
+from app.utils.metrics import REPOSITORY_DURATION
+
+
+class VersionConflictError(Exception):
+    """Raised when an update was based on an outdated version of an object.
+
+    Attributes:
+        current_version (int): Version currently stored, or None if unknown
+    """
+
+    def __init__(self, current_version=None):
+        super().__init__('The resource was modified by another request')
+        self.current_version = current_version
 
 
 class Repository(ABC):
@@ -55,6 +73,72 @@ class InMemoryRepository(Repository):
                     if getattr(obj, attr_name) == attr_value), None)
 
 
+def timed_iteration(method):
+    """
+    Mark a repository method that returns a lazy iterable: its queries run
+    while the result is iterated, so that is what gets timed. Generator
+    functions are timed this way without the marker.
+    """
+    method._repository_timing = 'iteration'
+    return method
+
+
+def untimed(method):
+    """Mark a public repository method whose time is not spent in SQL"""
+    method._repository_timing = None
+    return method
+
+
+def _timed(name, method):
+    """Wrap a repository method to record its duration per repository class"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            REPOSITORY_DURATION.observe((type(self).__name__, name), time.perf_counter() - start)
+    return wrapper
+
+
+def _timed_iterable(name, method):
+    """
+    Wrap a method returning a lazy iterable to record the time spent
+    producing its items, excluding the time the caller spends on them
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        iterator = iter(method(self, *args, **kwargs))
+        elapsed = time.perf_counter() - start
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            REPOSITORY_DURATION.observe((type(self).__name__, name), elapsed)
+    return wrapper
+
+
+def _time_public_methods(cls):
+    for name, value in list(vars(cls).items()):
+        if name.startswith('_') or not inspect.isfunction(value):
+            continue
+        mode = getattr(value, '_repository_timing',
+                       'iteration' if inspect.isgeneratorfunction(value) else 'call')
+        if mode == 'iteration':
+            setattr(cls, name, _timed_iterable(name, value))
+        elif mode == 'call':
+            setattr(cls, name, _timed(name, value))
+    return cls
+
+
 class SQLAlchemyRepository(Repository):
     """SQLAlchemy implementation of the Repository interface.
     
@@ -62,6 +146,14 @@ class SQLAlchemyRepository(Repository):
     It's designed to be flexible and reusable for different entities.
     """
     
+    # Name of the foreign key column holding the owning user's id, if any
+    owner_column = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Time the public methods of every concrete repository (see /metrics)"""
+        super().__init_subclass__(**kwargs)
+        _time_public_methods(cls)
+    
     def __init__(self, model):
         """Initialize the repository with a SQLAlchemy model.
         
@@ -99,25 +191,95 @@ class SQLAlchemyRepository(Repository):
         """
         return self.model.query.all()
 
-    def update(self, obj_id, data):
+    @timed_iteration
+    def iter_all(self, chunk_size=1000):
+        """Iterate over all objects of this model type in chunks.
+        
+        Rows are pulled from the database cursor ``chunk_size`` at a time
+        (``yield_per``), so only one chunk is held in memory at once.
+        
+        Args:
+            chunk_size: Number of rows fetched per round trip
+            
+        Returns:
+            Iterator over model instances
+        """
+        return self._stream_query().yield_per(chunk_size)
+
+    def _stream_query(self):
+        """Return the base query used by iter_all.
+        
+        Subclasses override this to swap eager loaders that cannot be
+        combined with ``yield_per`` for ones that can.
+        """
+        return self.model.query
+
+    def get_owner_id(self, obj_id):
+        """Return the owning user's id of an object without loading it.
+        
+        Selects only the owner foreign key column, so neither the entity
+        nor any of its relationships are loaded.
+        
+        Args:
+            obj_id: The ID of the object
+            
+        Returns:
+            str: Owner id, or None if the object does not exist
+        """
+        if self.owner_column is None:
+            raise NotImplementedError(f"{self.model.__name__} has no owner column")
+        column = getattr(self.model, self.owner_column)
+        return db.session.execute(
+            select(column).where(self.model.id == obj_id)).scalar_one_or_none()
+
+    def update(self, obj_id, data, expected_version=None):
         """Update an object with new data.
         
+        Models with a ``version`` column are updated optimistically: the
+        UPDATE only matches the version that was loaded, so a concurrent
+        write in between is detected instead of silently overwritten.
+        
         Args:
             obj_id: The ID of the object to update
             data: Dictionary of attributes to update
+            expected_version: Version the caller based its changes on (e.g.
+                from an If-Match header); None to accept the current one
             
         Returns:
             Updated model instance or None if not found
+            
+        Raises:
+            VersionConflictError: If the object is not at ``expected_version``
+                or was modified concurrently
         """
         obj = self.get(obj_id)
         if obj:
+            if expected_version is not None and obj.version != expected_version:
+                raise VersionConflictError(obj.version)
             for key, value in data.items():
-                if hasattr(obj, key):
+                # The version is only ever bumped by the mapper
+                if hasattr(obj, key) and key != 'version':
                     setattr(obj, key, value)
-            db.session.commit()
+            try:
+                db.session.commit()
+            except StaleDataError:
+                db.session.rollback()
+                raise VersionConflictError(self.get_version(obj_id))
             return obj
         return None
 
+    def get_version(self, obj_id):
+        """Return the stored version of an object without loading it.
+        
+        Args:
+            obj_id: The ID of the object
+            
+        Returns:
+            int: Current version, or None if the object does not exist
+        """
+        return db.session.execute(
+            select(self.model.version).where(self.model.id == obj_id)).scalar_one_or_none()
+
     def delete(self, obj_id):
         """Delete an object from the database.
         
@@ -145,3 +307,6 @@ class SQLAlchemyRepository(Repository):
             First matching model instance or None if not found
         """
         return self.model.query.filter_by(**{attr_name: attr_value}).first()
+
+
+_time_public_methods(SQLAlchemyRepository)
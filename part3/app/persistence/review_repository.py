@@ -1,3 +1,4 @@
+from sqlalchemy import select
 from app.models.reviews import Review
 from app import db
 from app.persistence.repository import SQLAlchemyRepository
@@ -11,6 +12,8 @@ class ReviewRepository(SQLAlchemyRepository):
     rating analytics, and content filtering.
     """
     
+    owner_column = 'user_id'
+    
     def __init__(self):
         """Initialize the ReviewRepository with the Review model."""
         super().__init__(Review)
@@ -90,6 +93,21 @@ class ReviewRepository(SQLAlchemyRepository):
                 .limit(limit)
                 .all())
     
+    def user_has_reviewed(self, user_id, place_id):
+        """Check whether a user already reviewed a place (single-column lookup).
+        
+        Args:
+            user_id (str): ID of the user
+            place_id (str): ID of the place
+            
+        Returns:
+            bool: True if a review exists
+        """
+        return db.session.execute(
+            select(self.model.id).where(self.model.user_id == user_id,
+                                        self.model.place_id == place_id).limit(1)
+        ).first() is not None
+    
     def get_reviews_ordered_by_rating(self, ascending=False):
         """Get all reviews ordered by rating.
         
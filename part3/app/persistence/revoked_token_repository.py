@@ -0,0 +1,93 @@
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from app.models.revoked_token import RevokedToken
+from app import db
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class RevokedTokenRepository(SQLAlchemyRepository):
+    """Revoked token repository backing the in-process revocation filter.
+    
+    Reads are designed for incremental sync: ``get_since`` returns only the
+    rows appended after a known sequence number.
+    """
+    
+    def __init__(self):
+        """Initialize the RevokedTokenRepository with the RevokedToken model."""
+        super().__init__(RevokedToken)
+    
+    def revoke_jti(self, jti, expires_at):
+        """Revoke a single access token.
+        
+        Args:
+            jti (str): Token identifier
+            expires_at (datetime): Expiry of the token
+            
+        Returns:
+            RevokedToken: The stored row (the existing one if already revoked)
+        """
+        row = RevokedToken(jti=jti, expires_at=expires_at)
+        db.session.add(row)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            row = self.model.query.filter_by(jti=jti).first()
+        return row
+    
+    def revoke_user(self, user_id, revoked_before, expires_at):
+        """Revoke every token of a user issued before a point in time.
+        
+        Args:
+            user_id (str): ID of the user
+            revoked_before (datetime): Tokens issued before this are revoked
+            expires_at (datetime): When all such tokens have expired anyway
+            
+        Returns:
+            RevokedToken: The stored row
+        """
+        row = RevokedToken(user_id=user_id, revoked_before=revoked_before,
+                           expires_at=expires_at)
+        db.session.add(row)
+        db.session.commit()
+        return row
+    
+    def get_since(self, last_id, now=None):
+        """Return unexpired rows appended after ``last_id``, oldest first.
+        
+        Args:
+            last_id (int): Highest row id already seen (0 for a full load)
+            
+        Returns:
+            list: (id, jti, user_id, revoked_before) tuples
+        """
+        return db.session.execute(
+            select(RevokedToken.id, RevokedToken.jti, RevokedToken.user_id,
+                   RevokedToken.revoked_before)
+            .where(RevokedToken.id > last_id,
+                   RevokedToken.expires_at > (now or datetime.utcnow()))
+            .order_by(RevokedToken.id)
+        ).tuples().all()
+    
+    def jti_exists(self, jti):
+        """Check whether a token id is revoked (single indexed lookup).
+        
+        Returns:
+            bool: True if the jti is in the table
+        """
+        return db.session.execute(
+            select(RevokedToken.id).where(RevokedToken.jti == jti).limit(1)
+        ).first() is not None
+    
+    def purge_expired(self, now=None):
+        """Delete rows whose tokens have all expired.
+        
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = self.model.query.filter(
+            RevokedToken.expires_at <= (now or datetime.utcnow())
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
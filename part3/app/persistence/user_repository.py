@@ -1,6 +1,6 @@
 from app.models.user import User
 from app import db
-from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.repository import SQLAlchemyRepository, untimed
 
 
 class UserRepository(SQLAlchemyRepository):
@@ -92,6 +92,7 @@ class UserRepository(SQLAlchemyRepository):
             
         Raises:
             ValueError: If password is invalid
+            PasswordHasherBusy: If the hashing queue is full
         """
         user = self.get(user_id)
         if not user:
@@ -123,6 +124,8 @@ class UserRepository(SQLAlchemyRepository):
         db.session.commit()
         return user
     
+    # Mostly bcrypt, which is measured on its own; the lookup is timed
+    @untimed
     def authenticate_user(self, email, password):
         """Authenticate a user with email and password.
         
@@ -1,4 +1,23 @@
+import threading
+from werkzeug.local import LocalProxy
+
+# Imported first so that loading the submodule later cannot rebind the
+# package attribute 'facade' below to the module
 from .facade import HBnBFacade
 
-# Create a global instance of the facade
-facade = HBnBFacade()
+_facade = None
+_facade_lock = threading.Lock()
+
+
+def get_facade():
+    """Return the global HBnBFacade, creating it on first use."""
+    global _facade
+    if _facade is None:
+        with _facade_lock:
+            if _facade is None:
+                _facade = HBnBFacade()
+    return _facade
+
+
+# Global facade; it (and each repository behind it) is built on first use
+facade = LocalProxy(get_facade)
@@ -0,0 +1,47 @@
+from app.persistence.async_repository import (
+    AsyncPlaceRepository, AsyncReviewRepository, AsyncUserRepository)
+from app.services.facade import build_review
+
+
+class AsyncHBnBFacade:
+    """Async read (and review create) paths of HBnBFacade for the ASGI app.
+
+    Validation is shared with the sync facade; only the I/O differs.
+    """
+
+    def __init__(self, session_factory):
+        self.user_repo = AsyncUserRepository(session_factory)
+        self.place_repo = AsyncPlaceRepository(session_factory)
+        self.review_repo = AsyncReviewRepository(session_factory)
+
+    async def get_place(self, place_id):
+        """Retrieve a place (with owner and amenities, not reviews) by ID."""
+        return await self.place_repo.get(place_id)
+
+    async def get_all_places(self):
+        """Retrieve all places with owner and amenities loaded (not reviews)."""
+        return await self.place_repo.get_all()
+
+    async def get_place_owner_id(self, place_id):
+        """Return the owner id of a place without loading it, or None."""
+        return await self.place_repo.get_owner_id(place_id)
+
+    async def get_review(self, review_id):
+        """Retrieve a review by ID."""
+        return await self.review_repo.get(review_id)
+
+    async def get_all_reviews(self):
+        """Retrieve all reviews."""
+        return await self.review_repo.get_all()
+
+    async def user_has_reviewed(self, user_id, place_id):
+        """Check whether a user already reviewed a place."""
+        return await self.review_repo.user_has_reviewed(user_id, place_id)
+
+    async def create_review(self, review_data):
+        """Create a new review and store it."""
+        if not await self.user_repo.exists(review_data['user_id']):
+            raise ValueError("User not found")
+        if not await self.place_repo.exists(review_data['place_id']):
+            raise ValueError("Place not found")
+        return await self.review_repo.add(build_review(review_data))
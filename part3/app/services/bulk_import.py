@@ -0,0 +1,261 @@
+import json
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.reviews import Review
+from app.models.amenities import Amenity, place_amenities
+
+
+class BulkImporter:
+    """Import newline-delimited JSON rows in validated, chunked transactions.
+
+    Rows are parsed one line at a time and processed in batches: every row
+    of a batch is validated with the model constructors, the entities it
+    references (owners, amenities, users, places) are resolved with one
+    ``IN`` query per batch, and the valid rows are inserted with a single
+    executemany per table and committed together. Invalid lines never stop
+    the import; they are collected in a per-line error report instead.
+    """
+
+    KINDS = ('places', 'reviews', 'amenities')
+
+    def __init__(self, batch_size=1000, max_errors=1000):
+        """Initialize the importer.
+
+        Args:
+            batch_size (int): Number of rows validated and committed together
+            max_errors (int): Maximum number of line errors kept in the report
+        """
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    def run(self, kind, lines, default_owner_id=None):
+        """Import rows of the given kind.
+
+        Args:
+            kind (str): One of 'places', 'reviews' or 'amenities'
+            lines: Iterable of NDJSON lines (str or bytes)
+            default_owner_id (str, optional): Owner used for places without owner_id
+
+        Returns:
+            dict: Report with processed/inserted/failed counts and line errors
+
+        Raises:
+            ValueError: If kind is not supported
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported import kind: {kind}")
+        process = getattr(self, f'_process_{kind}')
+        self._report = {'kind': kind, 'processed': 0, 'inserted': 0,
+                        'failed': 0, 'errors': [], 'errors_truncated': False}
+        self._default_owner_id = default_owner_id
+        self._seen_amenity_names = set()
+        self._seen_reviews = set()
+
+        batch = []
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            self._report['processed'] += 1
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                self._error(line_no, f'Invalid JSON: {e}')
+                continue
+            if not isinstance(row, dict):
+                self._error(line_no, 'Each line must be a JSON object')
+                continue
+            batch.append((line_no, row))
+            if len(batch) >= self.batch_size:
+                process(batch)
+                batch = []
+        if batch:
+            process(batch)
+
+        report = self._report
+        del self._report
+        report['errors'].sort(key=lambda error: error['line'])
+        return report
+
+    def _error(self, line_no, message):
+        """Record a failed line in the report."""
+        self._report['failed'] += 1
+        if len(self._report['errors']) < self.max_errors:
+            self._report['errors'].append({'line': line_no, 'error': message})
+        else:
+            self._report['errors_truncated'] = True
+
+    @staticmethod
+    def _row_values(obj):
+        """Column values of an unsaved instance, with scalar column defaults applied."""
+        values = {}
+        for column in obj.__table__.columns:
+            value = getattr(obj, column.key)
+            if value is None and column.default is not None and column.default.is_scalar:
+                value = column.default.arg
+            values[column.key] = value
+        return values
+
+    @staticmethod
+    def _existing_ids(model, ids):
+        """Return the subset of ids that exist for the model, in one query."""
+        if not ids:
+            return set()
+        return set(db.session.execute(
+            select(model.id).where(model.id.in_(ids))).scalars())
+
+    def _insert(self, table, rows, line_numbers, link_table=None, links=None):
+        """Insert one validated batch in a single transaction.
+
+        If the batch fails as a whole (e.g. a unique constraint), it is
+        retried row by row so that only the offending lines are reported.
+        """
+        if not rows:
+            return
+        try:
+            db.session.execute(table.insert(), rows)
+            if links:
+                db.session.execute(link_table.insert(), links)
+            db.session.commit()
+            self._report['inserted'] += len(rows)
+            return
+        except SQLAlchemyError:
+            db.session.rollback()
+
+        for row, line_no in zip(rows, line_numbers):
+            row_links = [link for link in links or [] if link['place_id'] == row['id']]
+            try:
+                db.session.execute(table.insert(), [row])
+                if row_links:
+                    db.session.execute(link_table.insert(), row_links)
+                db.session.commit()
+                self._report['inserted'] += 1
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                self._error(line_no, f'Database error: {e.orig if hasattr(e, "orig") else e}')
+
+    def _process_places(self, batch):
+        """Validate and insert a batch of places."""
+        candidates = []
+        for line_no, row in batch:
+            owner_id = row.get('owner_id') or self._default_owner_id
+            missing = [field for field in ('title', 'price', 'latitude', 'longitude')
+                       if row.get(field) is None]
+            if missing:
+                self._error(line_no, f"Missing required field: {missing[0]}")
+                continue
+            if not owner_id:
+                self._error(line_no, 'Missing required field: owner_id')
+                continue
+            amenity_ids = row.get('amenities') or []
+            if not isinstance(amenity_ids, list):
+                self._error(line_no, 'Amenities must be a list')
+                continue
+            try:
+                place = Place(title=row['title'], description=row.get('description', ''),
+                              price=row['price'], latitude=row['latitude'],
+                              longitude=row['longitude'], owner_id=owner_id)
+            except (TypeError, ValueError, AttributeError) as e:
+                self._error(line_no, str(e))
+                continue
+            candidates.append((line_no, place, amenity_ids))
+
+        owners = self._existing_ids(User, {place.owner_id for _, place, _ in candidates})
+        amenities = self._existing_ids(
+            Amenity, {amenity_id for _, _, ids in candidates for amenity_id in ids})
+
+        rows, line_numbers, links = [], [], []
+        for line_no, place, amenity_ids in candidates:
+            if place.owner_id not in owners:
+                self._error(line_no, 'Owner not found')
+                continue
+            unknown = [amenity_id for amenity_id in amenity_ids if amenity_id not in amenities]
+            if unknown:
+                self._error(line_no, f"Amenity {unknown[0]} not found")
+                continue
+            rows.append(self._row_values(place))
+            line_numbers.append(line_no)
+            links.extend({'place_id': place.id, 'amenity_id': amenity_id}
+                         for amenity_id in dict.fromkeys(amenity_ids))
+        self._insert(Place.__table__, rows, line_numbers, place_amenities, links)
+
+    def _process_reviews(self, batch):
+        """Validate and insert a batch of reviews."""
+        candidates = []
+        for line_no, row in batch:
+            missing = [field for field in ('text', 'rating', 'user_id', 'place_id')
+                       if row.get(field) is None]
+            if missing:
+                self._error(line_no, f"Missing required field: {missing[0]}")
+                continue
+            if not isinstance(row['rating'], int) or not 1 <= row['rating'] <= 5:
+                self._error(line_no, 'Rating must be an integer between 1 and 5')
+                continue
+            try:
+                review = Review(text=row['text'], rating=row['rating'],
+                                user_id=row['user_id'], place_id=row['place_id'])
+            except (TypeError, ValueError, AttributeError) as e:
+                self._error(line_no, str(e))
+                continue
+            candidates.append((line_no, review))
+
+        users = self._existing_ids(User, {review.user_id for _, review in candidates})
+        place_ids = {review.place_id for _, review in candidates}
+        place_owners = dict(db.session.execute(
+            select(Place.id, Place.owner_id).where(Place.id.in_(place_ids))
+        ).tuples().all()) if place_ids else {}
+        already_reviewed = set(db.session.execute(
+            select(Review.user_id, Review.place_id).where(
+                Review.place_id.in_(place_ids),
+                Review.user_id.in_(users))
+        ).tuples().all()) if place_ids and users else set()
+
+        rows, line_numbers = [], []
+        for line_no, review in candidates:
+            key = (review.user_id, review.place_id)
+            if review.user_id not in users:
+                self._error(line_no, 'User not found')
+            elif review.place_id not in place_owners:
+                self._error(line_no, 'Place not found')
+            elif place_owners[review.place_id] == review.user_id:
+                self._error(line_no, 'You cannot review your own place.')
+            elif key in already_reviewed or key in self._seen_reviews:
+                self._error(line_no, 'You have already reviewed this place.')
+            else:
+                self._seen_reviews.add(key)
+                rows.append(self._row_values(review))
+                line_numbers.append(line_no)
+        self._insert(Review.__table__, rows, line_numbers)
+
+    def _process_amenities(self, batch):
+        """Validate and insert a batch of amenities."""
+        candidates = []
+        for line_no, row in batch:
+            if not row.get('name'):
+                self._error(line_no, 'Missing required field: name')
+                continue
+            try:
+                amenity = Amenity(name=row['name'])
+            except (TypeError, ValueError, AttributeError) as e:
+                self._error(line_no, str(e))
+                continue
+            candidates.append((line_no, amenity))
+
+        # Names are unique case-insensitively, as in POST /amenities
+        lowered = {amenity.name.lower() for _, amenity in candidates}
+        existing = set(db.session.execute(
+            select(func.lower(Amenity.name)).where(
+                func.lower(Amenity.name).in_(lowered))).scalars()) if lowered else set()
+
+        rows, line_numbers = [], []
+        for line_no, amenity in candidates:
+            name = amenity.name.lower()
+            if name in existing or name in self._seen_amenity_names:
+                self._error(line_no, f'Amenity with name "{amenity.name}" already exists')
+                continue
+            self._seen_amenity_names.add(name)
+            rows.append(self._row_values(amenity))
+            line_numbers.append(line_no)
+        self._insert(Amenity.__table__, rows, line_numbers)
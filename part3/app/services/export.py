@@ -0,0 +1,206 @@
+import csv
+import io
+import json
+import os
+import zlib
+from contextlib import contextmanager
+from datetime import date, datetime
+from sqlalchemy import select
+from app import db
+from app.models.user import User
+from app.models.place import Place
+from app.models.reviews import Review
+from app.models.amenities import Amenity, place_amenities
+
+
+# Tables in dependency order, so a loader can insert them in this order
+EXPORT_TABLES = {
+    'users': User.__table__,
+    'places': Place.__table__,
+    'amenities': Amenity.__table__,
+    'place_amenities': place_amenities,
+    'reviews': Review.__table__,
+}
+
+# Columns that never leave the database
+EXCLUDED_COLUMNS = {
+    'users': {'password'},
+}
+
+FORMATS = ('ndjson', 'csv')
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+
+class DatasetExporter:
+    """Stream whole tables out of the database with constant memory.
+
+    Every export runs inside a single read transaction so that all tables
+    come from the same snapshot, and rows are pulled through a streaming
+    (server-side where the driver supports it) cursor ``chunk_size`` rows
+    at a time. On SQLite the snapshot only stays isolated from concurrent
+    writers when the database runs in WAL mode; in rollback-journal mode
+    writers wait for the export to finish instead.
+    """
+
+    def __init__(self, engine=None, chunk_size=1000):
+        """Initialize the exporter.
+
+        Args:
+            engine: SQLAlchemy engine (defaults to the application's engine)
+            chunk_size (int): Rows fetched per round trip
+        """
+        self.engine = engine if engine is not None else db.engine
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def validate_tables(tables):
+        """Return the requested table names, or all tables when none are given.
+
+        Raises:
+            ValueError: If a table is not exportable
+        """
+        if not tables:
+            return list(EXPORT_TABLES)
+        unknown = [name for name in tables if name not in EXPORT_TABLES]
+        if unknown:
+            raise ValueError(f"Unknown table: {unknown[0]}")
+        return list(tables)
+
+    @contextmanager
+    def snapshot(self):
+        """Open a connection holding one consistent read transaction."""
+        with self.engine.connect() as connection:
+            if connection.dialect.name == 'sqlite':
+                # pysqlite does not emit BEGIN for reads on its own
+                connection.exec_driver_sql('BEGIN')
+            else:
+                connection.execution_options(isolation_level='REPEATABLE READ')
+            try:
+                yield connection
+            finally:
+                connection.rollback()
+
+    def columns(self, table_name):
+        """Exported column names of a table."""
+        excluded = EXCLUDED_COLUMNS.get(table_name, set())
+        return [column.name for column in EXPORT_TABLES[table_name].columns
+                if column.name not in excluded]
+
+    def iter_rows(self, connection, table_name):
+        """Yield the rows of a table as dictionaries."""
+        table = EXPORT_TABLES[table_name]
+        statement = select(*[table.c[name] for name in self.columns(table_name)])
+        result = connection.execution_options(
+            stream_results=True, yield_per=self.chunk_size).execute(statement)
+        try:
+            for row in result:
+                yield dict(row._mapping)
+        finally:
+            result.close()
+
+    def iter_ndjson(self, rows, table_name=None):
+        """Yield NDJSON lines for rows; lines are tagged when table_name is given."""
+        for row in rows:
+            if table_name:
+                row = {'table': table_name, 'data': row}
+            yield json.dumps(row, default=_json_default) + '\n'
+
+    def iter_csv(self, rows, columns):
+        """Yield CSV text for rows, header first, in chunks of chunk_size rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for count, row in enumerate(rows, 1):
+            writer.writerow([_json_default(value) if isinstance(value, (datetime, date))
+                             else value for value in row.values()])
+            if count % self.chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def _format(self, connection, table_name, fmt, tagged=False):
+        rows = self.iter_rows(connection, table_name)
+        if fmt == 'csv':
+            return self.iter_csv(rows, self.columns(table_name))
+        return self.iter_ndjson(rows, table_name if tagged else None)
+
+    def stream(self, fmt='ndjson', tables=None):
+        """Yield an export of one (CSV) or several (NDJSON) tables.
+
+        The snapshot is held for as long as the generator is being consumed.
+
+        Raises:
+            ValueError: If the format or tables are invalid
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        table_names = self.validate_tables(tables)
+        if fmt == 'csv' and len(table_names) != 1:
+            raise ValueError("CSV exports contain exactly one table")
+
+        def generate():
+            with self.snapshot() as connection:
+                for table_name in table_names:
+                    yield from self._format(connection, table_name, fmt,
+                                            tagged=len(table_names) > 1)
+        return generate()
+
+    def export_to_directory(self, directory, fmt='ndjson', tables=None, compress=False):
+        """Write one file per table from a single snapshot.
+
+        Returns:
+            dict: Number of rows written per table
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        table_names = self.validate_tables(tables)
+        os.makedirs(directory, exist_ok=True)
+
+        counts = {}
+        with self.snapshot() as connection:
+            for table_name in table_names:
+                path = os.path.join(directory, f'{table_name}.{fmt}')
+                if compress:
+                    path += '.gz'
+                counter = {'rows': 0}
+                rows = self._counted(self.iter_rows(connection, table_name), counter)
+                if fmt == 'csv':
+                    chunks = self.iter_csv(rows, self.columns(table_name))
+                else:
+                    chunks = self.iter_ndjson(rows)
+                self._write(path, chunks, compress)
+                counts[table_name] = counter['rows']
+        return counts
+
+    @staticmethod
+    def _counted(rows, counter):
+        for row in rows:
+            counter['rows'] += 1
+            yield row
+
+    @staticmethod
+    def _write(path, chunks, compress):
+        """Write text chunks to a plain or gzip-compressed file."""
+        with open(path, 'wb') as handle:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                handle.write(compressor.compress(data) if compressor else data)
+            if compressor:
+                handle.write(compressor.flush())
+
+
+def gzip_stream(chunks, level=6):
+    """Gzip a stream of text chunks on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -1,20 +1,67 @@
+import json
+from datetime import datetime
+from functools import cached_property
 from app.persistence.repository import SQLAlchemyRepository
 from app.persistence.user_repository import UserRepository
 from app.persistence.place_repository import PlaceRepository
 from app.persistence.review_repository import ReviewRepository
 from app.persistence.amenity_repository import AmenityRepository
+from app.persistence.refresh_token_repository import RefreshTokenRepository
+from app.persistence.job_repository import JobRepository
+from app.services.bulk_import import BulkImporter
+from app.services.export import DatasetExporter
+from app.services.seeding import DatabaseSeeder
+from app.services.revocation import get_revocation_store, access_token_lifetime
+from app.services.jobs import get_task_queue
 from app.models.user import User
 from app.models.amenities import Amenity
 from app.models.place import Place
 from app.models.reviews import Review
 
 
+def build_review(review_data):
+    """Validate review data and build an unsaved Review (shared with the async facade)."""
+    # Validate rating is between 1 and 5
+    rating = review_data.get('rating')
+    if not isinstance(rating, int) or rating < 1 or rating > 5:
+        raise ValueError("Rating must be an integer between 1 and 5")
+
+    # Create review with all required data including user_id and place_id
+    return Review(
+        text=review_data.get('text', ''),
+        rating=rating,
+        user_id=review_data['user_id'],
+        place_id=review_data['place_id']
+    )
+
+
 class HBnBFacade:
-    def __init__(self):
-        self.user_repo = UserRepository()  # Use specialized UserRepository
-        self.place_repo = PlaceRepository()  # Use specialized PlaceRepository
-        self.review_repo = ReviewRepository()  # Use specialized ReviewRepository
-        self.amenity_repo = AmenityRepository()  # Use specialized AmenityRepository
+    # Repositories are created on first use, so a facade that only serves
+    # a few kinds of requests never builds the others
+
+    @cached_property
+    def user_repo(self):
+        return UserRepository()  # Use specialized UserRepository
+
+    @cached_property
+    def place_repo(self):
+        return PlaceRepository()  # Use specialized PlaceRepository
+
+    @cached_property
+    def review_repo(self):
+        return ReviewRepository()  # Use specialized ReviewRepository
+
+    @cached_property
+    def amenity_repo(self):
+        return AmenityRepository()  # Use specialized AmenityRepository
+
+    @cached_property
+    def refresh_token_repo(self):
+        return RefreshTokenRepository()
+
+    @cached_property
+    def job_repo(self):
+        return JobRepository()
 
     def create_user(self, user_data):
         """Create new user and store in the repo."""
@@ -50,14 +97,27 @@ class HBnBFacade:
         """Retrieve all users."""
         return self.user_repo.get_all()
 
+    def iter_all_users(self, chunk_size=1000):
+        """Iterate over all users, fetching them in chunks."""
+        return self.user_repo.iter_all(chunk_size)
+
     def update_user(self, user_id, user_data):
         """Update a user's information."""
+        # Tokens carry is_admin, so a role change invalidates existing ones
+        if 'is_admin' in user_data:
+            current_user = self.user_repo.get(user_id)
+            if current_user and bool(user_data['is_admin']) != bool(current_user.is_admin):
+                self.revoke_user_tokens(user_id)
+
         # Handle password update using UserRepository specialized method
         if 'password' in user_data:
             password = user_data.pop('password')
             updated_user = self.user_repo.update_password(user_id, password)
             if not updated_user:
                 return None
+            # A new password logs out every session
+            self.revoke_user_tokens(user_id)
+            self.refresh_token_repo.revoke_for_user(user_id)
             # Continue with other updates if there are any
             if not user_data:  # If only password was being updated
                 return updated_user
@@ -79,6 +139,56 @@ class HBnBFacade:
         """Authenticate a user with email and password."""
         return self.user_repo.authenticate_user(email, password)
     
+    def issue_refresh_token(self, user_id, lifetime):
+        """Start a new refresh token family for a user; returns the opaque token."""
+        token, _ = self.refresh_token_repo.issue(user_id, datetime.utcnow() + lifetime)
+        return token
+
+    def rotate_refresh_token(self, token, lifetime):
+        """Exchange a refresh token for a new one without checking the password.
+        
+        Presenting a token that was already rotated revokes its whole family.
+        
+        Returns:
+            tuple: (user, new_token)
+            
+        Raises:
+            ValueError: If the token is unknown, expired, revoked or reused
+        """
+        record = self.refresh_token_repo.get_by_token(token)
+        if not record:
+            raise ValueError("Invalid refresh token")
+        if record.revoked_at is not None:
+            self.refresh_token_repo.revoke_family(record.family_id)
+            raise ValueError("Refresh token reuse detected")
+        now = datetime.utcnow()
+        if record.expires_at <= now:
+            raise ValueError("Refresh token expired")
+        user = self.user_repo.get(record.user_id)
+        if not user:
+            raise ValueError("Invalid refresh token")
+
+        new_token = self.refresh_token_repo.rotate(record, now + lifetime, now)
+        if new_token is None:
+            # Rotated concurrently by another request with the same token
+            self.refresh_token_repo.revoke_family(record.family_id)
+            raise ValueError("Refresh token reuse detected")
+        return user, new_token
+
+    def revoke_refresh_token(self, token):
+        """Revoke the refresh token family a token belongs to, if it exists."""
+        record = self.refresh_token_repo.get_by_token(token)
+        if record:
+            self.refresh_token_repo.revoke_family(record.family_id)
+
+    def revoke_access_token(self, jti, expires_at):
+        """Revoke a single access token until it expires."""
+        get_revocation_store().revoke_token(jti, expires_at)
+
+    def revoke_user_tokens(self, user_id):
+        """Revoke every access token issued to a user so far."""
+        get_revocation_store().revoke_user(user_id, access_token_lifetime())
+
     def get_users_by_name(self, first_name=None, last_name=None):
         """Search users by name."""
         return self.user_repo.get_users_by_name(first_name, last_name)
@@ -89,7 +199,10 @@ class HBnBFacade:
     
     def toggle_user_admin_status(self, user_id):
         """Toggle admin status for a user."""
-        return self.user_repo.toggle_admin_status(user_id)
+        user = self.user_repo.toggle_admin_status(user_id)
+        if user:
+            self.revoke_user_tokens(user_id)
+        return user
     
     def get_recent_users(self, limit=10):
         """Get recently created users."""
@@ -171,33 +284,49 @@ class HBnBFacade:
         """Retrieve a place by ID, including associated owner and amenities."""
         return self.place_repo.get(place_id)
 
+    def get_place_owner_id(self, place_id):
+        """Return the owner id of a place without loading it, or None."""
+        return self.place_repo.get_owner_id(place_id)
+
     def get_all_places(self):
         """Retrieve all places."""
         return self.place_repo.get_all()
 
-    def update_place(self, place_id, place_data):
-        """Update a place's information."""
+    def iter_all_places(self, chunk_size=1000):
+        """Iterate over all places, fetching them in chunks."""
+        return self.place_repo.iter_all(chunk_size)
+
+    def update_place(self, place_id, place_data, expected_version=None):
+        """Update a place's information.
+
+        Raises VersionConflictError if the place is no longer at
+        ``expected_version`` or changes while the update is applied.
+        """
         place = self.place_repo.get(place_id)
         if not place:
             return None
-        # Note: Owner and amenity relationships will be handled when relationships are implemented
-        # For now, we only validate that referenced entities exist
+        changes = {field: place_data[field]
+                   for field in ['title', 'description', 'price', 'latitude', 'longitude']
+                   if field in place_data}
         if 'owner_id' in place_data:
             owner = self.user_repo.get(place_data['owner_id'])
             if not owner:
                 raise ValueError("Owner not found")
-        
+            changes['owner_id'] = owner.id
+
         if 'amenities' in place_data:
+            amenities = []
             for amenity_id in place_data['amenities']:
                 amenity = self.amenity_repo.get(amenity_id)
                 if not amenity:
                     raise ValueError(f"Amenity {amenity_id} not found")
-        # Update fields directly
-        for field in ['title', 'description', 'price', 'latitude', 'longitude']:
-            if field in place_data:
-                setattr(place, field, place_data[field])
-        # Update the place in the repository
-        return self.place_repo.update(place_id, place_data)
+                amenities.append(amenity)
+            changes['amenities'] = amenities
+            # Link table changes alone do not UPDATE the row; touch it so the
+            # version moves and concurrent amenity edits conflict as well
+            changes['updated_at'] = datetime.utcnow()
+        # Every change goes out in one versioned UPDATE
+        return self.place_repo.update(place_id, changes, expected_version)
     
     def get_places_by_price_range(self, min_price, max_price):
         """Get places within a price range."""
@@ -235,19 +364,7 @@ class HBnBFacade:
         if not place:
             raise ValueError("Place not found")
 
-        # Validate rating is between 1 and 5
-        rating = review_data.get('rating')
-        if not isinstance(rating, int) or rating < 1 or rating > 5:
-            raise ValueError("Rating must be an integer between 1 and 5")
-
-        # Create review with all required data including user_id and place_id
-        review = Review(
-            text=review_data.get('text', ''),
-            rating=rating,
-            user_id=review_data['user_id'],
-            place_id=review_data['place_id']
-        )
-
+        review = build_review(review_data)
         self.review_repo.add(review)
         return review
 
@@ -255,10 +372,22 @@ class HBnBFacade:
         """Retrieve a review by ID."""
         return self.review_repo.get(review_id)
 
+    def user_has_reviewed(self, user_id, place_id):
+        """Check whether a user already reviewed a place."""
+        return self.review_repo.user_has_reviewed(user_id, place_id)
+
+    def get_review_author_id(self, review_id):
+        """Return the author id of a review without loading it, or None."""
+        return self.review_repo.get_owner_id(review_id)
+
     def get_all_reviews(self):
         """Retrieve all reviews."""
         return self.review_repo.get_all()
 
+    def iter_all_reviews(self, chunk_size=1000):
+        """Iterate over all reviews, fetching them in chunks."""
+        return self.review_repo.iter_all(chunk_size)
+
     def get_reviews_by_place(self, place_id):
         """Retrieve all reviews for a specific place."""
         # Validate place exists
@@ -270,46 +399,54 @@ class HBnBFacade:
         # For now, return empty list since we don't have foreign key relationships yet
         return []
 
-    def update_review(self, review_id, review_data):
-        """Update a review's information."""
+    def update_review(self, review_id, review_data, expected_version=None):
+        """Update a review's information.
+
+        Raises VersionConflictError if the review is no longer at
+        ``expected_version`` or changes while the update is applied.
+        """
         review = self.review_repo.get(review_id)
         if not review:
             return None
 
-        # Note: User and place relationships will be handled when relationships are implemented
-        # For now, we only validate that referenced entities exist
+        changes = {}
         if 'user_id' in review_data:
             user = self.user_repo.get(review_data['user_id'])
             if not user:
                 raise ValueError("User not found")
+            changes['user_id'] = user.id
 
         if 'place_id' in review_data:
             place = self.place_repo.get(review_data['place_id'])
             if not place:
                 raise ValueError("Place not found")
+            changes['place_id'] = place.id
 
-        # Update fields directly
         if 'rating' in review_data:
             rating = review_data['rating']
             if not isinstance(rating, int) or rating < 1 or rating > 5:
                 raise ValueError("Rating must be an integer between 1 and 5")
-            review.rating = rating
+            changes['rating'] = rating
 
         if 'text' in review_data:
-            review.text = review_data['text']
-
-        # Save updates the updated_at timestamp
-        review.save()
+            changes['text'] = review_data['text']
 
-        return review
+        # updated_at is bumped by the column's onupdate
+        return self.review_repo.update(review_id, changes, expected_version)
 
     def delete_place(self, place_id):
-        """Delete a place by ID."""
-        return self.place_repo.delete(place_id)
+        """Delete a place (with its reviews and amenity links) by ID."""
+        deleted = self.place_repo.delete(place_id)
+        if deleted:
+            self.enqueue_job('refresh_statistics', dedupe=True)
+        return deleted
 
     def delete_review(self, review_id):
         """Delete a review by ID."""
-        return self.review_repo.delete(review_id)
+        deleted = self.review_repo.delete(review_id)
+        if deleted:
+            self.enqueue_job('refresh_statistics', dedupe=True)
+        return deleted
     
     def get_reviews_by_rating(self, rating):
         """Get reviews with a specific rating."""
@@ -334,3 +471,60 @@ class HBnBFacade:
     def get_review_statistics(self):
         """Get comprehensive review statistics."""
         return self.review_repo.get_rating_statistics()
+
+    def enqueue_job(self, name, payload=None, delay=0, dedupe=False):
+        """Queue a registered background task; returns the job id."""
+        return get_task_queue().enqueue(name, payload, delay=delay, dedupe=dedupe)
+
+    def get_job_statistics(self):
+        """Queue depth, lag and per-task counters of the background job queue."""
+        return get_task_queue().stats()
+
+    def compute_statistics(self):
+        """Compute every admin dashboard statistic (run by the refresh_statistics task)."""
+        return {
+            'users': self.get_user_statistics(),
+            'places': self.get_place_statistics(),
+            'reviews': self.get_review_statistics(),
+            'amenities': self.get_amenity_statistics(),
+        }
+
+    def get_statistics(self, max_age):
+        """Latest statistics snapshot, refreshed in the background when stale.
+        
+        Args:
+            max_age (int): Seconds after which a snapshot is refreshed
+            
+        Returns:
+            tuple: (statistics dict or None if never computed, computed_at)
+        """
+        latest = self.job_repo.latest_result('refresh_statistics')
+        if latest is None or (datetime.utcnow() - latest[1]).total_seconds() > max_age:
+            self.enqueue_job('refresh_statistics', dedupe=True)
+            # Without worker threads the job has already run inline
+            latest = latest or self.job_repo.latest_result('refresh_statistics')
+        if latest is None:
+            return None, None
+        return json.loads(latest[0]), latest[1]
+
+    def bulk_import(self, kind, lines, batch_size=1000, default_owner_id=None):
+        """Import places, reviews or amenities from NDJSON lines in batches."""
+        importer = BulkImporter(batch_size=batch_size)
+        return importer.run(kind, lines, default_owner_id=default_owner_id)
+
+    def seed_dataset(self, dataset, password, batch_size=10000, progress=None):
+        """Bulk-load a SyntheticDataset into empty tables; every user gets ``password``."""
+        template = User(first_name='Seed', last_name='Seed', email='seed@seed.test')
+        template.hash_password(password)
+        seeder = DatabaseSeeder(batch_size=batch_size)
+        return seeder.run(dataset, template.password, progress=progress)
+
+    def export_dataset(self, fmt='ndjson', tables=None, chunk_size=1000):
+        """Stream a snapshot of the dataset as NDJSON or CSV text chunks."""
+        return DatasetExporter(chunk_size=chunk_size).stream(fmt, tables)
+
+    def export_dataset_to_directory(self, directory, fmt='ndjson', tables=None,
+                                    compress=False, chunk_size=1000):
+        """Write a snapshot of the dataset to one file per table."""
+        exporter = DatasetExporter(chunk_size=chunk_size)
+        return exporter.export_to_directory(directory, fmt, tables, compress)
@@ -0,0 +1,282 @@
+import atexit
+import hashlib
+import json
+import os
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+from app.persistence.job_repository import JobRepository
+
+# Registered tasks: name -> (function, max_attempts)
+TASKS = {}
+
+
+def task(name=None, max_attempts=3):
+    """Register a function as a task that can be queued by name.
+
+    The function is called with the job's JSON payload as keyword
+    arguments inside an application context; its return value must be
+    JSON-serializable and is stored as the job result.
+    """
+    def register(func):
+        TASKS[name or func.__name__] = (func, max_attempts)
+        return func
+    return register
+
+
+class TaskQueue:
+    """In-process executor for the persistent ``jobs`` table.
+
+    Worker threads poll for due jobs, run them and retry failures with
+    exponential backoff. Threads start on first use in each process, so
+    the queue keeps working in workers forked from a preloading parent.
+    With no worker threads configured, each job runs inline when it is
+    queued; retries and any backlog are left to ``manage.py run-jobs``.
+    """
+
+    def __init__(self, app, workers=1, poll_interval=1.0, retry_backoff=2.0,
+                 stale_after=600, schedule=None):
+        """Initialize the queue.
+
+        Args:
+            app: Flask application the workers run in
+            workers (int): Worker threads per process (0 = run inline)
+            poll_interval (float): Seconds between polls when idle
+            retry_backoff (float): Delay before the first retry, doubled after each
+            stale_after (int): Seconds after which a running job is assumed lost
+            schedule (dict): {task name: interval in seconds} of periodic tasks
+        """
+        self.app = app
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retry_backoff = retry_backoff
+        self.stale_after = stale_after
+        self.schedule = dict(schedule or {})
+        self.repo = JobRepository()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._pid = None
+        self._next_run = {}
+        self._counters = {}
+
+    # Queueing
+
+    def enqueue(self, name, payload=None, delay=0, dedupe=False):
+        """Queue a registered task.
+
+        Args:
+            name (str): Task name
+            payload (dict): Keyword arguments for the task
+            delay (float): Seconds before the job may start
+            dedupe (bool): Do nothing if the same task and payload is already pending
+
+        Returns:
+            int: ID of the queued (or already pending) job
+        """
+        if name not in TASKS:
+            raise KeyError(f"Unknown task: {name}")
+        encoded = json.dumps(payload or {}, sort_keys=True)
+        dedupe_key = None
+        if dedupe:
+            dedupe_key = name + ':' + hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+        job, created = self.repo.enqueue(
+            name, encoded, run_at=datetime.utcnow() + timedelta(seconds=delay),
+            max_attempts=TASKS[name][1], dedupe_key=dedupe_key)
+        job_id = job.id
+        if created:
+            self._count(name, 'enqueued')
+        if self.workers:
+            self.start()
+            self._wake.set()
+        elif created and not delay:
+            # Only this job: the backlog and retries are left to run-jobs
+            self.run_job(job_id)
+        return job_id
+
+    # Execution
+
+    def _worker_id(self):
+        return f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+
+    def run_pending(self, limit=None):
+        """Run due jobs in the calling thread until none are left.
+
+        Returns:
+            int: Number of jobs run
+        """
+        count = 0
+        worker = self._worker_id()
+        while limit is None or count < limit:
+            job = self.repo.claim_next(worker)
+            if job is None:
+                break
+            self._execute(job)
+            count += 1
+        return count
+
+    def run_job(self, job_id):
+        """Run one pending job in the calling thread.
+
+        Returns:
+            bool: False if the job was not pending (e.g. another worker took it)
+        """
+        job = self.repo.claim(job_id, self._worker_id())
+        if job is None:
+            return False
+        self._execute(job)
+        return True
+
+    def _execute(self, job):
+        name, job_id, attempts = job.name, job.id, job.attempts
+        wait = max(0.0, (job.started_at - job.run_at).total_seconds())
+        entry = TASKS.get(name)
+        if entry is None:
+            self.repo.mark_failed(job_id, f'Unknown task: {name}')
+            self._count(name, 'failed')
+            return
+
+        start = time.perf_counter()
+        try:
+            result = entry[0](**json.loads(job.payload or '{}'))
+            duration = time.perf_counter() - start
+            self.repo.mark_done(job_id, json.dumps(result, default=str))
+            self._count(name, 'completed', wait, duration)
+        except Exception as e:
+            duration = time.perf_counter() - start
+            db.session.rollback()
+            error = f'{type(e).__name__}: {e}'
+            if attempts < job.max_attempts:
+                delay = self.retry_backoff * 2 ** (attempts - 1) * random.uniform(0.8, 1.2)
+                self.repo.mark_failed(job_id, error, datetime.utcnow() + timedelta(seconds=delay))
+                self._count(name, 'retried', wait, duration)
+                current_app.logger.warning('Job %s (%s) failed, retrying in %.1fs: %s',
+                                           job_id, name, delay, error)
+            else:
+                self.repo.mark_failed(job_id, error)
+                self._count(name, 'failed', wait, duration)
+                current_app.logger.exception('Job %s (%s) failed permanently', job_id, name)
+
+    def _count(self, name, outcome, wait=None, duration=None):
+        with self._lock:
+            counters = self._counters.setdefault(name, {
+                'enqueued': 0, 'completed': 0, 'retried': 0, 'failed': 0,
+                'wait_total': 0.0, 'wait_max': 0.0, 'run_total': 0.0, 'run_max': 0.0})
+            counters[outcome] += 1
+            if wait is not None:
+                counters['wait_total'] += wait
+                counters['wait_max'] = max(counters['wait_max'], wait)
+                counters['run_total'] += duration
+                counters['run_max'] = max(counters['run_max'], duration)
+
+    # Worker threads
+
+    def start(self):
+        """Start the worker threads of this process if they are not running."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid() or not self.workers:
+                return
+            # Threads never survive a fork: anything in _threads belongs to the parent
+            self._pid = os.getpid()
+            self._stop = threading.Event()
+            self._wake = threading.Event()
+            self._threads = [
+                threading.Thread(target=self._run, args=(index,),
+                                 name=f'hbnb-jobs-{index}', daemon=True)
+                for index in range(self.workers)]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout=5):
+        """Ask the worker threads to finish their current job and exit."""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join(timeout)
+        self._pid = None
+
+    def _run(self, index):
+        worker = self._worker_id()
+        while not self._stop.is_set():
+            job = None
+            try:
+                with self.app.app_context():
+                    if index == 0:
+                        self._run_schedule()
+                    job = self.repo.claim_next(worker)
+                    if job is not None:
+                        self._execute(job)
+            except SQLAlchemyError:
+                self.app.logger.exception('Job worker could not reach the queue')
+            if job is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def _run_schedule(self):
+        """Queue periodic tasks that are due and recover jobs lost by dead workers."""
+        now = time.monotonic()
+        for name, interval in self.schedule.items():
+            if now >= self._next_run.get(name, 0):
+                self._next_run[name] = now + interval
+                self.enqueue(name, dedupe=True)
+        if now >= self._next_run.get('_requeue_stale', 0):
+            self._next_run['_requeue_stale'] = now + self.stale_after / 2
+            self.repo.requeue_stale(datetime.utcnow() - timedelta(seconds=self.stale_after))
+
+    # Monitoring
+
+    def stats(self):
+        """Queue depth, lag behind schedule and per-task counters of this process."""
+        now = datetime.utcnow()
+        oldest = self.repo.oldest_pending_run_at(now)
+        with self._lock:
+            counters = {}
+            for name, values in self._counters.items():
+                ran = values['completed'] + values['retried'] + values['failed']
+                counters[name] = {
+                    key: values[key] for key in ('enqueued', 'completed', 'retried', 'failed')}
+                counters[name].update({
+                    'avg_wait_ms': round(values['wait_total'] / ran * 1000, 2) if ran else None,
+                    'max_wait_ms': round(values['wait_max'] * 1000, 2),
+                    'avg_run_ms': round(values['run_total'] / ran * 1000, 2) if ran else None,
+                    'max_run_ms': round(values['run_max'] * 1000, 2),
+                })
+        return {
+            'queue': self.repo.count_by_status(),
+            'lag_seconds': round((now - oldest).total_seconds(), 3) if oldest else 0.0,
+            'workers': sum(thread.is_alive() for thread in self._threads)
+            if self._pid == os.getpid() else 0,
+            'tasks': counters,
+        }
+
+
+def get_task_queue():
+    """The current application's task queue."""
+    return current_app.extensions['task_queue']
+
+
+def init_app(app):
+    """Create the application's task queue; worker threads start on first use."""
+    from app.services import tasks  # noqa: F401  (registers the built-in tasks)
+
+    queue = TaskQueue(
+        app,
+        workers=app.config.get('JOBS_WORKERS', 1),
+        poll_interval=app.config.get('JOBS_POLL_INTERVAL', 1.0),
+        retry_backoff=app.config.get('JOBS_RETRY_BACKOFF', 2.0),
+        stale_after=app.config.get('JOBS_STALE_AFTER', 600),
+        schedule=app.config.get('JOBS_SCHEDULE', {}))
+    app.extensions['task_queue'] = queue
+    if queue.workers:
+        # Periodic tasks need running workers even before anything is queued
+        app.before_request(queue.start)
+    atexit.register(queue.stop)
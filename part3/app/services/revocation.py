@@ -0,0 +1,234 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from app.persistence.revoked_token_repository import RevokedTokenRepository
+
+# Rows re-read on every sync, in case ids were committed out of order
+SYNC_OVERLAP = 100
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives; false positives occur
+    at roughly ``error_rate`` while at most ``capacity`` items are stored.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        """Initialize an empty filter.
+
+        Args:
+            capacity (int): Number of items the filter is sized for
+            error_rate (float): Target false positive rate at capacity
+        """
+        self.capacity = max(int(capacity), 1)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: k positions derived from two 64-bit hashes
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        """Add an item; items that already test as present are not counted again."""
+        positions = self._positions(item)
+        if all(self.bits[p >> 3] & (1 << (p & 7)) for p in positions):
+            return
+        for position in positions:
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(item))
+
+
+def _epoch(value):
+    """Naive UTC datetime to a POSIX timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationStore:
+    """In-process view of the ``revoked_tokens`` table.
+
+    Revoked ``jti`` values are kept in a Bloom filter and per-user cutoffs
+    in a dict, so checking a token that was never revoked costs no
+    database round trip. A filter hit is confirmed with one indexed lookup
+    to rule out false positives. New rows are pulled incrementally every
+    ``sync_interval`` seconds; revocations made by this process apply
+    immediately. The filter is rebuilt (dropping expired rows) once it
+    outgrows its capacity.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001, sync_interval=5):
+        """Initialize the store.
+
+        Args:
+            capacity (int): Initial Bloom filter capacity
+            error_rate (float): Bloom filter false positive rate
+            sync_interval (float): Seconds between incremental syncs
+        """
+        self.repo = RevokedTokenRepository()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self._filter = BloomFilter(capacity, error_rate)
+        self._user_cutoffs = {}
+        self._last_id = 0
+        self._synced_at = None
+        self._lock = threading.Lock()
+        self.stats = {'checks': 0, 'filter_hits': 0, 'false_positives': 0,
+                      'revoked': 0, 'syncs': 0, 'rebuilds': 0}
+
+    def _apply(self, bloom, cutoffs, jti, user_id, revoked_before):
+        if jti:
+            bloom.add(jti)
+        if user_id and revoked_before:
+            cutoff = _epoch(revoked_before)
+            if cutoff > cutoffs.get(user_id, 0):
+                cutoffs[user_id] = cutoff
+
+    def _rebuild(self):
+        rows = self.repo.get_since(0)
+        bloom = BloomFilter(max(self.capacity, len(rows) * 2), self.error_rate)
+        cutoffs = {}
+        for _, jti, user_id, revoked_before in rows:
+            self._apply(bloom, cutoffs, jti, user_id, revoked_before)
+        self._filter, self._user_cutoffs = bloom, cutoffs
+        self._last_id = rows[-1][0] if rows else self._last_id
+        self.stats['rebuilds'] += 1
+
+    def sync(self, force=False):
+        """Pull rows added since the last sync, at most every sync_interval."""
+        if not force and self._synced_at is not None \
+                and time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if not force and self._synced_at is not None \
+                    and time.monotonic() - self._synced_at < self.sync_interval:
+                return
+            try:
+                if self._synced_at is None:
+                    self._rebuild()
+                else:
+                    rows = self.repo.get_since(max(0, self._last_id - SYNC_OVERLAP))
+                    # Re-applying overlapping rows is harmless: both the
+                    # filter and the cutoffs are idempotent
+                    for _, jti, user_id, revoked_before in rows:
+                        self._apply(self._filter, self._user_cutoffs,
+                                    jti, user_id, revoked_before)
+                    if rows:
+                        self._last_id = max(self._last_id, rows[-1][0])
+                    if self._filter.count > self._filter.capacity:
+                        self._rebuild()
+                self.stats['syncs'] += 1
+            except SQLAlchemyError:
+                # Keep serving from the last known state; retry next interval
+                current_app.logger.exception('Revocation sync failed')
+            self._synced_at = time.monotonic()
+
+    def is_revoked(self, jwt_payload):
+        """Check an access token against the denylist.
+
+        Args:
+            jwt_payload (dict): Decoded token claims
+
+        Returns:
+            bool: True if the token or all of its user's older tokens are revoked
+        """
+        self.sync()
+        self.stats['checks'] += 1
+        identity = jwt_payload.get(current_app.config.get('JWT_IDENTITY_CLAIM', 'sub'))
+        user_id = identity.get('id') if isinstance(identity, dict) else identity
+        cutoff = self._user_cutoffs.get(user_id)
+        issued_at = jwt_payload.get('iat')
+        if cutoff is not None and issued_at is not None and issued_at < cutoff:
+            return True
+
+        jti = jwt_payload.get('jti')
+        if not jti or jti not in self._filter:
+            return False
+        self.stats['filter_hits'] += 1
+        if self.repo.jti_exists(jti):
+            return True
+        self.stats['false_positives'] += 1
+        return False
+
+    def revoke_token(self, jti, expires_at):
+        """Revoke one access token until it expires.
+
+        Args:
+            jti (str): Token identifier
+            expires_at (datetime): Token expiry (naive UTC)
+        """
+        self.repo.revoke_jti(jti, expires_at)
+        with self._lock:
+            self._filter.add(jti)
+        self.stats['revoked'] += 1
+
+    def revoke_user(self, user_id, token_lifetime):
+        """Revoke every access token a user holds right now.
+
+        The cutoff is rounded up to the next whole second because ``iat``
+        has one-second resolution; a token issued in that same second is
+        revoked too and the client simply logs in again.
+
+        Args:
+            user_id (str): ID of the user
+            token_lifetime (timedelta): Longest access token lifetime
+        """
+        now = datetime.utcnow()
+        revoked_before = now.replace(microsecond=0) + timedelta(seconds=1)
+        self.repo.revoke_user(user_id, revoked_before, now + token_lifetime)
+        with self._lock:
+            self._apply(self._filter, self._user_cutoffs, None, user_id, revoked_before)
+        self.stats['revoked'] += 1
+
+    def purge_expired(self):
+        """Delete rows whose tokens have all expired and rebuild the filter.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        deleted = self.repo.purge_expired()
+        with self._lock:
+            self._rebuild()
+        return deleted
+
+
+def get_revocation_store():
+    """The current application's revocation store."""
+    return current_app.extensions['revocation']
+
+
+def access_token_lifetime():
+    """Longest lifetime of an access token under the current configuration."""
+    expires = current_app.config.get('JWT_ACCESS_TOKEN_EXPIRES')
+    if isinstance(expires, timedelta):
+        return expires
+    if isinstance(expires, (int, float)) and expires is not False:
+        return timedelta(seconds=expires)
+    # Non-expiring tokens: keep revocations for a year
+    return timedelta(days=365)
+
+
+def _token_in_blocklist(jwt_header, jwt_payload):
+    return get_revocation_store().is_revoked(jwt_payload)
+
+
+def init_app(app, jwt_manager):
+    """Create the application's revocation store and hook it into JWT checks."""
+    app.extensions['revocation'] = RevocationStore(
+        capacity=app.config.get('REVOCATION_FILTER_CAPACITY', 100000),
+        error_rate=app.config.get('REVOCATION_FILTER_ERROR_RATE', 0.001),
+        sync_interval=app.config.get('REVOCATION_SYNC_INTERVAL', 5))
+    jwt_manager.token_in_blocklist_loader(_token_in_blocklist)
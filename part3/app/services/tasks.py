@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+from flask import current_app
+from app.services.jobs import task
+
+
+@task(max_attempts=3)
+def refresh_statistics():
+    """Recompute the admin dashboard statistics snapshot."""
+    from app.services import facade
+    return facade.compute_statistics()
+
+
+@task(max_attempts=5)
+def purge_expired_tokens():
+    """Delete expired refresh tokens and revocation rows, and old finished jobs."""
+    from app.services import facade
+    from app.services.revocation import get_revocation_store
+
+    retention = timedelta(days=current_app.config.get('JOBS_RETENTION_DAYS', 7))
+    return {
+        'refresh_tokens': facade.refresh_token_repo.delete_expired(),
+        'revoked_tokens': get_revocation_store().purge_expired(),
+        'jobs': facade.job_repo.purge_finished(datetime.utcnow() - retention),
+    }
@@ -0,0 +1,388 @@
+"""
+Admission control: per-route-class concurrency limits with bounded,
+deadline-aware queues, and per-client token-bucket rate limits
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from flask import current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+
+# Token-issuing endpoints; login runs bcrypt
+AUTH_ENDPOINTS = {'api.auth_login', 'api.auth_refresh'}
+# Collection reads whose cost grows with the size of the dataset
+HEAVY_READ_ENDPOINTS = {
+    'api.users_user_list',
+    'api.amenities_amenity_list',
+    'api.places_place_list',
+    'api.reviews_review_list',
+    'api.reviews_place_review_list',
+    'api.admin_dataset_export',
+    'api.admin_statistics',
+}
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+class Rejected(Exception):
+    """A request was not admitted; carries the status and Retry-After seconds"""
+
+    def __init__(self, status, reason, retry_after):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class _LoopSlot:
+    """
+    Queue entry of a request waiting on an event loop; like
+    threading.Event, set() may be called from any thread
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.future = loop.create_future()
+        self._set = False
+
+    def set(self):
+        self._set = True
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+    def is_set(self):
+        return self._set
+
+
+class AdmissionGate:
+    """
+    At most ``limit`` requests of one route class run at once; up to
+    ``queue_size`` more wait in FIFO order for at most their deadline.
+
+    A request that arrives to a full queue, or whose expected wait (queue
+    position times the recent average service time) already exceeds its
+    deadline, is rejected at once instead of timing out after using a
+    queue slot.
+    """
+
+    def __init__(self, name, limit, queue_size, max_wait):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._active = 0
+        self._service_time = None  # moving average, seconds
+        self._counters = {'admitted': 0, 'queued': 0, 'rejected_queue_full': 0,
+                          'rejected_deadline': 0, 'timed_out': 0}
+        self._max_queue_depth = 0
+        self._wait_total = 0.0
+
+    def expected_wait(self, position):
+        """Seconds until the request at queue ``position`` (0-based) starts"""
+        return (self._service_time or 0.0) * (position + 1) / self.limit
+
+    def _budget(self, budget):
+        return self.max_wait if budget is None else min(budget, self.max_wait)
+
+    def _enqueue(self, budget, make_slot):
+        """
+        Take a free slot (returns None) or join the queue with a new
+        ``make_slot()`` entry, which is returned.
+        Raises: Rejected
+        """
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                self._counters['admitted'] += 1
+                return None
+            position = len(self._waiters)
+            if position >= self.queue_size:
+                self._counters['rejected_queue_full'] += 1
+                raise Rejected(503, 'queue full', self.expected_wait(position))
+            expected = self.expected_wait(position)
+            if expected > budget:
+                self._counters['rejected_deadline'] += 1
+                raise Rejected(503, 'deadline cannot be met', expected)
+            slot = make_slot()
+            self._waiters.append(slot)
+            self._counters['queued'] += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+            return slot
+
+    def _waited(self, slot, start):
+        """Leave the queue after waiting for ``slot``; Raises: Rejected"""
+        with self._lock:
+            self._wait_total += time.perf_counter() - start
+            if not slot.is_set():
+                self._waiters.remove(slot)
+                self._counters['timed_out'] += 1
+                raise Rejected(503, 'timed out in queue', self.expected_wait(len(self._waiters)))
+            # release() handed its slot over: _active already counts us
+            self._counters['admitted'] += 1
+
+    def acquire(self, budget=None):
+        """
+        Take a slot, waiting at most ``budget`` seconds (default max_wait).
+        Raises: Rejected
+        """
+        budget = self._budget(budget)
+        slot = self._enqueue(budget, threading.Event)
+        if slot is not None:
+            start = time.perf_counter()
+            slot.wait(budget)
+            self._waited(slot, start)
+
+    def enqueue(self, loop, budget=None):
+        """
+        acquire() for a request served on the event loop ``loop``: never
+        blocks. Returns None when a slot was free, otherwise the queue
+        entry to pass to wait_async().
+        Raises: Rejected
+        """
+        return self._enqueue(self._budget(budget), lambda: _LoopSlot(loop))
+
+    async def wait_async(self, slot, budget=None):
+        """
+        Wait on the event loop for a queue entry from enqueue()
+        Raises: Rejected
+        """
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(slot.future, self._budget(budget))
+        except asyncio.TimeoutError:
+            pass
+        self._waited(slot, start)
+
+    def abandon(self, slot):
+        """Drop a queue entry whose request ended before it was admitted"""
+        with self._lock:
+            if slot.is_set():
+                self._hand_over()
+            else:
+                self._waiters.remove(slot)
+
+    def _hand_over(self):
+        """Pass a freed slot to the oldest waiter; caller holds _lock"""
+        if self._waiters:
+            self._waiters.popleft().set()
+        else:
+            self._active -= 1
+
+    def release(self, service_time):
+        """Free a slot, passing it straight to the oldest waiter if any"""
+        with self._lock:
+            if self._service_time is None:
+                self._service_time = service_time
+            else:
+                self._service_time += 0.2 * (service_time - self._service_time)
+            self._hand_over()
+
+    def stats(self):
+        with self._lock:
+            queued = self._counters['queued']
+            return {
+                'limit': self.limit,
+                'queue_size': self.queue_size,
+                'active': self._active,
+                'queue_depth': len(self._waiters),
+                'max_queue_depth': self._max_queue_depth,
+                'avg_queue_wait_ms': round(self._wait_total / queued * 1000, 2) if queued else None,
+                'avg_service_ms': round(self._service_time * 1000, 2)
+                if self._service_time is not None else None,
+                **self._counters,
+            }
+
+
+class RateLimiter:
+    """
+    Token bucket per client: ``rate`` requests per second on average,
+    bursts of up to ``burst``. Buckets of the least recently seen clients
+    are dropped beyond ``max_clients``.
+    """
+
+    def __init__(self, rate, burst, max_clients=100000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()  # key -> (tokens, last refill)
+        self.limited = 0
+
+    def consume(self, key, cost=1.0):
+        """
+        Take ``cost`` tokens from the client's bucket.
+        Raises: Rejected (429) when the bucket is empty
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < cost:
+                self._buckets[key] = (tokens, now)
+                self.limited += 1
+                raise Rejected(429, 'rate limit exceeded', (cost - tokens) / self.rate)
+            self._buckets[key] = (tokens - cost, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'rate': self.rate, 'burst': self.burst,
+                    'clients': len(self._buckets), 'rejected': self.limited}
+
+
+class AdmissionController:
+    """
+    Gates and rate limiter of one process, applied in before_request
+    """
+
+    def __init__(self, limits, rate=0, burst=0):
+        self.gates = {name: AdmissionGate(name, *limit) for name, limit in limits.items()}
+        self.rate_limiter = RateLimiter(rate, burst or rate) if rate else None
+
+    def stats(self):
+        return {
+            'classes': {name: gate.stats() for name, gate in self.gates.items()},
+            'rate_limit': self.rate_limiter.stats() if self.rate_limiter else None,
+        }
+
+
+def get_admission_controller():
+    """The current application's admission controller, or None if disabled"""
+    return current_app.extensions.get('admission')
+
+
+def route_class(endpoint, method):
+    """
+    Route class of a request: 'auth', 'heavy', 'write', or None (not gated)
+    """
+    if endpoint in AUTH_ENDPOINTS:
+        return 'auth'
+    if method in WRITE_METHODS:
+        return 'write'
+    if endpoint in HEAVY_READ_ENDPOINTS:
+        return 'heavy'
+    return None
+
+
+def client_key():
+    """
+    Rate limit key: the authenticated user, otherwise the client address
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except (JWTExtendedException, PyJWTError):
+        identity = None  # the endpoint itself reports a bad token
+    if isinstance(identity, dict) and identity.get('id'):
+        return 'user:' + identity['id']
+    return 'addr:' + (request.remote_addr or '')
+
+
+def request_budget():
+    """
+    Seconds the client is willing to wait, from an X-Request-Timeout header
+    """
+    try:
+        return max(0.0, float(request.headers['X-Request-Timeout']))
+    except (KeyError, ValueError):
+        return None
+
+
+def _reject(error):
+    response = jsonify({'error': 'Too many requests' if error.status == 429
+                        else 'Server is overloaded, retry later',
+                        'reason': error.reason})
+    response.status_code = error.status
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+
+def _admit():
+    controller = get_admission_controller()
+    if controller is None:
+        return None
+    name = route_class(request.endpoint, request.method)
+    # A batch sub-request already runs inside the batch's 'write' slot, but
+    # still pays its own rate limit token and takes the slot of any other
+    # class (auth, heavy), so batching cannot get around either limit
+    if request.environ.get('hbnb.batch') and name == 'write':
+        name = None
+    try:
+        if controller.rate_limiter is not None and (request.endpoint or '').startswith('api.'):
+            controller.rate_limiter.consume(client_key())
+        gate = controller.gates.get(name)
+        if gate is None:
+            return None
+        loop = request.environ.get('hbnb.loop')
+        if loop is None:
+            gate.acquire(request_budget())
+        else:
+            # Native ASGI routes run these hooks in asgiref's single sync
+            # thread: they queue without blocking it, see wait_for_slot
+            slot = gate.enqueue(loop, request_budget())
+            if slot is not None:
+                request.environ['hbnb.admission_queued'] = (gate, slot)
+                return None
+        # Kept in the environ: batch sub-requests share ``g`` with their parent
+        request.environ['hbnb.admission'] = (gate, time.perf_counter())
+    except Rejected as e:
+        return _reject(e)
+    return None
+
+
+async def wait_for_slot():
+    """
+    Wait on the event loop for the slot a native ASGI request was queued
+    for in _admit. Returns the 503 response if it timed out, else None.
+    """
+    queued = request.environ.get('hbnb.admission_queued')
+    if queued is None:
+        return None
+    gate, slot = queued
+    try:
+        await gate.wait_async(slot, request_budget())
+    except Rejected as e:
+        request.environ.pop('hbnb.admission_queued')
+        return _reject(e)
+    request.environ.pop('hbnb.admission_queued')
+    request.environ['hbnb.admission'] = (gate, time.perf_counter())
+    return None
+
+
+def _release(exc=None):
+    queued = request.environ.pop('hbnb.admission_queued', None)
+    if queued is not None:
+        # Ended (error, cancellation) while still in the queue
+        gate, slot = queued
+        gate.abandon(slot)
+    admitted = request.environ.pop('hbnb.admission', None)
+    if admitted is not None:
+        gate, start = admitted
+        gate.release(time.perf_counter() - start)
+
+
+def init_app(app):
+    """
+    Create the admission controller and register its request hooks.
+
+    Limits are per process: with several workers, each one admits up to
+    the configured number of requests per class.
+    """
+    if not app.config.get('ADMISSION_CONTROL_ENABLED', True):
+        return
+    app.extensions['admission'] = AdmissionController(
+        app.config.get('ADMISSION_LIMITS', {}),
+        rate=app.config.get('RATE_LIMIT_PER_SECOND', 0),
+        burst=app.config.get('RATE_LIMIT_BURST', 0))
+    app.before_request(_admit)
+    app.teardown_request(_release)
@@ -0,0 +1,158 @@
+"""
+Precomputed OpenAPI (Swagger 2.0) document, served from memory
+"""
+
+import hashlib
+import json
+import os
+import threading
+from flask import current_app, request
+
+from app.utils.compression import choose_encoding, compress_bytes, supported_encodings
+
+SPEC_ENDPOINT = 'api.specs'
+SPEC_CACHE_CONTROL = 'no-cache'
+
+_lock = threading.Lock()
+
+
+class SpecDocument:
+    """
+    Serialized spec with its SHA-256 and lazily built compressed variants
+    """
+
+    def __init__(self, body, source):
+        self.body = body
+        self.digest = hashlib.sha256(body).hexdigest()
+        self.source = source  # 'live' or the file it was loaded from
+        self._variants = {}
+
+    def encoded(self, encoding, config):
+        """Body compressed with ``encoding``, compressed once per process"""
+        if encoding not in self._variants:
+            self._variants[encoding] = compress_bytes(self.body, encoding, config)
+        return self._variants[encoding]
+
+
+def serialize_spec(schema):
+    """
+    Canonical JSON for a spec dict, so equal specs have equal hashes
+    """
+    return json.dumps(schema, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def build_spec(app):
+    """
+    Generate the spec from the live namespaces and models.
+    Raises: RuntimeError if flask_restx could not generate it
+    """
+    from app.api.v1 import api
+
+    with app.test_request_context():
+        schema = api.__schema__
+    if 'error' in schema:
+        raise RuntimeError(f"Cannot generate the API spec: {schema['error']}")
+    return SpecDocument(serialize_spec(schema), 'live')
+
+
+def default_spec_path(app):
+    return app.config.get('API_SPEC_PATH') or os.path.join(app.instance_path, 'swagger.json')
+
+
+def write_spec(document, path):
+    """
+    Write the spec and a ``<path>.sha256`` file (sha256sum format) atomically
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    for target, data in ((path, document.body),
+                         (path + '.sha256',
+                          f'{document.digest}  {os.path.basename(path)}\n'.encode('ascii'))):
+        temporary = target + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, target)
+
+
+def load_spec(path):
+    """
+    Read a spec written by write_spec.
+    Raises: OSError if missing, ValueError if it does not match its hash
+    """
+    with open(path, 'rb') as f:
+        document = SpecDocument(f.read(), path)
+    with open(path + '.sha256', encoding='ascii') as f:
+        expected = f.read().split()[0]
+    if expected != document.digest:
+        raise ValueError(f'{path} does not match {path}.sha256')
+    return document
+
+
+def get_spec(app=None):
+    """
+    The spec served by this process: a prebuilt file when one exists
+    (except in debug mode, where models change often), otherwise built
+    from the live models on first use
+    """
+    app = app or current_app._get_current_object()
+    document = app.extensions.get('api_spec')
+    if document is not None:
+        return document
+    with _lock:
+        document = app.extensions.get('api_spec')
+        if document is None:
+            path = default_spec_path(app)
+            if not app.debug and os.path.exists(path):
+                try:
+                    document = load_spec(path)
+                except (OSError, ValueError) as e:
+                    app.logger.warning('Ignoring prebuilt API spec: %s', e)
+            if document is None:
+                document = build_spec(app)
+            app.extensions['api_spec'] = document
+    return document
+
+
+def validate_spec(app):
+    """
+    Check that a prebuilt spec matches the live models; on mismatch log
+    an error and serve the live spec instead.
+    Returns: True if the served spec matches the models
+    """
+    document = get_spec(app)
+    if document.source == 'live':
+        return True
+    live = build_spec(app)
+    if live.digest == document.digest:
+        return True
+    app.logger.error('Prebuilt API spec %s is stale (sha256 %s, models give %s); '
+                     'serving the live spec. Run manage.py build-spec.',
+                     document.source, document.digest[:12], live.digest[:12])
+    app.extensions['api_spec'] = live
+    return False
+
+
+def serve_spec():
+    """Replacement for flask_restx's spec view: the cached document, conditional and compressed"""
+    document = get_spec()
+    config = current_app.config
+    encoding = None
+    if config.get('COMPRESS_ENABLED', False):
+        encoding = choose_encoding(supported_encodings())
+
+    body = document.encoded(encoding, config) if encoding else document.body
+    response = current_app.response_class(body, mimetype='application/json')
+    # Every encoding is a different representation with its own tag
+    response.set_etag(document.digest + (f'.{encoding}' if encoding else ''))
+    response.headers['Cache-Control'] = SPEC_CACHE_CONTROL
+    response.vary.add('Accept-Encoding')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    return response.make_conditional(request)
+
+
+def init_app(app):
+    """
+    Serve /api/v1/swagger.json from the precomputed document
+    """
+    if SPEC_ENDPOINT in app.view_functions:
+        app.view_functions[SPEC_ENDPOINT] = serve_spec
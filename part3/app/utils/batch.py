@@ -0,0 +1,167 @@
+"""
+In-process execution of batched API sub-requests
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, request
+from werkzeug.test import EnvironBuilder
+
+from app import db
+
+ALLOWED_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+READ_METHODS = {'GET'}
+# Request headers copied from the batch request onto every sub-request
+FORWARDED_HEADERS = ('Authorization', 'Accept', 'Accept-Language')
+# Response headers worth returning to the client
+RETURNED_HEADERS = ('ETag', 'Location', 'Retry-After')
+
+
+class BatchError(Exception):
+    """Raised when a sub-request is malformed and cannot be dispatched"""
+    pass
+
+
+def normalize_sub_request(item, prefix):
+    """
+    Validate one sub-request and return (method, path, body)
+    """
+    if not isinstance(item, dict):
+        raise BatchError('Each sub-request must be an object')
+    method = str(item.get('method', 'GET')).upper()
+    if method not in ALLOWED_METHODS:
+        raise BatchError(f'Unsupported method: {method}')
+    path = item.get('path')
+    if not path or not isinstance(path, str) or not path.startswith('/'):
+        raise BatchError('Path must be an absolute path such as /places/<id>')
+    if not path.startswith(prefix + '/'):
+        path = prefix + path
+    if path.split('?')[0].rstrip('/') == prefix + '/batch':
+        raise BatchError('Nested batch requests are not allowed')
+    return method, path, item.get('body')
+
+
+def _build_environ(method, path, body, headers):
+    path, _, query_string = path.partition('?')
+    builder = EnvironBuilder(
+        path=path,
+        query_string=query_string,
+        method=method,
+        base_url=request.host_url,
+        headers=headers,
+        json=body if body is not None and method not in READ_METHODS else None,
+    )
+    try:
+        environ = builder.get_environ()
+    finally:
+        builder.close()
+    environ['REMOTE_ADDR'] = request.remote_addr or ''
+    # The outer batch response is compressed once as a whole
+    environ['hbnb.skip_compression'] = True
+    environ['hbnb.batch'] = True
+    return environ
+
+
+def _decode_body(response):
+    data = response.get_data(as_text=True)
+    if not data:
+        return None
+    if response.mimetype == 'application/json':
+        return json.loads(data)
+    if response.mimetype == 'application/x-ndjson':
+        return [json.loads(line) for line in data.splitlines() if line]
+    return data
+
+
+def _run(app, environ):
+    """
+    Dispatch one sub-request in the current application context and
+    return its result as a plain dict
+    """
+    try:
+        with app.request_context(environ):
+            response = app.full_dispatch_request()
+            result = {
+                'status': response.status_code,
+                'headers': {name: response.headers[name] for name in RETURNED_HEADERS
+                            if name in response.headers},
+                'body': _decode_body(response),
+            }
+            response.close()
+            return result
+    except Exception as e:
+        app.logger.exception('Batch sub-request failed')
+        db.session.rollback()
+        return {'status': 500, 'headers': {}, 'body': {'error': str(e)}}
+
+
+def _run_isolated(app, environ):
+    """
+    Dispatch a read sub-request on a worker thread with its own
+    application context and therefore its own database session
+    """
+    with app.app_context():
+        return _run(app, environ)
+
+
+def execute_batch(items, parallel=True):
+    """
+    Run sub-requests in order and return one result per item.
+
+    Every sub-request gets the forwarded headers, Authorization included,
+    and verifies the token itself. Writes and single reads share the
+    caller's application context and so its database session. Runs of
+    consecutive GETs are dispatched concurrently on a small thread pool
+    when ``parallel`` is set, each with its own application context and
+    read session, since a session is not thread safe.
+    """
+    app = current_app._get_current_object()
+    blueprint = app.blueprints.get(request.blueprint)
+    prefix = (blueprint.url_prefix or '') if blueprint else ''
+    headers = {name: request.headers[name] for name in FORWARDED_HEADERS
+               if name in request.headers}
+    executor = app.extensions.get('batch_executor')
+
+    prepared = []
+    for item in items:
+        try:
+            method, path, body = normalize_sub_request(item, prefix)
+            prepared.append((method, _build_environ(method, path, body, headers)))
+        except BatchError as e:
+            prepared.append((None, {'status': 400, 'headers': {}, 'body': {'error': str(e)}}))
+
+    results = [None] * len(prepared)
+    index = 0
+    while index < len(prepared):
+        method, payload = prepared[index]
+        if method is None:
+            results[index] = payload
+            index += 1
+            continue
+
+        # Collect a run of consecutive valid reads
+        end = index
+        while end < len(prepared) and prepared[end][0] in READ_METHODS:
+            end += 1
+
+        if parallel and executor is not None and end - index > 1:
+            futures = [executor.submit(_run_isolated, app, prepared[i][1])
+                       for i in range(index, end)]
+            for offset, future in enumerate(futures):
+                results[index + offset] = future.result()
+            index = end
+        else:
+            results[index] = _run(app, payload)
+            index += 1
+    return results
+
+
+def init_app(app):
+    """
+    Create the application's thread pool for concurrent GET sub-requests
+    from BATCH_MAX_WORKERS (none below 2). Threads start on first use.
+    """
+    max_workers = app.config.get('BATCH_MAX_WORKERS', 4)
+    if max_workers > 1:
+        app.extensions['batch_executor'] = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='batch')
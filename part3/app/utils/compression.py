@@ -0,0 +1,169 @@
+"""
+Content negotiation and on-the-fly compression of API responses
+"""
+
+import gzip
+import threading
+import time
+import zlib
+from flask import current_app, request
+
+from app.utils.timing import record_timing
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'text/javascript',
+    'text/css',
+    'text/csv',
+    'text/html',
+    'text/plain',
+    'image/svg+xml',
+}
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def supported_encodings():
+    """
+    Encodings this process can produce, in order of preference
+    """
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def choose_encoding(available=None):
+    """
+    Pick the best encoding accepted by the client for the current request.
+    Returns: 'br', 'gzip' or None (identity)
+    """
+    available = available or supported_encodings()
+    best, best_quality = None, 0
+    for encoding in available:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _record(encoding, bytes_in, bytes_out, cpu_seconds):
+    with _stats_lock:
+        entry = _stats.setdefault(encoding, {
+            'responses': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_seconds': 0.0
+        })
+        entry['responses'] += 1
+        entry['bytes_in'] += bytes_in
+        entry['bytes_out'] += bytes_out
+        entry['cpu_seconds'] += cpu_seconds
+
+
+def compression_stats():
+    """
+    Return cumulative per-encoding counters: responses, bytes in/out and CPU time
+    """
+    with _stats_lock:
+        return {encoding: dict(entry) for encoding, entry in _stats.items()}
+
+
+def compress_bytes(data, encoding, config):
+    """
+    Compress a whole body with the latency-oriented levels from config
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY'])
+    return gzip.compress(data, compresslevel=config['COMPRESS_GZIP_LEVEL'], mtime=0)
+
+
+def _compress_stream(chunks, encoding, config):
+    """
+    Compress a streamed body chunk by chunk, flushing after every chunk
+    so the client keeps receiving data incrementally
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESS_BROTLI_QUALITY'])
+        compress, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(config['COMPRESS_GZIP_LEVEL'], zlib.DEFLATED, 31)
+        compress = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)  # noqa: E731
+        finish = compressor.flush
+
+    bytes_in = bytes_out = 0
+    cpu = 0.0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        start = time.thread_time()
+        out = compress(chunk) + flush()
+        cpu += time.thread_time() - start
+        bytes_in += len(chunk)
+        bytes_out += len(out)
+        if out:
+            yield out
+    start = time.thread_time()
+    out = finish()
+    cpu += time.thread_time() - start
+    bytes_out += len(out)
+    _record(encoding, bytes_in, bytes_out, cpu)
+    if out:
+        yield out
+
+
+def _should_compress(response):
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if request.method == 'HEAD' or 'Content-Encoding' in response.headers:
+        return False
+    if response.direct_passthrough or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return False
+    if request.environ.get('hbnb.skip_compression'):
+        return False
+    return True
+
+
+def _compress_response(response):
+    config = current_app.config
+    if not config.get('COMPRESS_ENABLED', False) or not _should_compress(response):
+        return response
+
+    # The representation depends on Accept-Encoding even when we send identity
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding, config)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < config['COMPRESS_MIN_SIZE']:
+            return response
+        start = time.thread_time()
+        compressed = compress_bytes(data, encoding, config)
+        cpu = time.thread_time() - start
+        if len(compressed) >= len(data):
+            return response
+        response.set_data(compressed)
+        _record(encoding, len(data), len(compressed), cpu)
+        record_timing('compress', cpu, f'{encoding} {len(data)}->{len(compressed)}B')
+
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes differ from the identity ones
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_app(app):
+    """
+    Register the response compression hook
+    """
+    app.after_request(_compress_response)
@@ -0,0 +1,43 @@
+"""
+Optimistic concurrency helpers: version ETags and If-Match preconditions
+"""
+
+from flask import request
+
+
+def version_etag(obj):
+    """
+    ETag header for a versioned model instance
+    """
+    return {'ETag': f'"{obj.version}"'}
+
+
+def requested_version():
+    """
+    Version the client based its update on, from the If-Match header.
+    Weak tags are accepted too, since compressed responses weaken the ETag.
+    Returns: int, or None if there is no precondition (no header, or '*')
+    Raises: ValueError if the header does not name a version
+    """
+    if 'If-Match' not in request.headers or request.if_match.star_tag:
+        return None
+    tags = request.if_match.as_set(include_weak=True)
+    if len(tags) != 1:
+        raise ValueError('If-Match must contain exactly one version')
+    tag = tags.pop()
+    if not tag.isdigit():
+        raise ValueError('If-Match must contain a version ETag')
+    return int(tag)
+
+
+def version_conflict(resource, error):
+    """
+    409 response for a VersionConflictError, with the current ETag
+    """
+    body = {'error': f'{resource} was modified by another request; '
+                     'reload it and retry',
+            'current_version': error.current_version}
+    headers = {}
+    if error.current_version is not None:
+        headers['ETag'] = f'"{error.current_version}"'
+    return body, 409, headers
@@ -0,0 +1,114 @@
+"""
+Cache of already verified JWTs, so repeated tokens skip signature checks
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+from flask_jwt_extended import JWTManager
+
+from app.utils.timing import record_timing
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of decoded claims keyed by the SHA-256 digest of the
+    encoded token. Entries expire with the token's ``exp`` claim.
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(encoded_token):
+        return hashlib.sha256(encoded_token.encode('utf-8')).digest()
+
+    def get(self, encoded_token, now=None):
+        """
+        Return a copy of the cached claims, or None if absent or expired
+        """
+        key = self.digest(encoded_token)
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                claims, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(claims)
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, encoded_token, claims):
+        if self.maxsize <= 0:
+            return
+        expires_at = claims.get('exp')
+        key = self.digest(encoded_token)
+        with self._lock:
+            self._entries[key] = (copy.deepcopy(claims), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop every entry; called when a signing key is retired
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'maxsize': self.maxsize,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager that remembers tokens it has already verified.
+
+    Only plain decodes are cached: tokens checked against a CSRF value or
+    decoded with ``allow_expired`` always take the full verification path,
+    as do tokens whose cached entry has expired (so they fail exactly as
+    before). Revocation and user lookups still run on every request, and
+    the cache is cleared whenever a signing key is retired.
+    """
+
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor)
+        app.extensions['jwt_token_cache'] = VerifiedTokenCache(
+            app.config.get('JWT_CACHE_SIZE', 10000))
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        start = time.perf_counter()
+        cache = current_app.extensions['jwt_token_cache']
+        cacheable = cache.maxsize > 0 and csrf_value is None and not allow_expired
+
+        if cacheable:
+            keys = current_app.extensions.get('jwt_keys')
+            if keys is not None and hasattr(keys, 'published_keys'):
+                # Notices keys retired since the last request, which clears the cache
+                keys.published_keys()
+            claims = cache.get(encoded_token)
+            if claims is not None:
+                record_timing('jwt', time.perf_counter() - start, 'cached')
+                return claims
+
+        try:
+            claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        finally:
+            record_timing('jwt', time.perf_counter() - start, 'verified')
+        if cacheable:
+            cache.put(encoded_token, claims)
+        return claims
+
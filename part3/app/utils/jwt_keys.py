@@ -0,0 +1,360 @@
+"""
+Asymmetric JWT signing keys identified by ``kid``, with overlapping rotation
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+import jwt as pyjwt
+from flask import current_app, g, jsonify
+from flask_jwt_extended.config import config as jwt_config
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+ASYMMETRIC_ALGORITHMS = ('EdDSA', 'RS256')
+INDEX_FILE = 'keyset.json'
+
+
+def generate_private_key(algorithm):
+    """
+    New private key for EdDSA (Ed25519) or RS256 (RSA 2048)
+    """
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+    if algorithm == 'EdDSA':
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == 'RS256':
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    raise ValueError(f'Unsupported signing algorithm: {algorithm}')
+
+
+def public_jwk(key):
+    """
+    Public JWK (RFC 7517) of a signing key
+    """
+    algorithm = pyjwt.get_algorithm_by_name(key['alg'])
+    jwk = algorithm.to_jwk(key['public_key'], as_dict=True)
+    jwk.update({'kid': key['kid'], 'alg': key['alg'], 'use': 'sig'})
+    return jwk
+
+
+class KeySet:
+    """
+    Private signing keys kept as ``<kid>.pem`` files next to a keyset.json
+    index, shared by every worker that can read the directory.
+
+    Each key has a ``not_before`` (when it starts signing) and, once a
+    successor exists, an ``expires_at`` (when it stops being published).
+    A rotation publishes the new key ``publish_ahead`` seconds before it
+    signs anything, so verifiers caching the JWKS pick it up first, and
+    keeps the old key published for ``overlap`` seconds so tokens it
+    signed stay valid until they expire.
+    """
+
+    def __init__(self, directory, refresh_interval=30):
+        self.directory = directory
+        self.refresh_interval = refresh_interval
+        self._keys = []
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._published_kids = frozenset()
+        self._retire_callbacks = []
+
+    @property
+    def index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    @contextmanager
+    def _exclusive(self):
+        """
+        Serialize writers across processes sharing the directory
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        with open(os.path.join(self.directory, '.lock'), 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as handle:
+                return json.load(handle)['keys']
+        except FileNotFoundError:
+            return []
+
+    def _write_index(self, entries):
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump({'keys': entries}, handle, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def load(self):
+        """
+        (Re)load the index and private keys from disk
+        """
+        from cryptography.hazmat.primitives import serialization
+
+        keys = []
+        for entry in self._read_index():
+            with open(os.path.join(self.directory, f"{entry['kid']}.pem"), 'rb') as handle:
+                private_key = serialization.load_pem_private_key(handle.read(), password=None)
+            keys.append({**entry, 'private_key': private_key,
+                         'public_key': private_key.public_key()})
+        keys.sort(key=lambda key: key['not_before'])
+        try:
+            mtime = os.stat(self.index_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        with self._lock:
+            self._keys = keys
+            self._mtime = mtime
+            self._checked_at = time.monotonic()
+        return keys
+
+    def _refresh(self):
+        """
+        Pick up rotations made by other processes, at most every refresh_interval
+        """
+        if time.monotonic() - self._checked_at < self.refresh_interval:
+            return
+        try:
+            mtime = os.stat(self.index_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self._mtime:
+            self.load()
+        else:
+            self._checked_at = time.monotonic()
+
+    def keys(self):
+        self._refresh()
+        return list(self._keys)
+
+    def on_retire(self, callback):
+        """
+        Call ``callback()`` whenever a key stops being published, e.g. to
+        forget tokens that were verified with it
+        """
+        self._retire_callbacks.append(callback)
+
+    def published_keys(self, now=None):
+        """
+        Keys verifiers should accept: everything not yet past its expiry
+        """
+        now = time.time() if now is None else now
+        published = [key for key in self.keys()
+                     if key.get('expires_at') is None or key['expires_at'] > now]
+        kids = frozenset(key['kid'] for key in published)
+        if kids != self._published_kids:
+            retired = self._published_kids - kids
+            self._published_kids = kids
+            if retired:
+                for callback in self._retire_callbacks:
+                    callback()
+        return published
+
+    def signing_key(self, now=None):
+        """
+        The newest published key whose not_before has passed
+        """
+        now = time.time() if now is None else now
+        active = [key for key in self.published_keys(now) if key['not_before'] <= now]
+        if not active:
+            raise RuntimeError('No active JWT signing key; run "manage.py rotate-keys"')
+        return active[-1]
+
+    def public_key(self, kid):
+        """
+        Public key for a ``kid``, re-reading the index once if it is unknown
+        """
+        for refresh in (False, True):
+            if refresh:
+                self.load()
+            for key in self.published_keys():
+                if key['kid'] == kid:
+                    return key['public_key']
+        return None
+
+    def jwks(self):
+        return {'keys': [public_jwk(key) for key in self.published_keys()]}
+
+    def rotate(self, algorithm='EdDSA', overlap=3600, publish_ahead=0, now=None,
+               only_if_empty=False):
+        """
+        Add a new signing key and schedule the current one for retirement.
+
+        Args:
+            algorithm (str): 'EdDSA' or 'RS256'
+            overlap (int): Seconds the previous key stays published after
+                the new key starts signing (at least the access token lifetime)
+            publish_ahead (int): Seconds the new key is published before it
+                starts signing (at least the verifiers' JWKS cache lifetime)
+            only_if_empty (bool): Do nothing if the key set already has keys
+
+        Returns:
+            dict: Index entry of the new key, or None if nothing was created
+        """
+        from cryptography.hazmat.primitives import serialization
+
+        now = time.time() if now is None else now
+        private_key = generate_private_key(algorithm)
+        kid = time.strftime('%Y%m%d%H%M%S', time.gmtime(now)) + '-' + secrets.token_hex(4)
+        entry = {'kid': kid, 'alg': algorithm, 'created_at': now,
+                 'not_before': now + publish_ahead, 'expires_at': None}
+
+        with self._exclusive():
+            entries = self._read_index()
+            if entries and only_if_empty:
+                self.load()
+                return None
+            for previous in entries:
+                if previous.get('expires_at') is None:
+                    previous['expires_at'] = entry['not_before'] + overlap
+
+            pem = private_key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption())
+            fd = os.open(os.path.join(self.directory, f'{kid}.pem'),
+                         os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(pem)
+
+            # Forget keys that are no longer published
+            kept = []
+            for previous in entries:
+                if previous['expires_at'] is not None and previous['expires_at'] <= now:
+                    try:
+                        os.remove(os.path.join(self.directory, f"{previous['kid']}.pem"))
+                    except FileNotFoundError:
+                        pass
+                else:
+                    kept.append(previous)
+            self._write_index(kept + [entry])
+        self.load()
+        return entry
+
+    def ensure_signing_key(self, algorithm):
+        """
+        Create a first key when the directory holds none
+        """
+        self.rotate(algorithm, only_if_empty=True)
+
+
+class RemoteKeySet:
+    """
+    Verification-only key source for nodes that do not issue tokens:
+    public keys are fetched from the issuer's JWKS and cached in process.
+    """
+
+    def __init__(self, jwks_url, lifespan=300):
+        self.client = pyjwt.PyJWKClient(jwks_url, cache_keys=True, lifespan=lifespan)
+
+    def public_key(self, kid):
+        try:
+            return self.client.get_signing_key(kid).key
+        except pyjwt.PyJWKClientError:
+            return None
+
+    def signing_key(self, now=None):
+        raise RuntimeError('This node only verifies tokens (JWT_JWKS_URL is set)')
+
+
+def get_keys():
+    return current_app.extensions.get('jwt_keys')
+
+
+def default_overlap(app):
+    """
+    Seconds an old key must stay published: the access token lifetime plus leeway
+    """
+    expires = app.config.get('JWT_ACCESS_TOKEN_EXPIRES')
+    if hasattr(expires, 'total_seconds'):
+        lifetime = expires.total_seconds()
+    elif isinstance(expires, (int, float)) and expires is not False:
+        lifetime = expires
+    else:
+        lifetime = 15 * 60
+    return int(lifetime + app.config.get('JWT_DECODE_LEEWAY', 0) or 0)
+
+
+def _additional_headers(identity):
+    keys = get_keys()
+    if keys is None:
+        return {}
+    key = g._jwt_signing_key = keys.signing_key()
+    return {'kid': key['kid'], 'alg': key['alg']}
+
+
+def _encode_key(identity):
+    keys = get_keys()
+    if keys is None:
+        return jwt_config.encode_key
+    # Use the key chosen for the headers, even if a rotation happened since
+    key = g.pop('_jwt_signing_key', None) or keys.signing_key()
+    return key['private_key']
+
+
+def _decode_key(jwt_header, jwt_payload):
+    keys = get_keys()
+    if keys is None:
+        return jwt_config.decode_key
+    kid = jwt_header.get('kid')
+    key = keys.public_key(kid) if kid else None
+    if key is None:
+        raise pyjwt.InvalidTokenError('Unknown signing key')
+    return key
+
+
+def _jwks():
+    response = jsonify(get_keys().jwks())
+    max_age = current_app.config.get('JWT_JWKS_MAX_AGE', 300)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+def init_app(app, jwt_manager):
+    """
+    Sign with the key set when JWT_ALGORITHM is EdDSA or RS256.
+
+    Issuers keep private keys in JWT_KEYS_DIR (default: instance/jwt_keys)
+    and publish /.well-known/jwks.json; nodes with JWT_JWKS_URL only verify.
+    With HS256 the shared secret is used as before.
+    """
+    jwt_manager.additional_headers_loader(_additional_headers)
+    jwt_manager.encode_key_loader(_encode_key)
+    jwt_manager.decode_key_loader(_decode_key)
+
+    if app.config.get('JWT_ALGORITHM', 'HS256') not in ASYMMETRIC_ALGORITHMS:
+        return
+    if not app.config.get('JWT_DECODE_ALGORITHMS'):
+        app.config['JWT_DECODE_ALGORITHMS'] = list(ASYMMETRIC_ALGORITHMS)
+
+    jwks_url = app.config.get('JWT_JWKS_URL')
+    if jwks_url:
+        app.extensions['jwt_keys'] = RemoteKeySet(
+            jwks_url, app.config.get('JWT_JWKS_MAX_AGE', 300))
+        return
+
+    directory = app.config.get('JWT_KEYS_DIR') or os.path.join(app.instance_path, 'jwt_keys')
+    keys = KeySet(directory, app.config.get('JWT_KEYS_REFRESH_INTERVAL', 30))
+    if app.config.get('JWT_KEYS_AUTO_CREATE', True):
+        keys.ensure_signing_key(app.config['JWT_ALGORITHM'])
+    else:
+        keys.load()
+    cache = app.extensions.get('jwt_token_cache')
+    if cache is not None:
+        keys.on_retire(cache.clear)
+    app.extensions['jwt_keys'] = keys
+    app.add_url_rule('/.well-known/jwks.json', 'jwks', _jwks)
@@ -0,0 +1,365 @@
+"""
+Always-on metrics in the Prometheus text exposition format (GET /metrics)
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from flask import Response, current_app, request
+from sqlalchemy.exc import SQLAlchemyError
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    Base of the metric types: a name, help text and label names, with one
+    series per tuple of label values (in ``labelnames`` order)
+    """
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def header(self):
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+    def render(self):
+        with self._lock:
+            series = sorted(self._series.items())
+        lines = self.header()
+        for labels, value in series:
+            lines.append(f'{self.name}{_format_labels(self.labelnames, labels)} '
+                         f'{_format_value(value)}')
+        return lines
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def dec(self, labels=(), amount=1):
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    """
+    Fixed buckets; ``observe`` is one bisect and a few increments under a lock
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Counts per bucket (the last one is +Inf) followed by the sum
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, labels=()):
+        """Observe the duration of the ``with`` block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(labels, time.perf_counter() - start)
+
+    def render(self):
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self._series.items())
+        lines = self.header()
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), values):
+                cumulative += count
+                le = 'le="{}"'.format(_format_value(bound))
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} '
+                             f'{cumulative}')
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {_format_value(values[-1])}')
+            lines.append(f'{self.name}_count{label_text} {cumulative}')
+        return lines
+
+
+class Registry:
+    """
+    Metrics updated as things happen, plus collectors that read the
+    current state of other components when /metrics is scraped
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, func):
+        """
+        Register ``func(app)`` returning [(name, kind, help, [(labels dict, value)])]
+        """
+        self.collectors.append(func)
+        return func
+
+    def render(self, app):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collect in self.collectors:
+            try:
+                families = collect(app)
+            except (SQLAlchemyError, RuntimeError) as e:
+                app.logger.warning('Metrics collector %s failed: %s', collect.__name__, e)
+                continue
+            for name, kind, documentation, samples in families:
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in samples:
+                    lines.append(f'{name}{_format_labels(labels.keys(), labels.values())} '
+                                 f'{_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+REQUEST_DURATION = REGISTRY.register(Histogram(
+    'hbnb_http_request_duration_seconds', 'Time to produce a response.',
+    ('namespace', 'method', 'route')))
+RESPONSES = REGISTRY.register(Counter(
+    'hbnb_http_responses_total', 'Responses by status code.',
+    ('namespace', 'method', 'route', 'status')))
+IN_FLIGHT = REGISTRY.register(Gauge(
+    'hbnb_http_requests_in_flight', 'Requests being handled.'))
+REPOSITORY_DURATION = REGISTRY.register(Histogram(
+    'hbnb_repository_duration_seconds', 'Time spent in repository methods.',
+    ('repository', 'method')))
+PASSWORD_HASH_DURATION = REGISTRY.register(Histogram(
+    'hbnb_password_hash_duration_seconds', 'bcrypt time as seen by the request.',
+    ('operation',), buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0)))
+
+_route_labels = {}
+
+
+def _route(rule):
+    """(namespace, route) labels of a URL rule; cached, rules are few"""
+    labels = _route_labels.get(rule)
+    if labels is None:
+        parts = rule.split('/')
+        namespace = parts[3] if rule.startswith('/api/v1/') and len(parts) > 3 else ''
+        labels = _route_labels[rule] = (namespace, rule)
+    return labels
+
+
+def _start_request():
+    # The start time lives in the environ: one proxy lookup per hook
+    request.environ['hbnb.metrics_start'] = time.perf_counter()
+    IN_FLIGHT.inc()
+
+
+def _observe_response(response):
+    req = request._get_current_object()
+    start = req.environ.get('hbnb.metrics_start')
+    if start is not None:
+        rule = req.url_rule
+        namespace, route = _route(rule.rule) if rule is not None else ('', 'unmatched')
+        REQUEST_DURATION.observe((namespace, req.method, route), time.perf_counter() - start)
+        RESPONSES.inc((namespace, req.method, route, str(response.status_code)))
+    return response
+
+
+def _finish_request(exc=None):
+    if request.environ.pop('hbnb.metrics_start', None) is not None:
+        IN_FLIGHT.dec()
+
+
+# Collectors for state kept by other components
+
+@REGISTRY.collector
+def _collect_process(app):
+    return [('hbnb_process_info', 'gauge', 'Process answering this scrape.',
+             [({'pid': os.getpid()}, 1)])]
+
+
+@REGISTRY.collector
+def _collect_password_hasher(app):
+    hasher = app.extensions.get('password_hasher')
+    if hasher is None:
+        return []
+    stats = hasher.stats()
+    return [
+        ('hbnb_password_hasher_pending', 'gauge', 'Hashes queued or running.',
+         [({}, stats['pending'])]),
+        ('hbnb_password_hasher_operations_total', 'counter', 'Pool outcomes.',
+         [({'outcome': key}, stats[key]) for key in ('completed', 'rejected', 'timeouts')]),
+    ]
+
+
+@REGISTRY.collector
+def _collect_caches(app):
+    families = []
+    cache = app.extensions.get('jwt_token_cache')
+    if cache is not None:
+        stats = cache.stats()
+        families += [
+            ('hbnb_jwt_cache_lookups_total', 'counter', 'Verified-token cache lookups.',
+             [({'result': 'hit'}, stats['hits']), ({'result': 'miss'}, stats['misses'])]),
+            ('hbnb_jwt_cache_hit_ratio', 'gauge', 'Verified-token cache hit ratio.',
+             [({}, stats['hits'] / (stats['hits'] + stats['misses'])
+               if stats['hits'] + stats['misses'] else 0.0)]),
+            ('hbnb_jwt_cache_entries', 'gauge', 'Verified tokens cached.',
+             [({}, stats['size'])]),
+        ]
+    store = app.extensions.get('revocation')
+    if store is not None:
+        stats = dict(store.stats)
+        families += [
+            ('hbnb_revocation_checks_total', 'counter', 'Access tokens checked for revocation.',
+             [({}, stats['checks'])]),
+            ('hbnb_revocation_filter_hits_total', 'counter',
+             'Checks the Bloom filter could not answer (looked up in the database).',
+             [({}, stats['filter_hits'])]),
+            ('hbnb_revocation_false_positives_total', 'counter',
+             'Database lookups that found no revoked token.',
+             [({}, stats['false_positives'])]),
+            ('hbnb_revocation_filter_ratio', 'gauge',
+             'Share of checks answered from memory.',
+             [({}, 1 - stats['filter_hits'] / stats['checks'] if stats['checks'] else 0.0)]),
+        ]
+    from app.utils.compression import compression_stats
+    compression = compression_stats()
+    if compression:
+        families.append(
+            ('hbnb_compression_bytes_total', 'counter', 'Response bytes before and after compression.',
+             [({'encoding': encoding, 'direction': direction}, stats[f'bytes_{direction}'])
+              for encoding, stats in compression.items() for direction in ('in', 'out')]))
+    return families
+
+
+@REGISTRY.collector
+def _collect_db_pool(app):
+    from app import db
+
+    samples = {'size': [], 'checked_out': [], 'overflow': []}
+    with app.app_context():
+        engines = db.engines
+        for bind, engine in engines.items():
+            pool = engine.pool
+            labels = {'bind': bind or 'default', 'pool': type(pool).__name__}
+            # Only queue-based pools keep these counters
+            for key, method in (('size', 'size'), ('checked_out', 'checkedout'),
+                                ('overflow', 'overflow')):
+                if hasattr(pool, method):
+                    samples[key].append((labels, getattr(pool, method)()))
+    return [(f'hbnb_db_pool_{key}', 'gauge', f'Connection pool {key.replace("_", " ")}.', values)
+            for key, values in samples.items() if values]
+
+
+@REGISTRY.collector
+def _collect_jobs(app):
+    queue = app.extensions.get('task_queue')
+    if queue is None:
+        return []
+    with app.app_context():
+        stats = queue.stats()
+    families = [
+        ('hbnb_jobs', 'gauge', 'Jobs in the queue by status.',
+         [({'status': status}, count) for status, count in stats['queue'].items()]),
+        ('hbnb_jobs_lag_seconds', 'gauge', 'Age of the oldest due pending job.',
+         [({}, stats['lag_seconds'])]),
+    ]
+    families.append(
+        ('hbnb_jobs_processed_total', 'counter', 'Jobs handled by this process.',
+         [({'task': task, 'outcome': outcome}, counters[outcome])
+          for task, counters in stats['tasks'].items()
+          for outcome in ('enqueued', 'completed', 'retried', 'failed')]))
+    return families
+
+
+@REGISTRY.collector
+def _collect_admission(app):
+    controller = app.extensions.get('admission')
+    if controller is None:
+        return []
+    stats = controller.stats()
+    classes = stats['classes']
+    families = [
+        ('hbnb_admission_active', 'gauge', 'Admitted requests running per route class.',
+         [({'class': name}, s['active']) for name, s in classes.items()]),
+        ('hbnb_admission_queue_depth', 'gauge', 'Requests waiting per route class.',
+         [({'class': name}, s['queue_depth']) for name, s in classes.items()]),
+        ('hbnb_admission_rejections_total', 'counter', 'Requests turned away.',
+         [({'class': name, 'reason': reason}, s[reason]) for name, s in classes.items()
+          for reason in ('rejected_queue_full', 'rejected_deadline', 'timed_out')]),
+    ]
+    if stats['rate_limit']:
+        families.append(('hbnb_rate_limited_total', 'counter', 'Requests over the rate limit.',
+                         [({}, stats['rate_limit']['rejected'])]))
+    return families
+
+
+def metrics():
+    """Serve the registry in the Prometheus text format"""
+    body = REGISTRY.render(current_app._get_current_object())
+    response = Response(body, content_type=CONTENT_TYPE)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def init_app(app):
+    """
+    Register GET /metrics and the request hooks.
+
+    Must be initialised before the other request hooks so rejected
+    requests are measured too and the latency includes compression.
+    Values are per process: each worker of a multi-process server
+    reports its own (see hbnb_process_info).
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    app.before_request(_start_request)
+    app.after_request(_observe_response)
+    app.teardown_request(_finish_request)
+    app.add_url_rule('/metrics', 'metrics', metrics)
@@ -0,0 +1,194 @@
+"""
+Bcrypt hashing and verification on a bounded process pool
+"""
+
+import atexit
+import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+from flask import current_app, has_app_context
+
+from app.utils.metrics import PASSWORD_HASH_DURATION
+from app.utils.timing import timed
+
+DEFAULT_LOG_ROUNDS = 12
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full and the request should be shed"""
+
+    def __init__(self, message='Password hashing capacity exceeded', retry_after=1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """
+    Run bcrypt in worker processes so that request threads only wait on a
+    future instead of burning CPU, and refuse new work once ``max_pending``
+    operations are queued or running.
+
+    Workers are started with forkserver (or spawn), which re-imports the
+    entry script: scripts that hash passwords need an
+    ``if __name__ == '__main__':`` guard, as with any multiprocessing user.
+    """
+
+    def __init__(self, pool_size, max_pending, timeout):
+        self.pool_size = pool_size
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stats = {'completed': 0, 'rejected': 0, 'timeouts': 0}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # Never fork a process that may already run server threads
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() \
+                    else 'spawn'
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context(method))
+            return self._executor
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+            self._stats['completed'] += 1
+
+    def run(self, func, *args):
+        """
+        Call ``func(*args)`` in the pool and wait for the result.
+        Runs inline when the pool is disabled (pool_size 0).
+        """
+        if not self.pool_size:
+            return func(*args)
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats['rejected'] += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+        executor = self._get_executor()
+        try:
+            future = executor.submit(func, *args)
+        except Exception:
+            self._release()
+            self._discard(executor)
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PasswordHasherBusy('Password hashing timed out')
+
+    def _discard(self, executor):
+        """Forget a pool whose workers died so the next call starts a new one"""
+        with self._lock:
+            if self._executor is executor and getattr(executor, '_broken', False):
+                self._executor = None
+
+    def stats(self):
+        """
+        Pool size, current queue depth and lifetime counters
+        """
+        with self._lock:
+            return {'pool_size': self.pool_size, 'max_pending': self.max_pending,
+                    'pending': self._pending, **self._stats}
+
+    def after_fork(self):
+        """
+        Drop the pool handle inherited from a preloading parent process;
+        the child starts its own workers on first use
+        """
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = 0
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_inline = PasswordHasher(pool_size=0, max_pending=0, timeout=None)
+
+
+def get_hasher():
+    """
+    The application's hasher; inline when no application is set up
+    """
+    if has_app_context():
+        return current_app.extensions.get('password_hasher', _inline)
+    return _inline
+
+
+def _to_bytes(value):
+    return value.encode('utf-8') if isinstance(value, str) else value
+
+
+def _prepare(password):
+    """
+    Encode the password the way flask-bcrypt does, so existing hashes verify
+    """
+    password = _to_bytes(password)
+    if has_app_context() and current_app.config.get('BCRYPT_HANDLE_LONG_PASSWORDS'):
+        password = _to_bytes(hashlib.sha256(password).hexdigest())
+    return password
+
+
+def hash_password(password):
+    """
+    Return the bcrypt hash of ``password`` at the configured cost factor
+    """
+    if not password:
+        raise ValueError("Password cannot be empty")
+    rounds = DEFAULT_LOG_ROUNDS
+    prefix = b'2b'
+    if has_app_context():
+        rounds = current_app.config.get('BCRYPT_LOG_ROUNDS', DEFAULT_LOG_ROUNDS)
+        prefix = _to_bytes(current_app.config.get('BCRYPT_HASH_PREFIX', '2b'))
+    salt = bcrypt.gensalt(rounds=rounds, prefix=prefix)
+    with timed('bcrypt', 'hash'), PASSWORD_HASH_DURATION.time(('hash',)):
+        return get_hasher().run(bcrypt.hashpw, _prepare(password), salt).decode('utf-8')
+
+
+def check_password(pw_hash, password):
+    """
+    Compare ``password`` with a stored hash in constant time.
+    The cost factor is read from the hash, so older hashes keep verifying.
+    """
+    pw_hash = _to_bytes(pw_hash)
+    with timed('bcrypt', 'verify'), PASSWORD_HASH_DURATION.time(('verify',)):
+        candidate = get_hasher().run(bcrypt.hashpw, _prepare(password), pw_hash)
+    return hmac.compare_digest(candidate, pw_hash)
+
+
+def init_app(app):
+    """
+    Create the application's hasher from BCRYPT_POOL_SIZE, BCRYPT_MAX_PENDING
+    and BCRYPT_TIMEOUT. Worker processes are started on first use.
+    """
+    pool_size = app.config.get('BCRYPT_POOL_SIZE')
+    if pool_size is None:
+        pool_size = os.cpu_count() or 1
+    max_pending = app.config.get('BCRYPT_MAX_PENDING') or pool_size * 8
+    hasher = PasswordHasher(pool_size, max_pending, app.config.get('BCRYPT_TIMEOUT', 5))
+    app.extensions['password_hasher'] = hasher
+    atexit.register(hasher.shutdown)
@@ -0,0 +1,200 @@
+"""
+On-demand profiling of single requests with cProfile, stored with the
+SQL they ran and listed under /api/v1/admin/profiles
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from flask import current_app, request
+from flask_jwt_extended import verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+
+from app.utils.query_stats import capture_statements
+from app.utils.rbac import get_identity
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ARG = '_profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+TOP_FUNCTIONS = 40
+
+_PROFILE_ID = re.compile(r'^\d{8}T\d{6}-[0-9a-f]{8}$')
+
+# One profiler at a time per process: profilers cannot be nested, and
+# from Python 3.12 only one can be active in the whole interpreter
+_active = threading.Lock()
+
+
+def profile_dir(app=None):
+    app = app or current_app
+    return app.config.get('PROFILING_DIR') or os.path.join(app.instance_path, 'profiles')
+
+
+def _requested():
+    """'flag' for an admin asking for a profile, 'sample' when sampled, else None"""
+    if request.headers.get(PROFILE_HEADER) == '1' or request.args.get(PROFILE_ARG) == '1':
+        try:
+            verify_jwt_in_request(optional=True)
+            if get_identity()[2]:
+                return 'flag'
+        except (JWTExtendedException, PyJWTError):
+            pass  # the endpoint itself reports a bad token
+    rate = current_app.config.get('PROFILING_SAMPLE_RATE', 0.0)
+    if rate and random.random() < rate:
+        return 'sample'
+    return None
+
+
+def _start_profile():
+    # Batch sub-requests run inside their parent's profile; native ASGI
+    # routes interleave other requests on the event loop
+    if request.environ.get('hbnb.batch') or request.environ.get('hbnb.asgi'):
+        return
+    trigger = _requested()
+    if trigger is None or not _active.acquire(blocking=False):
+        return
+    profiler = cProfile.Profile()
+    # Kept in the environ: batch sub-requests share ``g`` with their parent
+    request.environ['hbnb.profile'] = (profiler, trigger, time.perf_counter(),
+                                       capture_statements())
+    profiler.enable()
+
+
+def _stop_profile():
+    """Disable the request's profiler; returns its state or None"""
+    state = request.environ.pop('hbnb.profile', None)
+    if state is not None:
+        state[0].disable()
+        _active.release()
+    return state
+
+
+def _top_functions(profiler):
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+    return stream.getvalue()
+
+
+def _save_profile(response):
+    state = _stop_profile()
+    if state is None:
+        return response
+    profiler, trigger, start, query_stats = state
+    duration = time.perf_counter() - start
+    now = datetime.now(timezone.utc)
+    profile_id = f'{now:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}'
+    current_user = get_identity()[0] if trigger == 'flag' else {}
+    statements = query_stats.statements or []
+    metadata = {
+        'id': profile_id,
+        'created_at': now.isoformat(),
+        'trigger': trigger,
+        'user_id': current_user.get('id'),
+        'pid': os.getpid(),
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': response.status_code,
+        'duration_ms': round(duration * 1000, 3),
+        'sql': {
+            'count': len(statements),
+            'duration_ms': round(sum(seconds for _, seconds in statements) * 1000, 3),
+            'statements': [{'statement': statement, 'duration_ms': round(seconds * 1000, 3)}
+                           for statement, seconds in statements],
+        },
+        'top_functions': _top_functions(profiler),
+    }
+
+    directory = profile_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(directory, profile_id + '.prof'))
+        with open(os.path.join(directory, profile_id + '.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=1)
+        _prune(directory, current_app.config.get('PROFILING_MAX_PROFILES', 100))
+    except OSError as e:
+        current_app.logger.warning('Could not store profile %s: %s', profile_id, e)
+        return response
+    response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
+
+
+def _discard_profile(exc=None):
+    # after_request did not run (unhandled error while finishing the response)
+    _stop_profile()
+
+
+def _prune(directory, keep):
+    """Delete the oldest profiles beyond ``keep``"""
+    ids = sorted(name[:-5] for name in os.listdir(directory) if name.endswith('.json'))
+    for profile_id in ids[:max(0, len(ids) - keep)]:
+        for suffix in ('.json', '.prof'):
+            try:
+                os.remove(os.path.join(directory, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def list_profiles():
+    """Summaries of the stored profiles, newest first"""
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in sorted(os.listdir(directory), reverse=True):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            continue  # removed or being written meanwhile
+        metadata['sql'] = {key: metadata['sql'][key] for key in ('count', 'duration_ms')}
+        metadata.pop('top_functions', None)
+        profiles.append(metadata)
+    return profiles
+
+
+def profile_path(profile_id, suffix):
+    """
+    Path of a stored profile file ('.json' or '.prof'), or None if there is no such profile
+    """
+    if not _PROFILE_ID.match(profile_id):
+        return None
+    path = os.path.join(profile_dir(), profile_id + suffix)
+    return path if os.path.exists(path) else None
+
+
+def load_profile(profile_id):
+    """Full metadata of a profile (SQL and top functions), or None"""
+    path = profile_path(profile_id, '.json')
+    if path is None:
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def init_app(app):
+    """
+    Register the profiling hooks. Nothing is registered unless
+    PROFILING_ENABLED is set, so a disabled profiler costs nothing.
+
+    Enabled, a request is profiled when an admin sends ``X-Profile: 1``
+    (or ``?_profile=1``), or at random for a PROFILING_SAMPLE_RATE share
+    of all requests. The response carries the id of the stored profile.
+    """
+    if not app.config.get('PROFILING_ENABLED', False):
+        return
+    app.before_request(_start_profile)
+    app.after_request(_save_profile)
+    app.teardown_request(_discard_profile)
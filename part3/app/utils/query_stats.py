@@ -0,0 +1,129 @@
+"""
+Per-request SQL instrumentation: query count, database time and
+detection of statements repeated within one request (N+1 patterns)
+"""
+
+import re
+import time
+from collections import Counter
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.timing import record_timing
+
+# Collapse expanded IN lists and literals so one loop of lookups is one shape
+_IN_LIST = re.compile(r'\(\s*(?:\?|%\(\w+\)s|%s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|:\w+))+\s*\)')
+_NUMBER = re.compile(r'\b\d+\b')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SPACE = re.compile(r'\s+')
+
+_listening = False
+
+
+class QueryStats:
+    """Queries run while handling one request"""
+
+    __slots__ = ('count', 'duration', 'shapes', 'statements')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.statements = None  # (statement, seconds) list while captured
+
+    def repeated(self, threshold):
+        """Statement shapes run more than ``threshold`` times, most frequent first"""
+        return [(shape, count) for shape, count in self.shapes.most_common()
+                if count > threshold]
+
+
+def statement_shape(statement):
+    """
+    Normalize a SQL statement so executions that differ only in their
+    parameters compare equal
+    """
+    shape = _IN_LIST.sub('(?)', statement)
+    shape = _STRING.sub('?', shape)
+    shape = _NUMBER.sub('?', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+def get_query_stats():
+    """
+    Stats of the current request, or None outside a request
+    """
+    if not has_request_context():
+        return None
+    return g.get('_query_stats')
+
+
+def capture_statements():
+    """
+    Also keep the text and duration of every further statement of the
+    current request (parameters are not kept). Returns the request's stats.
+    """
+    stats = g.get('_query_stats')
+    if stats is None:
+        stats = g._query_stats = QueryStats()
+    stats.statements = []
+    return stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and current_app.config.get('SQL_INSTRUMENTATION_ENABLED', True):
+        conn.info.setdefault('hbnb_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('hbnb_query_start')
+    if not starts or not has_request_context():
+        return
+    duration = time.perf_counter() - starts.pop()
+    stats = g.get('_query_stats')
+    if stats is None:
+        stats = g._query_stats = QueryStats()
+    stats.count += 1
+    stats.duration += duration
+    stats.shapes[statement_shape(statement)] += 1
+    if stats.statements is not None:
+        stats.statements.append((statement, duration))
+    record_timing('db', duration, f'{stats.count} queries')
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None:
+        starts = connection.info.get('hbnb_query_start')
+        if starts:
+            starts.pop()
+
+
+def _warn_repeated_queries(response):
+    stats = g.get('_query_stats')
+    if stats is None:
+        return response
+    threshold = current_app.config.get('SQL_REPEATED_QUERY_THRESHOLD', 10)
+    for shape, count in stats.repeated(threshold):
+        current_app.logger.warning(
+            'Possible N+1: statement ran %d times in %s %s (%d queries, %.1f ms in total): %s',
+            count, request.method, request.path, stats.count, stats.duration * 1000,
+            shape[:300])
+    return response
+
+
+def init_app(app):
+    """
+    Attach the engine event hooks (once per process; they apply to every
+    engine, including the async ones) and the N+1 check after each request
+    """
+    global _listening
+    if not app.config.get('SQL_INSTRUMENTATION_ENABLED', True):
+        return
+    if not _listening:
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+        _listening = True
+    app.after_request(_warn_repeated_queries)
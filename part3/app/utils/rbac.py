@@ -3,9 +3,29 @@ Role-Based Access Control (RBAC) utilities and decorators
 """
 
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, request
 from flask_jwt_extended import get_jwt_identity, get_jwt, jwt_required
 
+def _request_cache():
+    """
+    Per-request memo. Kept in the WSGI environ rather than ``g`` because
+    batched sub-requests share one application context.
+    """
+    return request.environ.setdefault('hbnb.rbac', {})
+
+def get_identity():
+    """
+    Identity, claims and admin flag of the current token, parsed once per request
+    Returns: (current_user, jwt_claims, is_admin)
+    """
+    cache = _request_cache()
+    if 'identity' not in cache:
+        current_user = get_jwt_identity() or {}
+        jwt_claims = get_jwt()
+        is_admin = bool(current_user.get('is_admin', False) or jwt_claims.get('is_admin', False))
+        cache['identity'] = (current_user, jwt_claims, is_admin)
+    return cache['identity']
+
 def admin_required(f):
     """
     Decorator that requires admin privileges.
@@ -13,11 +33,8 @@ def admin_required(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        current_user = get_jwt_identity()
-        jwt_claims = get_jwt()
-        
         # Check if user has admin privileges
-        is_admin = current_user.get('is_admin', False) or jwt_claims.get('is_admin', False)
+        _, _, is_admin = get_identity()
         
         if not is_admin:
             return {'error': 'Admin privileges required'}, 403
@@ -30,27 +47,46 @@ def check_admin_or_owner(resource_owner_id):
     Check if current user is admin or owner of resource
     Returns: (is_authorized, current_user, is_admin)
     """
-    current_user = get_jwt_identity()
-    jwt_claims = get_jwt()
-    
-    is_admin = current_user.get('is_admin', False) or jwt_claims.get('is_admin', False)
+    current_user, _, is_admin = get_identity()
     is_owner = current_user.get('id') == resource_owner_id
     
     is_authorized = is_admin or is_owner
     
     return is_authorized, current_user, is_admin
 
+def get_resource_owner_id(kind, resource_id, lookup):
+    """
+    Owner id of a resource, resolved once per request with ``lookup``
+    (a single-column projection such as facade.get_place_owner_id).
+    Returns: owner id, or None if the resource does not exist
+    """
+    owners = _request_cache().setdefault('owners', {})
+    key = (kind, resource_id)
+    if key not in owners:
+        owners[key] = lookup(resource_id)
+    return owners[key]
+
+def check_resource_access(kind, resource_id, lookup):
+    """
+    Check if current user is admin or owner of a resource without loading it.
+    Returns: (owner_id, is_authorized, is_admin); owner_id is None if not found
+    """
+    owner_id = get_resource_owner_id(kind, resource_id, lookup)
+    if owner_id is None:
+        return None, False, False
+    is_authorized, _, is_admin = check_admin_or_owner(owner_id)
+    return owner_id, is_authorized, is_admin
+
 def get_current_user_info():
     """
     Get comprehensive current user information from JWT
     Returns: dict with user_id, is_admin, and other claims
     """
-    current_user = get_jwt_identity()
-    jwt_claims = get_jwt()
+    current_user, jwt_claims, is_admin = get_identity()
     
     return {
         'user_id': current_user.get('id'),
-        'is_admin': current_user.get('is_admin', False) or jwt_claims.get('is_admin', False),
+        'is_admin': is_admin,
         'identity': current_user,
         'claims': jwt_claims
     }
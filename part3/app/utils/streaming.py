@@ -0,0 +1,101 @@
+"""
+Streaming response helpers for large collections
+"""
+
+import json
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+JSON_MIMETYPE = 'application/json'
+
+# Flush encoded rows to the WSGI server once this many bytes are buffered
+FLUSH_THRESHOLD = 64 * 1024
+
+
+def requested_stream_format():
+    """
+    Decide whether the client asked for a streamed collection.
+    Returns: 'ndjson', 'json' or None (regular buffered response)
+    """
+    stream = request.args.get('stream', '').lower()
+    if stream == 'ndjson':
+        return 'ndjson'
+    if stream in ('1', 'true', 'json'):
+        return 'json'
+
+    # An explicit Accept header opts into NDJSON; */* keeps plain JSON
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE])
+    if best == NDJSON_MIMETYPE:
+        return 'ndjson'
+    return None
+
+
+def coalesce_chunks(chunks):
+    """
+    Coalesce many small encoded chunks into writes of ~FLUSH_THRESHOLD bytes
+    """
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= FLUSH_THRESHOLD:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_json_array(items, serializer):
+    """
+    Encode items one by one as the elements of a JSON array
+    """
+    yield '['
+    first = True
+    for item in items:
+        if first:
+            first = False
+            yield json.dumps(serializer(item))
+        else:
+            yield ',' + json.dumps(serializer(item))
+    yield ']\n'
+
+
+def iter_ndjson(items, serializer):
+    """
+    Encode items as newline-delimited JSON, one document per line
+    """
+    for item in items:
+        yield json.dumps(serializer(item)) + '\n'
+
+
+def stream_collection(items, serializer, fmt='json'):
+    """
+    Build a streamed response for an iterable of model instances.
+
+    The iterable is consumed lazily while the response is being sent, so the
+    request context (and with it the database session) is kept alive until
+    the last row has been written.
+    """
+    if fmt == 'ndjson':
+        chunks, mimetype = iter_ndjson(items, serializer), NDJSON_MIMETYPE
+    else:
+        chunks, mimetype = iter_json_array(items, serializer), JSON_MIMETYPE
+
+    def generate():
+        try:
+            yield from coalesce_chunks(chunks)
+        except Exception:
+            # Headers are already sent; the truncated body signals the failure
+            current_app.logger.exception('Streaming response aborted')
+            raise
+
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+def stream_chunk_size():
+    """
+    Number of rows fetched per database round trip while streaming
+    """
+    return current_app.config.get('STREAM_CHUNK_SIZE', 1000)
@@ -0,0 +1,74 @@
+"""
+Per-request timing breakdown exposed through the Server-Timing header
+"""
+
+import time
+from contextlib import contextmanager
+from flask import current_app, g, has_app_context
+
+
+def record_timing(name, duration, description=None):
+    """
+    Add ``duration`` seconds to the named phase of the current request.
+    Repeated phases (e.g. several compressions) are summed.
+    """
+    if not has_app_context():
+        return
+    timings = g.setdefault('_server_timing', {})
+    entry = timings.setdefault(name, [0.0, None])
+    entry[0] += duration
+    if description is not None:
+        entry[1] = description
+
+
+@contextmanager
+def timed(name, description=None):
+    """
+    Context manager recording the wall time spent in a block
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - start, description)
+
+
+def get_timings():
+    """
+    Return {phase: (seconds, description)} for the current request
+    """
+    if not has_app_context():
+        return {}
+    return {name: tuple(entry) for name, entry in g.get('_server_timing', {}).items()}
+
+
+def format_server_timing(timings):
+    """
+    Render timings as a Server-Timing header value (durations in ms)
+    """
+    parts = []
+    for name, (duration, description) in timings.items():
+        part = f'{name};dur={duration * 1000:.2f}'
+        if description:
+            part += ';desc="{}"'.format(str(description).replace('"', "'"))
+        parts.append(part)
+    return ', '.join(parts)
+
+
+def _add_server_timing_header(response):
+    if not current_app.config.get('SERVER_TIMING_ENABLED', False):
+        return response
+    timings = get_timings()
+    if timings:
+        response.headers['Server-Timing'] = format_server_timing(timings)
+    return response
+
+
+def init_app(app):
+    """
+    Register the Server-Timing hook.
+
+    Must be initialised before any other after_request hook that records
+    timings, because Flask runs after_request functions in reverse order.
+    """
+    app.after_request(_add_server_timing_header)
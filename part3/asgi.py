@@ -0,0 +1,7 @@
+from app import create_app
+from app.asgi import create_asgi_app
+
+app = create_asgi_app(create_app())
+
+# Serve with an ASGI server, e.g.:
+#   uvicorn asgi:app --host 127.0.0.1 --port 5001
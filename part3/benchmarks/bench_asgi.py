@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Threaded WSGI versus ASGI (async SQLAlchemy) under concurrent load
+
+Seeds a temporary SQLite database, then serves it once with Werkzeug's
+threaded WSGI server and once with uvicorn running asgi.HBnBASGI, each in
+its own process, and drives GET /api/v1/places/ and POST /api/v1/reviews/
+with concurrent keep-alive clients. Reports requests per second and
+p50/p99 latency for both modes.
+
+Usage:
+    python benchmarks/bench_asgi.py [--requests 2000] [--concurrency 32] [--places 50]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SECRET = 'benchmark-secret-key-of-sufficient-length'
+
+
+def make_config(db_path):
+    from config import Config
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        JWT_SECRET_KEY = SECRET
+        JWT_ALGORITHM = 'HS256'
+        JWT_VERIFY_SUB = False
+        BCRYPT_LOG_ROUNDS = 4
+        BCRYPT_POOL_SIZE = 0
+        SERVER_TIMING_ENABLED = False
+        COMPRESS_ENABLED = False
+    return BenchConfig
+
+
+def seed(db_path, places, reviewers):
+    """Create places owned by one user plus reviewer accounts with tokens."""
+    from flask_jwt_extended import create_access_token
+    from app import create_app, db
+    from app.services import facade
+
+    app = create_app(make_config(db_path))
+    with app.app_context():
+        db.create_all()
+        owner = facade.create_user({'first_name': 'Owner', 'last_name': 'Bench',
+                                    'email': 'owner@bench.test', 'password': 'pw'})
+        place_ids = [facade.create_place({
+            'title': f'Place {i}', 'description': 'Benchmark place', 'price': 50 + i,
+            'latitude': 10.0, 'longitude': 20.0, 'owner_id': owner.id}).id
+            for i in range(places)]
+        users = []
+        for i in range(reviewers):
+            user = facade.create_user({'first_name': 'Reviewer', 'last_name': str(i),
+                                       'email': f'reviewer{i}@bench.test', 'password': 'pw'})
+            token = create_access_token(identity={'id': user.id, 'is_admin': False},
+                                        expires_delta=False)
+            users.append((user.id, token))
+    return place_ids, users
+
+
+def serve(mode, db_path, port, ready):
+    from app import create_app
+
+    app = create_app(make_config(db_path))
+    if mode == 'wsgi':
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        server = make_server('127.0.0.1', port, app, threaded=True,
+                             request_handler=QuietHandler)
+        ready.set()
+        server.serve_forever()
+    else:
+        import uvicorn
+        from app.asgi import create_asgi_app
+        ready.set()
+        uvicorn.run(create_asgi_app(app), host='127.0.0.1', port=port,
+                    log_level='warning', access_log=False)
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'Server on port {port} did not start')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def drive(port, make_request, requests, concurrency):
+    """Run ``requests`` calls of make_request(i) over keep-alive connections."""
+    local = threading.local()
+
+    def one(i):
+        if not hasattr(local, 'conn'):
+            local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        method, path, body, headers = make_request(i)
+        start = time.perf_counter()
+        try:
+            local.conn.request(method, path, body=body, headers=headers)
+            response = local.conn.getresponse()
+            response.read()
+            status = response.status
+            if response.getheader('Connection', '').lower() == 'close':
+                local.conn.close()
+                del local.conn
+        except (OSError, http.client.HTTPException):
+            local.conn.close()
+            del local.conn
+            status = 0
+        return status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(one, range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(duration for _, duration in results)
+    return {
+        'statuses': dict(Counter(status for status, _ in results)),
+        'rps': len(results) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000,
+    }
+
+
+def run_mode(mode, args, place_ids, users, db_path):
+    ctx = multiprocessing.get_context('spawn')
+    ready = ctx.Event()
+    port = free_port()
+    server = ctx.Process(target=serve, args=(mode, db_path, port, ready), daemon=True)
+    server.start()
+    try:
+        ready.wait(30)
+        wait_for_port(port)
+
+        def list_places(i):
+            return 'GET', '/api/v1/places/', None, {}
+
+        # Each request reviews a distinct (user, place) pair
+        offset = 0 if mode == 'wsgi' else len(place_ids) * len(users) // 2
+
+        def create_review(i):
+            pair = offset + i
+            user_id, token = users[pair // len(place_ids)]
+            body = json.dumps({'text': 'Benchmark review', 'rating': 4, 'user_id': user_id,
+                               'place_id': place_ids[pair % len(place_ids)]})
+            return 'POST', '/api/v1/reviews/', body, {
+                'Content-Type': 'application/json', 'Authorization': f'Bearer {token}'}
+
+        drive(port, list_places, min(100, args.requests), args.concurrency)  # warm up
+        return {
+            'GET /places': drive(port, list_places, args.requests, args.concurrency),
+            'POST /reviews': drive(port, create_review, args.requests, args.concurrency),
+        }
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--places', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        # Enough reviewers for two runs of distinct (user, place) pairs
+        reviewers = -(-2 * args.requests // args.places)
+        place_ids, users = seed(db_path, args.places, reviewers)
+
+        print(f"{'mode':>5} {'endpoint':>14} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}  statuses")
+        for mode in ('wsgi', 'asgi'):
+            for endpoint, result in run_mode(mode, args, place_ids, users, db_path).items():
+                print(f"{mode:>5} {endpoint:>14} {result['rps']:>8.1f} {result['p50_ms']:>8.1f} "
+                      f"{result['p99_ms']:>8.1f}  {result['statuses']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Facade and repository operations at 1k to 1M rows, in-memory and SQLAlchemy
+
+For every backend and scale a fresh process seeds ``scale`` places
+(plus scale/10 users and reviews) and times create, get, list, price
+range, geo and text search, statistics and review creation through
+HBnBFacade. 'memory' is part2's facade on ConcurrentInMemoryRepository,
+which has no query API: its searches and statistics scan get_all() the
+way a caller would. 'sqlalchemy' is this app's facade on a temporary
+SQLite file, seeded with executemany; its create_user includes bcrypt
+at cost 4, and the session is reset after each call like after a request.
+
+Results are written as JSON (--output) for benchmarks/compare_benchmarks.py.
+
+Usage:
+    python benchmarks/bench_facade.py [--backend all] [--scales 1000,100000,1000000]
+                                      [--output results.json] [--seed 42]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PART2 = os.path.join(os.path.dirname(ROOT), 'part2')
+
+BACKENDS = ('memory', 'sqlalchemy')
+WORDS = ('loft', 'cabin', 'villa', 'studio', 'cottage', 'suite', 'chalet', 'bungalow',
+         'penthouse', 'farmhouse', 'houseboat', 'treehouse', 'castle', 'duplex', 'yurt',
+         'barn', 'condo', 'hostel', 'lodge', 'manor')
+GEO_RADIUS_KM = 50
+SEED_BATCH = 10000
+
+
+def iterations(operation, scale):
+    """Calls timed per operation; whole-table operations get fewer at large scales"""
+    if operation in ('list_places', 'stats'):
+        return max(1, min(5, 100000 // scale))
+    if operation in ('price_range', 'geo_search', 'text_search'):
+        return max(3, min(50, 5000000 // scale))
+    if operation in ('create_user', 'create_place', 'create_review'):
+        return 200
+    return 1000
+
+
+def make_dataset(scale, rng):
+    """Rows shared by both backends, so they answer the same queries"""
+    users = [{'first_name': 'User', 'last_name': str(i), 'email': f'user{i}@bench.test'}
+             for i in range(max(10, scale // 10))]
+    places = [{'title': f'{rng.choice(WORDS)} {i}', 'description': 'Benchmark place',
+               'price': round(rng.uniform(20, 1000), 2),
+               'latitude': round(rng.uniform(-60, 70), 6),
+               'longitude': round(rng.uniform(-180, 180), 6),
+               'owner': i % len(users)}
+              for i in range(scale)]
+    # One review on each of the first places; the rest stay free for create_review
+    reviews = [{'text': 'Great stay', 'rating': rng.randint(1, 5), 'user': i % len(users),
+                'place': i} for i in range(scale // 10)]
+    return users, places, reviews
+
+
+def memory_backend(users, places, reviews):
+    """part2's facade; every search is a scan of get_all()"""
+    sys.path.insert(0, PART2)
+    from app.services.facade import HBnBFacade
+
+    facade = HBnBFacade()
+    user_ids = [facade.create_user(dict(user)).id for user in users]
+    place_ids = [facade.create_place({**place, 'owner_id': user_ids[place['owner']]}).id
+                 for place in places]
+    for review in reviews:
+        facade.create_review({'text': review['text'], 'rating': review['rating'],
+                              'user_id': user_ids[review['user']],
+                              'place_id': place_ids[review['place']]})
+
+    def price_range(low, high):
+        return [p for p in facade.get_all_places() if low <= p.price <= high]
+
+    def geo_search(latitude, longitude, radius_km):
+        degrees = radius_km / 111.0
+        return [p for p in facade.get_all_places()
+                if abs(p.latitude - latitude) <= degrees and abs(p.longitude - longitude) <= degrees]
+
+    def text_search(pattern):
+        pattern = pattern.lower()
+        return [p for p in facade.get_all_places() if pattern in p.name.lower()]
+
+    def stats():
+        prices = [p.price for p in facade.get_all_places()]
+        return {'min_price': min(prices), 'max_price': max(prices),
+                'avg_price': sum(prices) / len(prices), 'total_places': len(prices)}
+
+    calls = {
+        'create_user': facade.create_user,
+        'create_place': facade.create_place,
+        'get_place': facade.get_place,
+        'get_user_by_email': facade.get_user_by_email,
+        'list_places': facade.get_all_places,
+        'price_range': price_range,
+        'geo_search': geo_search,
+        'text_search': text_search,
+        'stats': stats,
+        'create_review': facade.create_review,
+    }
+    return calls, user_ids, place_ids, lambda: None, lambda: None
+
+
+def sqlalchemy_backend(users, places, reviews, directory):
+    """This app's facade on a SQLite file, seeded in batches with executemany"""
+    sys.path.insert(0, ROOT)
+    from sqlalchemy import insert
+    from config import Config
+    from app import create_app, db
+    from app.models.place import Place
+    from app.models.reviews import Review
+    from app.models.user import User
+    from app.services.facade import HBnBFacade
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        JWT_KEYS_DIR = os.path.join(directory, 'keys')
+        BCRYPT_LOG_ROUNDS = 4
+        BCRYPT_POOL_SIZE = 0
+        JOBS_WORKERS = 0
+
+    app = create_app(BenchConfig, with_api=False)
+    context = app.app_context()
+    context.push()
+    db.create_all()
+
+    now = datetime.utcnow()
+    password = User(first_name='x', last_name='x', email='x@bench.test')
+    password.hash_password('benchmark')
+    user_ids = [str(uuid.uuid4()) for _ in users]
+    place_ids = [str(uuid.uuid4()) for _ in places]
+    tables = (
+        (User, [{**user, 'id': user_id, 'password': password.password, 'is_admin': False,
+                 'created_at': now, 'updated_at': now}
+                for user, user_id in zip(users, user_ids)]),
+        (Place, [{'id': place_id, 'title': place['title'], 'description': place['description'],
+                  'price': place['price'], 'latitude': place['latitude'],
+                  'longitude': place['longitude'], 'owner_id': user_ids[place['owner']],
+                  'created_at': now, 'updated_at': now}
+                 for place, place_id in zip(places, place_ids)]),
+        (Review, [{'id': str(uuid.uuid4()), 'text': review['text'], 'rating': review['rating'],
+                   'user_id': user_ids[review['user']], 'place_id': place_ids[review['place']],
+                   'created_at': now, 'updated_at': now}
+                  for review in reviews]),
+    )
+    for model, rows in tables:
+        for start in range(0, len(rows), SEED_BATCH):
+            db.session.execute(insert(model), rows[start:start + SEED_BATCH])
+        db.session.commit()
+
+    facade = HBnBFacade()
+
+    def create_user(data):
+        return facade.create_user({**data, 'password': 'benchmark'})
+
+    calls = {
+        'create_user': create_user,
+        'create_place': facade.create_place,
+        'get_place': facade.get_place,
+        'get_user_by_email': facade.get_user_by_email,
+        'list_places': facade.get_all_places,
+        'price_range': facade.get_places_by_price_range,
+        'geo_search': facade.get_places_by_location,
+        'text_search': facade.search_places_by_title,
+        'stats': facade.get_place_statistics,
+        'create_review': facade.create_review,
+    }
+
+    def close():
+        db.session.remove()
+        db.engine.dispose()
+        context.pop()
+
+    # Removing the session after each call, like at the end of a request,
+    # keeps later calls from being served from the identity map
+    return calls, user_ids, place_ids, db.session.remove, close
+
+
+def arguments(operation, index, rng, users, places, user_ids, place_ids):
+    """Arguments of call ``index``; reviews go to places that have none yet"""
+    if operation == 'create_user':
+        return ({'first_name': 'New', 'last_name': str(index),
+                 'email': f'new{index}@bench.test'},)
+    if operation == 'create_place':
+        return ({'title': f'new {index}', 'description': 'Benchmark place', 'price': 100.0,
+                 'latitude': 1.0, 'longitude': 2.0,
+                 'owner_id': user_ids[index % len(user_ids)]},)
+    if operation == 'get_place':
+        return (rng.choice(place_ids),)
+    if operation == 'get_user_by_email':
+        return (users[rng.randrange(len(users))]['email'],)
+    if operation == 'price_range':
+        low = rng.uniform(20, 990)
+        return (low, low + 1.0)
+    if operation == 'geo_search':
+        place = places[rng.randrange(len(places))]
+        return (place['latitude'], place['longitude'], GEO_RADIUS_KM)
+    if operation == 'text_search':
+        return (f'{rng.choice(WORDS)} {rng.randrange(len(places))}',)
+    if operation == 'create_review':
+        free = len(places) // 10 + index
+        return ({'text': 'Benchmark review', 'rating': 4, 'user_id': user_ids[0],
+                 'place_id': place_ids[free % len(place_ids)]},)
+    return ()
+
+
+def run_worker(backend, scale, seed):
+    """Seed and time one backend at one scale in this process"""
+    rng = random.Random(seed)
+    users, places, reviews = make_dataset(scale, rng)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as directory:
+        if backend == 'memory':
+            backend_setup = memory_backend(users, places, reviews)
+        else:
+            backend_setup = sqlalchemy_backend(users, places, reviews, directory)
+        calls, user_ids, place_ids, after_call, close = backend_setup
+        results = [{'operation': 'seed', 'iterations': 1,
+                    'seconds': round(time.perf_counter() - start, 3)}]
+
+        for operation, call in calls.items():
+            count = iterations(operation, scale)
+            samples = []
+            for index in range(count):
+                args = arguments(operation, index, rng, users, places, user_ids, place_ids)
+                begin = time.perf_counter()
+                call(*args)
+                samples.append(time.perf_counter() - begin)
+                after_call()
+            samples.sort()
+            results.append({
+                'operation': operation,
+                'iterations': count,
+                'min_us': round(samples[0] * 1e6, 2),
+                'median_us': round(statistics.median(samples) * 1e6, 2),
+                'p95_us': round(samples[min(count - 1, int(count * 0.95))] * 1e6, 2),
+                'mean_us': round(statistics.fmean(samples) * 1e6, 2),
+                'ops_per_sec': round(count / sum(samples), 1),
+            })
+        close()
+    # ru_maxrss is in KiB on Linux
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    for result in results:
+        result.update(backend=backend, scale=scale)
+    results[0]['max_rss_mb'] = round(max_rss_mb, 1)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backend', choices=BACKENDS + ('all',), default='all')
+    parser.add_argument('--scales', default='1000,100000,1000000',
+                        help='comma-separated numbers of places')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    scales = [int(scale) for scale in args.scales.split(',')]
+
+    if args.worker:
+        # part2 and part3 are both the 'app' package: one backend per process
+        print(json.dumps(run_worker(args.backend, scales[0], args.seed)))
+        return 0
+
+    backends = BACKENDS if args.backend == 'all' else (args.backend,)
+    results = []
+    print(f"{'backend':11} {'scale':>8} {'operation':18} {'n':>5} {'median us':>11} "
+          f"{'p95 us':>11} {'ops/s':>10}")
+    for scale in scales:
+        for backend in backends:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', '--backend', backend,
+                 '--scales', str(scale), '--seed', str(args.seed)],
+                cwd=PART2 if backend == 'memory' else ROOT,
+                capture_output=True, text=True, check=True).stdout
+            for result in json.loads(output.strip().splitlines()[-1]):
+                results.append(result)
+                if result['operation'] == 'seed':
+                    print(f"{backend:11} {scale:>8} {'seed':18} {1:>5} "
+                          f"{result['seconds'] * 1e6:>11.0f} {'':>11} {'':>10}  "
+                          f"max RSS {result['max_rss_mb']:.0f} MB")
+                else:
+                    print(f"{backend:11} {scale:>8} {result['operation']:18} "
+                          f"{result['iterations']:>5} {result['median_us']:>11.1f} "
+                          f"{result['p95_us']:>11.1f} {result['ops_per_sec']:>10.1f}")
+
+    if args.output:
+        document = {
+            'meta': {
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'git_commit': git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Login throughput versus bcrypt cost factor
+
+Runs concurrent POST /api/v1/auth/login requests against an in-memory
+database, once with hashing inline on the request threads and once on the
+bcrypt process pool, and reports logins per second, latency percentiles
+and how many requests were shed with 503.
+
+Usage:
+    python benchmarks/bench_password_hashing.py [--rounds 8 10 12] [--requests 200]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db  # noqa: E402
+from config import Config  # noqa: E402
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+
+def make_config(rounds, pool_size, max_pending):
+    class BenchConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        JWT_SECRET_KEY = 'benchmark-secret-key-of-sufficient-length'
+        JWT_VERIFY_SUB = False
+        SERVER_TIMING_ENABLED = False
+        BCRYPT_LOG_ROUNDS = rounds
+        BCRYPT_POOL_SIZE = pool_size
+        BCRYPT_MAX_PENDING = max_pending
+    return BenchConfig
+
+
+def run(rounds, pool_size, max_pending, requests, concurrency):
+    app = create_app(make_config(rounds, pool_size, max_pending))
+    with app.app_context():
+        db.create_all()
+        from app.services import facade
+        facade.create_user({'first_name': 'Bench', 'last_name': 'User',
+                            'email': EMAIL, 'password': PASSWORD})
+
+    def login(_):
+        client = app.test_client()
+        start = time.perf_counter()
+        response = client.post('/api/v1/auth/login',
+                               json={'email': EMAIL, 'password': PASSWORD})
+        return response.status_code, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(login, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    app.extensions['password_hasher'].shutdown()
+    statuses = Counter(status for status, _ in results)
+    latencies = sorted(duration for status, duration in results if status == 200)
+    return {
+        'ok': statuses.get(200, 0),
+        'shed': statuses.get(503, 0),
+        'logins_per_s': statuses.get(200, 0) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, nargs='+', default=[8, 10, 12])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--pool-size', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--max-pending', type=int, default=64)
+    args = parser.parse_args(argv)
+
+    print(f"{'rounds':>6} {'mode':>6} {'ok':>5} {'shed':>5} {'logins/s':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8}")
+    for rounds in args.rounds:
+        for mode, pool_size in (('inline', 0), ('pool', args.pool_size)):
+            result = run(rounds, pool_size, args.max_pending,
+                         args.requests, args.concurrency)
+            print(f"{rounds:>6} {mode:>6} {result['ok']:>5} {result['shed']:>5} "
+                  f"{result['logins_per_s']:>9.1f} {result['p50_ms']:>8.1f} "
+                  f"{result['p95_ms']:>8.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
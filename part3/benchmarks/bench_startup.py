@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Cold start: time from a fresh interpreter to the first served request
+
+Seeds a temporary SQLite database, then starts ``--runs`` new Python
+processes that each import the app, call create_app() and serve one
+request through the test client. Reports min/median/p95 per phase.
+With --max-ms the exit status is 1 when the median total exceeds it, so
+the benchmark can guard against startup regressions in CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--path /api/v1/places/] [--max-ms 1500]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PHASES = ('import', 'create_app', 'first_request', 'total')
+
+
+def seed(env):
+    """Create the tables (and a signing key) so the first request hits the database."""
+    subprocess.run([sys.executable, 'manage.py', '--config', 'config.Config', 'init-db'],
+                   cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+def run_once(env, path):
+    from manage import STARTUP_SCRIPT
+
+    result = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, 'config.Config', path],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    if timings['status'] != 200:
+        raise RuntimeError(f"GET {path} returned {timings['status']}")
+    timings['total'] = timings['import'] + timings['create_app'] + timings['first_request']
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--path', default='/api/v1/places/', help='first request')
+    parser.add_argument('--max-ms', type=float,
+                        help='fail if the median total is slower than this')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, 'DATABASE_URL': f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+               'JWT_KEYS_DIR': os.path.join(tmp, 'keys'), 'JOBS_WORKERS': '0'}
+        seed(env)
+        run_once(env, args.path)  # warm the OS file cache and __pycache__
+        runs = [run_once(env, args.path) for _ in range(args.runs)]
+
+    print(f"{'phase':14} {'min ms':>8} {'median':>8} {'p95':>8}")
+    for phase in PHASES:
+        values = sorted(run[phase] * 1000 for run in runs)
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        print(f"{phase:14} {values[0]:>8.1f} {statistics.median(values):>8.1f} {p95:>8.1f}")
+
+    median_total = statistics.median(run['total'] * 1000 for run in runs)
+    if args.max_ms is not None and median_total > args.max_ms:
+        print(f"Startup regression: median {median_total:.1f} ms > {args.max_ms:.1f} ms",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+CPU cost of POST /auth/login versus POST /auth/refresh
+
+Each operation runs sequentially against an in-memory database with
+bcrypt hashing inline (BCRYPT_POOL_SIZE = 0) so that its CPU time is
+measured in this process.
+
+Usage:
+    python benchmarks/bench_token_renewal.py [--rounds 12] [--iterations 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db  # noqa: E402
+from config import Config  # noqa: E402
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+
+def make_config(rounds, keys_dir):
+    class BenchConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        JWT_VERIFY_SUB = False
+        JWT_KEYS_DIR = keys_dir
+        SERVER_TIMING_ENABLED = False
+        BCRYPT_LOG_ROUNDS = rounds
+        BCRYPT_POOL_SIZE = 0
+    return BenchConfig
+
+
+def measure(operation, iterations):
+    """Return (cpu ms, wall ms) per call of operation()"""
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return ((time.process_time() - cpu_start) / iterations * 1000,
+            (time.perf_counter() - wall_start) / iterations * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=12, help='bcrypt cost factor')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--keys-dir', default=os.path.join('/tmp', 'hbnb-bench-keys'),
+                        help='JWT signing keys used by the benchmark app')
+    args = parser.parse_args(argv)
+
+    app = create_app(make_config(args.rounds, args.keys_dir))
+    with app.app_context():
+        db.create_all()
+        from app.services import facade
+        facade.create_user({'first_name': 'Bench', 'last_name': 'User',
+                            'email': EMAIL, 'password': PASSWORD})
+    client = app.test_client()
+
+    def login():
+        response = client.post('/api/v1/auth/login',
+                               json={'email': EMAIL, 'password': PASSWORD})
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    refresh_token = client.post('/api/v1/auth/login', json={
+        'email': EMAIL, 'password': PASSWORD}).get_json()['refresh_token']
+
+    def refresh():
+        nonlocal refresh_token
+        response = client.post('/api/v1/auth/refresh', json={'refresh_token': refresh_token})
+        assert response.status_code == 200, response.get_data(as_text=True)
+        refresh_token = response.get_json()['refresh_token']
+
+    login_cpu, login_wall = measure(login, args.iterations)
+    refresh_cpu, refresh_wall = measure(refresh, args.iterations)
+
+    print(f'bcrypt rounds: {args.rounds}, {args.iterations} iterations each')
+    print(f"{'operation':>10} {'cpu ms':>9} {'wall ms':>9}")
+    print(f"{'login':>10} {login_cpu:>9.2f} {login_wall:>9.2f}")
+    print(f"{'refresh':>10} {refresh_cpu:>9.2f} {refresh_wall:>9.2f}")
+    if refresh_cpu:
+        print(f'refresh uses {login_cpu / refresh_cpu:.0f}x less CPU than login')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling of the production server from 1 to N worker processes
+
+Seeds a temporary SQLite database, then starts ``gunicorn -c gunicorn.conf.py``
+(wsgi:app, preloaded) with 1, 2, 4 ... N workers and drives
+GET /api/v1/places/ from several client processes. Reports requests per
+second, p99 latency and the speed-up relative to one worker.
+
+Usage:
+    python benchmarks/bench_workers.py [--max-workers N] [--duration 5] [--places 50]
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def seed(db_path, keys_dir, places):
+    from config import Config
+    from app import create_app, db
+    from app.services import facade
+
+    class SeedConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        JWT_KEYS_DIR = keys_dir
+        BCRYPT_LOG_ROUNDS = 4
+        BCRYPT_POOL_SIZE = 0
+
+    app = create_app(SeedConfig)
+    with app.app_context():
+        db.create_all()
+        owner = facade.create_user({'first_name': 'Owner', 'last_name': 'Bench',
+                                    'email': 'owner@bench.test', 'password': 'pw'})
+        for i in range(places):
+            facade.create_place({'title': f'Place {i}', 'description': 'Benchmark place',
+                                 'price': 50 + i, 'latitude': 10.0, 'longitude': 20.0,
+                                 'owner_id': owner.id})
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/healthz')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError('Server did not become ready')
+
+
+def client(port, duration, threads, results):
+    """One client process: ``threads`` keep-alive connections for ``duration`` s."""
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def loop():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = []
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                conn.request('GET', '/api/v1/places/')
+                response = conn.getresponse()
+                response.read()
+                if response.status == 200:
+                    local.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=loop) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    results.put(latencies)
+
+
+def measure(workers, args, env):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+        cwd=ROOT, env={**env, 'WEB_CONCURRENCY': str(workers),
+                       'BIND': f'127.0.0.1:{port}'},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        ctx = multiprocessing.get_context('spawn')
+        results = ctx.Queue()
+        clients = [ctx.Process(target=client,
+                               args=(port, args.duration, args.threads, results))
+                   for _ in range(args.clients)]
+        for process in clients:
+            process.start()
+        latencies = sorted(l for _ in clients for l in results.get())
+        for process in clients:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+    if not latencies:
+        return 0.0, 0.0
+    return (len(latencies) / args.duration,
+            latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--places', type=int, default=50)
+    parser.add_argument('--clients', type=int, default=2, help='client processes')
+    parser.add_argument('--threads', type=int, default=8, help='connections per client')
+    args = parser.parse_args(argv)
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        keys_dir = os.path.join(tmp, 'keys')
+        seed(db_path, keys_dir, args.places)
+        env = {**os.environ, 'DATABASE_URL': f'sqlite:///{db_path}',
+               'JWT_KEYS_DIR': keys_dir, 'WEB_THREADS': '4', 'BCRYPT_POOL_SIZE': '1'}
+
+        print(f"{'workers':>7} {'req/s':>8} {'p99 ms':>8} {'speed-up':>8}")
+        baseline = None
+        for workers in counts:
+            rps, p99 = measure(workers, args, env)
+            baseline = baseline or rps
+            print(f"{workers:>7} {rps:>8.1f} {p99:>8.1f} {rps / baseline if baseline else 0:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare two bench_facade.py result files and flag regressions
+
+Matches results by backend, scale and operation and prints the change
+in the chosen metric. The exit status is 1 when any operation got slower
+by more than --threshold (a fraction: 0.1 = 10%), so the comparison can
+gate CI. Operations faster than --min-us in the baseline are reported
+but never flagged, since their timings are mostly noise.
+
+Usage:
+    python benchmarks/compare_benchmarks.py BASELINE.json CURRENT.json
+                                            [--threshold 0.1] [--metric median_us] [--min-us 5]
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = ('median_us', 'p95_us', 'mean_us', 'min_us')
+
+
+def load_results(path):
+    """Results of a file keyed by (backend, scale, operation); seeding is skipped"""
+    with open(path, encoding='utf-8') as f:
+        document = json.load(f)
+    return {(result['backend'], result['scale'], result['operation']): result
+            for result in document['results'] if result['operation'] != 'seed'}
+
+
+def compare(baseline, current, metric, threshold, min_us):
+    """
+    Rows of (key, baseline value, current value, change, status) for the
+    operations in both files, in baseline order
+    """
+    rows = []
+    for key, before in baseline.items():
+        after = current.get(key)
+        if after is None:
+            rows.append((key, before[metric], None, None, 'missing'))
+            continue
+        change = (after[metric] - before[metric]) / before[metric] if before[metric] else 0.0
+        if change > threshold and before[metric] >= min_us:
+            status = 'REGRESSION'
+        elif change < -threshold and before[metric] >= min_us:
+            status = 'improved'
+        else:
+            status = ''
+        rows.append((key, before[metric], after[metric], change, status))
+    for key, after in current.items():
+        if key not in baseline:
+            rows.append((key, None, after[metric], None, 'new'))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed slowdown as a fraction (default 0.1)')
+    parser.add_argument('--metric', choices=METRICS, default='median_us')
+    parser.add_argument('--min-us', type=float, default=5.0,
+                        help='never flag operations faster than this in the baseline')
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.baseline), load_results(args.current),
+                   args.metric, args.threshold, args.min_us)
+    print(f"{'backend':11} {'scale':>8} {'operation':18} {'baseline':>11} {'current':>11} "
+          f"{'change':>8}")
+    for (backend, scale, operation), before, after, change, status in rows:
+        before_text = f'{before:.1f}' if before is not None else '-'
+        after_text = f'{after:.1f}' if after is not None else '-'
+        change_text = f'{change:+.1%}' if change is not None else ''
+        print(f"{backend:11} {scale:>8} {operation:18} {before_text:>11} {after_text:>11} "
+              f"{change_text:>8}  {status}")
+
+    regressions = sum(1 for row in rows if row[4] == 'REGRESSION')
+    if regressions:
+        print(f"{regressions} operation(s) slower than the baseline by more than "
+              f"{args.threshold:.0%} ({args.metric})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
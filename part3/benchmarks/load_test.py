@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Load test replaying the part4 frontend's flows over HTTP
+
+Each virtual user logs in (POST /auth/login), then --flows-per-login
+times lists the places (GET /places/), opens one with its reviews in a
+single POST /batch/ call (as place.html does) and posts a review
+(POST /reviews/). Virtual users start evenly over --ramp seconds and run
+until --duration seconds have passed. Throughput, latency percentiles
+and error rates (network errors and 4xx/5xx, including batched
+sub-requests) are reported per step.
+
+The fixtures are deterministic (--seed): ids, prices and coordinates are
+the same on every run. Every flow reviews a (user, place) pair of its
+own, so up to --users x --places flows run without duplicate reviews.
+
+By default the app is served from a temporary SQLite file by Werkzeug's
+threaded server in a child process. To load a production-like server
+instead, seed its database with --seed-only --database PATH, start it on
+that database and pass --url.
+
+Usage:
+    python benchmarks/load_test.py [--concurrency 20] [--ramp 10] [--duration 60]
+                                   [--users 200] [--places 500] [--output results.json]
+    python benchmarks/load_test.py --seed-only --database /tmp/load.db
+    python benchmarks/load_test.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STEPS = ('login', 'list_places', 'place_details', 'post_review')
+PASSWORD = 'load-test-password'
+FIXTURE_NAMESPACE = uuid.UUID('6f0c1f4e-5a4b-4c8e-9d0f-4c6f2d7b9a31')
+FIXTURE_TIME = datetime(2024, 1, 1)
+
+
+def fixture_id(kind, index):
+    """The same id for the same fixture on every run"""
+    return str(uuid.uuid5(FIXTURE_NAMESPACE, f'{kind}-{index}'))
+
+
+def make_config(db_path, keys_dir, bcrypt_rounds=None):
+    from config import Config
+
+    class LoadTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        JWT_KEYS_DIR = keys_dir
+        JWT_VERIFY_SUB = False
+        JOBS_WORKERS = 0
+        if bcrypt_rounds is not None:
+            BCRYPT_LOG_ROUNDS = bcrypt_rounds
+    return LoadTestConfig
+
+
+def seed_fixtures(db_path, users, places, seed, bcrypt_rounds):
+    """
+    Create one host owning every place and ``users`` reviewers, all with
+    PASSWORD hashed at ``bcrypt_rounds``
+    """
+    from app import create_app, db
+    from app.models.place import Place
+    from app.models.user import User
+
+    rng = random.Random(seed)
+    app = create_app(make_config(db_path, os.path.join(os.path.dirname(db_path), 'keys'),
+                                 bcrypt_rounds), with_api=False)
+    with app.app_context():
+        db.create_all()
+        template = User(first_name='Load', last_name='Test', email='template@load.test')
+        template.hash_password(PASSWORD)
+        host = User(id=fixture_id('host', 0), first_name='Host', last_name='Load',
+                    email='host@load.test', password=template.password,
+                    created_at=FIXTURE_TIME, updated_at=FIXTURE_TIME)
+        db.session.add(host)
+        db.session.add_all(
+            User(id=fixture_id('user', i), first_name='Guest', last_name=str(i),
+                 email=f'guest{i}@load.test', password=template.password,
+                 created_at=FIXTURE_TIME, updated_at=FIXTURE_TIME)
+            for i in range(users))
+        db.session.add_all(
+            Place(id=fixture_id('place', i), title=f'Load test place {i}',
+                  description='Seeded for the load test', price=round(rng.uniform(30, 500), 2),
+                  latitude=round(rng.uniform(-60, 70), 6),
+                  longitude=round(rng.uniform(-180, 180), 6), owner_id=host.id,
+                  created_at=FIXTURE_TIME, updated_at=FIXTURE_TIME)
+            for i in range(places))
+        db.session.commit()
+    return ([(fixture_id('user', i), f'guest{i}@load.test') for i in range(users)],
+            [fixture_id('place', i) for i in range(places)])
+
+
+def serve(db_path, port):
+    """Run the app with Werkzeug's threaded server until SIGTERM"""
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from app import create_app, warm_up
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    app = create_app(make_config(db_path, os.path.join(os.path.dirname(db_path), 'keys')))
+    warm_up(app)
+    server = make_server('127.0.0.1', port, app, threaded=True, request_handler=QuietHandler)
+    # Exit normally so atexit stops the bcrypt worker processes
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    server.serve_forever()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'Server on {host}:{port} did not start')
+
+
+class Recorder:
+    """Latency samples and outcomes per step, shared by the virtual users"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = Counter()
+
+    def record(self, step, status, duration, failed):
+        with self._lock:
+            self.latencies[step].append(duration)
+            self.statuses[step][status] += 1
+            if failed:
+                self.errors[step] += 1
+
+    def summary(self, elapsed):
+        rows = {}
+        for step in STEPS:
+            samples = sorted(self.latencies.get(step, ()))
+            if not samples:
+                continue
+
+            def percentile(fraction):
+                return samples[min(len(samples) - 1, int(len(samples) * fraction))] * 1000
+
+            rows[step] = {
+                'requests': len(samples),
+                'errors': self.errors[step],
+                'error_rate': round(self.errors[step] / len(samples), 4),
+                'rps': round(len(samples) / elapsed, 2),
+                'p50_ms': round(statistics.median(samples) * 1000, 2),
+                'p90_ms': round(percentile(0.90), 2),
+                'p95_ms': round(percentile(0.95), 2),
+                'p99_ms': round(percentile(0.99), 2),
+                'max_ms': round(samples[-1] * 1000, 2),
+                'statuses': {str(status): count
+                             for status, count in sorted(self.statuses[step].items())},
+            }
+        return rows
+
+
+class VirtualUser:
+    """One browser: a keep-alive connection running login sessions back to back"""
+
+    def __init__(self, base, recorder, think_time):
+        parts = urlsplit(base)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip('/') + '/api/v1'
+        self.recorder = recorder
+        self.think_time = think_time
+        self.conn = None
+
+    def request(self, step, method, path, body=None, token=None):
+        """Send one request and record it; returns the decoded JSON body or None"""
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        payload = json.dumps(body) if body is not None else None
+        start = time.perf_counter()
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            self.conn.request(method, self.prefix + path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            status = response.status
+            if response.getheader('Connection', '').lower() == 'close':
+                self.conn.close()
+                self.conn = None
+        except (OSError, http.client.HTTPException):
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+            self.recorder.record(step, 0, time.perf_counter() - start, True)
+            return None
+        duration = time.perf_counter() - start
+        try:
+            decoded = json.loads(data) if data else None
+        except ValueError:
+            decoded = None
+        failed = status >= 400
+        if step == 'place_details' and not failed and isinstance(decoded, dict):
+            # The batch succeeds as a whole even when a sub-request fails
+            failed = any(item['status'] >= 400 for item in decoded.get('responses', []))
+        self.recorder.record(step, status, duration, failed)
+        if self.think_time:
+            time.sleep(self.think_time)
+        return decoded if not failed else None
+
+    def session(self, user, place_ids):
+        """Log in, then browse and review one place per flow"""
+        user_id, email = user
+        tokens = self.request('login', 'POST', '/auth/login',
+                              {'email': email, 'password': PASSWORD})
+        if not tokens:
+            return
+        token = tokens['access_token']
+        for place_id in place_ids:
+            self.request('list_places', 'GET', '/places/', token=token)
+            self.request('place_details', 'POST', '/batch/', {'requests': [
+                {'method': 'GET', 'path': f'/places/{place_id}'},
+                {'method': 'GET', 'path': f'/reviews/places/{place_id}/reviews'},
+            ]}, token=token)
+            self.request('post_review', 'POST', '/reviews/', {
+                'text': 'Lovely stay, would book again', 'rating': 5,
+                'user_id': user_id, 'place_id': place_id}, token=token)
+
+
+def run_load(base, users, place_ids, args):
+    """Run the virtual users and return (summary, elapsed seconds)"""
+    recorder = Recorder()
+    sessions = itertools.count()
+    sessions_lock = threading.Lock()
+    flows = args.flows_per_login
+    start = time.perf_counter()
+    deadline = start + args.duration
+
+    def next_session():
+        """User and places of the next session; every (user, place) pair is used once"""
+        with sessions_lock:
+            index = next(sessions)
+        user = users[index % len(users)]
+        first = (index // len(users)) * flows
+        return user, [place_ids[(first + i) % len(place_ids)] for i in range(flows)]
+
+    def virtual_user(number):
+        # Start evenly spread over the ramp
+        time.sleep(args.ramp * number / args.concurrency)
+        client = VirtualUser(base, recorder, args.think_time)
+        while time.perf_counter() < deadline:
+            client.session(*next_session())
+
+    threads = [threading.Thread(target=virtual_user, args=(i,), daemon=True)
+               for i in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if next(sessions) * flows > len(users) * len(place_ids):
+        print('Warning: more flows than (user, place) pairs; repeated reviews fail with 400. '
+              'Raise --users or --places.', file=sys.stderr)
+    return recorder.summary(elapsed), elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=20, help='virtual users')
+    parser.add_argument('--ramp', type=float, default=10.0,
+                        help='seconds over which the virtual users start')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds, ramp included')
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help='seconds each virtual user waits after a request')
+    parser.add_argument('--flows-per-login', type=int, default=5)
+    parser.add_argument('--users', type=int, default=200, help='reviewer accounts to seed')
+    parser.add_argument('--places', type=int, default=500, help='places to seed')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--bcrypt-rounds', type=int,
+                        help='cost of the seeded password hashes (default: the app config)')
+    parser.add_argument('--database', help='new SQLite file to seed (default: a temporary one)')
+    parser.add_argument('--seed-only', action='store_true',
+                        help='seed --database and exit, for a server started separately')
+    parser.add_argument('--url', help='load this running server instead of starting one '
+                                      '(its database must hold the same fixtures)')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--serve-port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.serve_port:
+        serve(args.database, args.serve_port)
+        return 0
+    if args.seed_only and not args.database:
+        parser.error('--seed-only needs --database')
+    if args.database and not args.url and os.path.exists(args.database):
+        # Reviews posted by an earlier run would collide with this one's
+        parser.error(f'{args.database} exists; the fixtures need a new database file')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.abspath(args.database or os.path.join(tmp, 'load.db'))
+        if args.url:
+            # The fixtures are deterministic: rebuild their ids without a database
+            users = [(fixture_id('user', i), f'guest{i}@load.test') for i in range(args.users)]
+            place_ids = [fixture_id('place', i) for i in range(args.places)]
+        else:
+            users, place_ids = seed_fixtures(db_path, args.users, args.places, args.seed,
+                                             args.bcrypt_rounds)
+        if args.seed_only:
+            print(f'Seeded {len(users)} users and {len(place_ids)} places into {db_path}')
+            return 0
+
+        server = None
+        base = args.url
+        if base is None:
+            port = free_port()
+            server = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                                       '--database', db_path, '--serve-port', str(port)])
+            base = f'http://127.0.0.1:{port}'
+        parts = urlsplit(base)
+        try:
+            wait_for_port(parts.hostname, parts.port or 80, timeout=60)
+            summary, elapsed = run_load(base, users, place_ids, args)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    print(f"{args.concurrency} virtual users, {elapsed:.1f} s against {base}")
+    print(f"{'step':14} {'requests':>8} {'req/s':>8} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8}  statuses")
+    for step, row in summary.items():
+        print(f"{step:14} {row['requests']:>8} {row['rps']:>8.1f} {row['error_rate']:>7.1%} "
+              f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+              f"{row['max_ms']:>8.1f}  {row['statuses']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'settings': vars(args), 'elapsed_seconds': round(elapsed, 3),
+                       'steps': summary}, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
@@ -6,13 +7,98 @@ class Config:
     # SQLAlchemy configuration
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///hbnb.db')
+    # Rows fetched per round trip when a collection is streamed
+    STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', 1000))
+    # Per-request phase timings in the Server-Timing response header
+    SERVER_TIMING_ENABLED = True
+    # Count queries per request ('db' in Server-Timing) and warn when one
+    # statement runs more than SQL_REPEATED_QUERY_THRESHOLD times (N+1)
+    SQL_INSTRUMENTATION_ENABLED = True
+    SQL_REPEATED_QUERY_THRESHOLD = int(os.getenv('SQL_REPEATED_QUERY_THRESHOLD', 10))
+    # Prometheus metrics at GET /metrics (per process)
+    METRICS_ENABLED = True
+    # Per-request cProfile + SQL, stored under PROFILING_DIR (default: <instance>/profiles)
+    # and listed at /api/v1/admin/profiles; no hooks at all unless enabled
+    PROFILING_ENABLED = bool(int(os.getenv('PROFILING_ENABLED', 0)))
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))  # share of all requests
+    PROFILING_DIR = os.getenv('PROFILING_DIR')
+    PROFILING_MAX_PROFILES = 100  # oldest deleted beyond this
+    # Response compression (gzip, or brotli when installed)
+    COMPRESS_ENABLED = True
+    COMPRESS_MIN_SIZE = 1024  # bytes; smaller bodies are sent as-is
+    COMPRESS_GZIP_LEVEL = 5  # favour latency over ratio
+    COMPRESS_BROTLI_QUALITY = 4
+    # Directory produced by part4/build_assets.py; unset to disable serving
+    FRONTEND_DIST_DIR = os.getenv('FRONTEND_DIST_DIR')
+    # POST /api/v1/batch limits
+    BATCH_MAX_REQUESTS = 20
+    BATCH_MAX_WORKERS = 4  # threads for concurrent GET sub-requests
+    # Rows validated and committed per transaction by the bulk importer
+    IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 1000))
+    # Password hashing: cost factor and the worker processes running bcrypt
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    BCRYPT_POOL_SIZE = int(os.getenv('BCRYPT_POOL_SIZE', os.cpu_count() or 1))  # 0 = inline
+    BCRYPT_MAX_PENDING = int(os.getenv('BCRYPT_MAX_PENDING', 32))  # beyond this, 503
+    BCRYPT_TIMEOUT = 5  # seconds a request waits for its hash before giving up
+    # Verified JWTs remembered until their exp, keyed by token digest; 0 disables
+    JWT_CACHE_SIZE = int(os.getenv('JWT_CACHE_SIZE', 10000))
+    # Token signing: EdDSA or RS256 with rotating keys identified by kid
+    # (HS256 falls back to the shared JWT_SECRET_KEY/SECRET_KEY)
+    JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'EdDSA')
+    JWT_KEYS_DIR = os.getenv('JWT_KEYS_DIR')  # default: <instance>/jwt_keys
+    JWT_KEYS_AUTO_CREATE = True  # create a first key when the directory is empty
+    JWT_KEYS_REFRESH_INTERVAL = 30  # seconds between checks for rotated keys
+    # Verification-only nodes fetch public keys from the issuer instead
+    JWT_JWKS_URL = os.getenv('JWT_JWKS_URL')
+    JWT_JWKS_MAX_AGE = 300  # seconds clients may cache /.well-known/jwks.json
+    # Opaque, rotating refresh tokens exchanged at POST /auth/refresh
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=int(os.getenv('JWT_REFRESH_TOKEN_DAYS', 30)))
+    # Revoked access tokens: in-memory Bloom filter synced from revoked_tokens
+    REVOCATION_FILTER_CAPACITY = int(os.getenv('REVOCATION_FILTER_CAPACITY', 100000))
+    REVOCATION_FILTER_ERROR_RATE = 0.001
+    REVOCATION_SYNC_INTERVAL = 5  # seconds before revocations by other workers apply
+    # Background jobs (persistent 'jobs' table, worker threads per process)
+    JOBS_WORKERS = int(os.getenv('JOBS_WORKERS', 1))  # 0 = run jobs inline when queued
+    JOBS_POLL_INTERVAL = 1.0  # seconds between polls when the queue is idle
+    JOBS_RETRY_BACKOFF = 2.0  # seconds before the first retry, doubled after each
+    JOBS_STALE_AFTER = 600  # seconds before a running job is assumed lost and requeued
+    JOBS_RETENTION_DAYS = 7  # finished jobs kept this long
+    JOBS_SCHEDULE = {'purge_expired_tokens': 3600}  # periodic tasks: seconds between runs
+    STATISTICS_MAX_AGE = 60  # seconds before /admin/statistics is refreshed
+    # Admission control, per process: route class -> (concurrent requests,
+    # queued requests, max seconds in the queue); beyond that 503 + Retry-After
+    ADMISSION_CONTROL_ENABLED = True
+    ADMISSION_LIMITS = {
+        'auth': (int(os.getenv('ADMISSION_AUTH_LIMIT', 4)), 16, 2.0),  # login/refresh (bcrypt)
+        'heavy': (int(os.getenv('ADMISSION_HEAVY_LIMIT', 4)), 32, 5.0),  # collection reads, exports
+        'write': (int(os.getenv('ADMISSION_WRITE_LIMIT', 8)), 64, 5.0),
+    }
+    # Token bucket per user (or client address) over the API; 0 = no limit
+    RATE_LIMIT_PER_SECOND = float(os.getenv('RATE_LIMIT_PER_SECOND', 0))
+    RATE_LIMIT_BURST = int(os.getenv('RATE_LIMIT_BURST', 40))
+    # Prebuilt swagger.json from `manage.py build-spec` (default: <instance>/swagger.json);
+    # without one the spec is built from the models on first use
+    API_SPEC_PATH = os.getenv('API_SPEC_PATH')
 
 class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///development.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 10))
+
+class ProductionConfig(Config):
+    DEBUG = False
+    # Drop connections that went stale while a worker was idle
+    SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True}
+    # Server sizing, read by gunicorn.conf.py
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))  # worker processes
+    WEB_THREADS = int(os.getenv('WEB_THREADS', 4))  # request threads per worker
+    # Every worker has its own bcrypt pool: share the cores between them
+    BCRYPT_POOL_SIZE = int(os.getenv(
+        'BCRYPT_POOL_SIZE', max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY)))
 
 config = {
     'development': DevelopmentConfig,
+    'production': ProductionConfig,
     'default': DevelopmentConfig
 }
@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for wsgi:app (gunicorn -c gunicorn.conf.py)
+
+The app is imported once in the master and forked into the workers
+(preload_app), so code and read-only data are shared copy-on-write;
+post_fork then gives each worker its own database connections.
+"""
+
+import gc
+import os
+
+from config import ProductionConfig
+
+wsgi_app = 'wsgi:app'
+bind = os.getenv('BIND', '127.0.0.1:5001')
+workers = ProductionConfig.WEB_CONCURRENCY
+threads = ProductionConfig.WEB_THREADS
+worker_class = 'gthread'
+preload_app = True
+timeout = 30
+graceful_timeout = 30
+
+
+def pre_fork(server, worker):
+    # Keep objects created at import out of the collector so that GC
+    # passes in the workers do not write to (and unshare) their pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from app import reset_after_fork
+    from wsgi import app
+
+    reset_after_fork(app)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Command line tools for the HBnB application
+
+Usage:
+    python manage.py init-db
+    python manage.py import places places.ndjson [--batch-size 1000]
+    python manage.py import reviews - < reviews.ndjson
+    python manage.py export dump/ [--format csv] [--gzip] [--table users ...]
+    python manage.py seed --places 1000000 [--users 100000] [--seed 42]
+    python manage.py rotate-keys [--algorithm RS256] [--publish-ahead 300]
+    python manage.py run-jobs [--once] [--workers 2]
+    python manage.py profile-startup [--top 20] [--path /healthz]
+    python manage.py build-spec [--output instance/swagger.json] [--check]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from app import create_app
+
+
+def add_missing_columns(db):
+    """
+    Add model columns that existing tables lack (e.g. ``version``).
+    Only columns with a server default or that are nullable can be added
+    to a table that already has rows; anything else is reported.
+    """
+    from sqlalchemy import inspect
+    from sqlalchemy.schema import CreateColumn
+
+    inspector = inspect(db.engine)
+    added, skipped = [], []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if column.nullable or column.server_default is not None:
+                ddl = CreateColumn(column).compile(dialect=db.engine.dialect)
+                with db.engine.begin() as conn:
+                    conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {ddl}')
+                added.append(f'{table.name}.{column.name}')
+            else:
+                skipped.append(f'{table.name}.{column.name}')
+    return added, skipped
+
+
+def cmd_init_db(app, args):
+    """Create missing tables and add missing columns (existing data is kept)"""
+    from app import db
+
+    with app.app_context():
+        db.create_all()
+        added, skipped = add_missing_columns(db)
+        tables = sorted(db.metadata.tables)
+    for column in added:
+        print(f"Added column {column}")
+    for column in skipped:
+        print(f"Cannot add NOT NULL column {column} without a default", file=sys.stderr)
+    print(f"Database ready: {', '.join(tables)}")
+    return 1 if skipped else 0
+
+
+def cmd_import(app, args):
+    """Bulk import an NDJSON file of places, reviews or amenities"""
+    from app.services import facade
+
+    source = sys.stdin if args.file == '-' else open(args.file, encoding='utf-8')
+    start = time.perf_counter()
+    try:
+        with app.app_context():
+            report = facade.bulk_import(args.kind, source,
+                                        batch_size=args.batch_size,
+                                        default_owner_id=args.owner_id)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    elapsed = time.perf_counter() - start
+
+    for error in report['errors']:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    if report['errors_truncated']:
+        print('... more errors omitted', file=sys.stderr)
+    rate = report['inserted'] / elapsed if elapsed else 0
+    print(json.dumps({key: value for key, value in report.items() if key != 'errors'}))
+    print(f"Imported {report['inserted']} {args.kind} in {elapsed:.2f}s "
+          f"({rate:,.0f} rows/s), {report['failed']} failed", file=sys.stderr)
+    return 1 if report['failed'] else 0
+
+
+def cmd_export(app, args):
+    """Export a consistent snapshot of the dataset, one file per table"""
+    from app.services import facade
+
+    start = time.perf_counter()
+    with app.app_context():
+        counts = facade.export_dataset_to_directory(
+            args.directory, args.format, args.table, compress=args.gzip,
+            chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    for table, rows in counts.items():
+        print(f'{table:16} {rows:>10} rows')
+    print(f'Exported {sum(counts.values())} rows to {args.directory} in {elapsed:.2f}s',
+          file=sys.stderr)
+    return 0
+
+
+def cmd_seed(app, args):
+    """Fill an empty database with deterministic synthetic data"""
+    from app import db
+    from app.services import facade
+    from app.services.seeding import SyntheticDataset
+
+    try:
+        dataset = SyntheticDataset(seed=args.seed, users=args.users or max(2, args.places // 10),
+                                   places=args.places, amenities=args.amenities,
+                                   reviews_per_place=args.reviews_per_place,
+                                   max_reviews_per_place=args.max_reviews_per_place)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+
+    def progress(counts):
+        if sys.stderr.isatty():
+            done = ', '.join(f'{table} {rows:,}' for table, rows in counts.items() if rows)
+            print(f'\r{done} ({time.perf_counter() - start:.0f}s)', end='', file=sys.stderr)
+
+    with app.app_context():
+        db.create_all()
+        try:
+            counts = facade.seed_dataset(dataset, args.password, batch_size=args.batch_size,
+                                         progress=progress)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+    elapsed = time.perf_counter() - start
+    if sys.stderr.isatty():
+        print(file=sys.stderr)
+
+    for table, rows in counts.items():
+        print(f'{table:16} {rows:>10} rows')
+    total = sum(counts.values())
+    rate = total / elapsed if elapsed else 0
+    print(f"Seeded {total} rows in {elapsed:.2f}s ({rate:,.0f} rows/s); "
+          f"every user's password is {args.password!r}", file=sys.stderr)
+    return 0
+
+
+def cmd_rotate_keys(app, args):
+    """Add a new JWT signing key and schedule the current one for retirement"""
+    from app.utils.jwt_keys import KeySet, default_overlap
+
+    keys = app.extensions.get('jwt_keys')
+    if not isinstance(keys, KeySet):
+        print('JWT_ALGORITHM must be EdDSA or RS256 on a token-issuing node',
+              file=sys.stderr)
+        return 1
+    overlap = args.overlap if args.overlap is not None else default_overlap(app)
+    entry = keys.rotate(args.algorithm or app.config['JWT_ALGORITHM'],
+                        overlap=overlap, publish_ahead=args.publish_ahead)
+    for key in keys.keys():
+        expires = (time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(key['expires_at']))
+                   if key.get('expires_at') else '-')
+        marker = '*' if key['kid'] == entry['kid'] else ' '
+        print(f"{marker} {key['kid']}  {key['alg']:6}  expires {expires}")
+    return 0
+
+
+def cmd_run_jobs(app, args):
+    """Run queued background jobs in this process"""
+    from app.services.jobs import get_task_queue
+
+    with app.app_context():
+        queue = get_task_queue()
+        if args.once:
+            count = queue.run_pending()
+            print(f"Ran {count} job(s)")
+            return 0
+        queue.workers = args.workers
+    queue.start()
+    print(f"Running {args.workers} job worker(s); press Ctrl-C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        queue.stop()
+    return 0
+
+
+# Runs in a fresh interpreter so every import is paid for and measured
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app(sys.argv[1])
+created = time.perf_counter()
+status = app.test_client().get(sys.argv[2]).status_code
+served = time.perf_counter()
+print(json.dumps({'import': imported - start, 'create_app': created - imported,
+                  'first_request': served - created, 'status': status}))
+"""
+
+
+def parse_importtime(lines):
+    """Parse ``python -X importtime`` output into (module, self_us, cumulative_us)"""
+    imports = []
+    for line in lines:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def cmd_profile_startup(app, args):
+    """Report where the time from interpreter start to first response goes"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT, args.config, args.path],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+        env={**os.environ, 'JOBS_WORKERS': '0'})
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return result.returncode
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    imports = parse_importtime(result.stderr.splitlines())
+
+    print(f"{'phase':24} {'ms':>9}")
+    for phase in ('import', 'create_app', 'first_request'):
+        print(f"{phase:24} {phases[phase] * 1000:>9.1f}")
+    total = sum(phases[phase] for phase in ('import', 'create_app', 'first_request'))
+    print(f"{'total':24} {total * 1000:>9.1f}  (GET {args.path} -> {phases['status']})")
+
+    # Self time summed per top-level package shows which dependency costs most
+    by_package = defaultdict(int)
+    for name, self_us, _ in imports:
+        by_package[name.split('.')[0]] += self_us
+    print(f"\n{'package':40} {'self ms':>9}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:40} {self_us / 1000:>9.1f}")
+
+    print(f"\n{'module':40} {'self ms':>9} {'cumul ms':>9}")
+    selected = [entry for entry in imports if entry[0].startswith(args.prefix or '')]
+    for name, self_us, cumulative_us in sorted(selected, key=lambda entry: -entry[2])[:args.top]:
+        print(f"{name:40} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
+    return 0
+
+
+def cmd_build_spec(app, args):
+    """Write swagger.json and its SHA-256 for serving without regeneration"""
+    from app.utils.api_spec import build_spec, default_spec_path, load_spec, write_spec
+
+    path = args.output or default_spec_path(app)
+    live = build_spec(app)
+    if args.check:
+        try:
+            current = load_spec(path)
+        except (OSError, ValueError) as e:
+            print(f'{path}: {e}', file=sys.stderr)
+            return 1
+        if current.digest != live.digest:
+            print(f'{path} is stale; run manage.py build-spec', file=sys.stderr)
+            return 1
+        print(f'{path} is up to date (sha256 {live.digest})')
+        return 0
+    write_spec(live, path)
+    print(f'Wrote {path} ({len(live.body)} bytes, sha256 {live.digest})')
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='HBnB management commands')
+    parser.add_argument('--config', default='config.DevelopmentConfig',
+                        help='configuration class (default: config.DevelopmentConfig)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    init_parser = commands.add_parser('init-db', help='create missing tables and columns')
+    init_parser.set_defaults(func=cmd_init_db)
+
+    import_parser = commands.add_parser('import', help='bulk import NDJSON data')
+    import_parser.add_argument('kind', choices=['places', 'reviews', 'amenities'])
+    import_parser.add_argument('file', help="NDJSON file, or '-' for stdin")
+    import_parser.add_argument('--batch-size', type=int, default=1000,
+                               help='rows validated and committed per transaction')
+    import_parser.add_argument('--owner-id',
+                               help='owner for places that do not specify owner_id')
+    import_parser.set_defaults(func=cmd_import)
+
+    export_parser = commands.add_parser('export', help='export the dataset')
+    export_parser.add_argument('directory', help='output directory')
+    export_parser.add_argument('--format', choices=['ndjson', 'csv'], default='ndjson')
+    export_parser.add_argument('--table', action='append',
+                               help='table to export (repeatable; default: all)')
+    export_parser.add_argument('--gzip', action='store_true', help='gzip each file')
+    export_parser.add_argument('--chunk-size', type=int, default=1000,
+                               help='rows fetched per round trip')
+    export_parser.set_defaults(func=cmd_export)
+
+    seed_parser = commands.add_parser('seed', help='fill an empty database with synthetic data')
+    seed_parser.add_argument('--places', type=int, default=1000,
+                             help='number of places (default: 1000)')
+    seed_parser.add_argument('--users', type=int,
+                             help='number of users (default: a tenth of the places)')
+    seed_parser.add_argument('--amenities', type=int, default=24,
+                             help='number of amenities (default: 24)')
+    seed_parser.add_argument('--reviews-per-place', type=float, default=4.0,
+                             help='mean reviews per place (default: 4)')
+    seed_parser.add_argument('--max-reviews-per-place', type=int, default=500,
+                             help='cap of the power-law review count (default: 500)')
+    seed_parser.add_argument('--seed', type=int, default=0,
+                             help='random seed; equal seeds give identical data (default: 0)')
+    seed_parser.add_argument('--password', default='seed-password',
+                             help='password of every seeded user')
+    seed_parser.add_argument('--batch-size', type=int, default=10000,
+                             help='rows per executemany and commit')
+    seed_parser.set_defaults(func=cmd_seed)
+
+    keys_parser = commands.add_parser('rotate-keys', help='rotate JWT signing keys')
+    keys_parser.add_argument('--algorithm', choices=['EdDSA', 'RS256'],
+                             help='algorithm of the new key (default: JWT_ALGORITHM)')
+    keys_parser.add_argument('--overlap', type=int,
+                             help='seconds the previous key stays valid '
+                                  '(default: access token lifetime)')
+    keys_parser.add_argument('--publish-ahead', type=int, default=0,
+                             help='seconds the new key is published before it signs')
+    keys_parser.set_defaults(func=cmd_rotate_keys)
+
+    jobs_parser = commands.add_parser('run-jobs', help='run queued background jobs')
+    jobs_parser.add_argument('--once', action='store_true',
+                             help='run the jobs that are due now, then exit')
+    jobs_parser.add_argument('--workers', type=int, default=2,
+                             help='worker threads (default: 2)')
+    jobs_parser.set_defaults(func=cmd_run_jobs)
+
+    profile_parser = commands.add_parser(
+        'profile-startup', help='profile imports and startup up to the first request')
+    profile_parser.add_argument('--top', type=int, default=20,
+                                help='rows per table (default: 20)')
+    profile_parser.add_argument('--prefix', help="only list modules starting with this, e.g. 'app'")
+    profile_parser.add_argument('--path', default='/healthz',
+                                help='first request to serve (default: /healthz)')
+    profile_parser.set_defaults(func=cmd_profile_startup, create_app=False)
+
+    spec_parser = commands.add_parser('build-spec', help='precompute the OpenAPI spec')
+    spec_parser.add_argument('--output', help='spec file (default: API_SPEC_PATH or '
+                                              '<instance>/swagger.json)')
+    spec_parser.add_argument('--check', action='store_true',
+                             help='only verify that the file matches the models')
+    spec_parser.set_defaults(func=cmd_build_spec, with_api=True)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Commands do not serve HTTP, so only those that need it load the API
+    app = (create_app(args.config, with_api=getattr(args, 'with_api', False))
+           if getattr(args, 'create_app', True) else None)
+    return args.func(app, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
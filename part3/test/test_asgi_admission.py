@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for admission control of the native ASGI routes
+Concurrent reads beyond the 'heavy' limit wait in the queue on the event
+loop instead of being rejected, and leave the gate empty afterwards.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db  # noqa: E402
+from app.asgi import create_asgi_app  # noqa: E402
+from config import Config  # noqa: E402
+
+
+def make_asgi_app(db_path, heavy_limit=(2, 32, 5.0)):
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        JWT_SECRET_KEY = 'test-secret-key-of-sufficient-length'
+        JWT_ALGORITHM = 'HS256'
+        BCRYPT_POOL_SIZE = 0
+        JOBS_WORKERS = 0
+        ADMISSION_LIMITS = {'heavy': heavy_limit}
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+    asgi = create_asgi_app(app)
+    route = next(route for route in asgi.routes if route.handler == asgi.list_places)
+    list_places = route.handler
+
+    async def slow_list_places():
+        # Long enough that the requests overlap and the gate fills up
+        await asyncio.sleep(0.05)
+        return await list_places()
+
+    route.handler = slow_list_places
+    return app, asgi
+
+
+async def get(asgi, path, headers=()):
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'',
+             'headers': [(name.encode(), value.encode()) for name, value in headers],
+             'client': ('127.0.0.1', 1), 'server': ('localhost', 80),
+             'scheme': 'http', 'root_path': '', 'http_version': '1.1'}
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    response = {}
+
+    async def receive():
+        return messages.pop() if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            response['status'] = message['status']
+
+    await asgi(scope, receive, send)
+    return response['status']
+
+
+def heavy_stats(app):
+    return app.extensions['admission'].gates['heavy'].stats()
+
+
+def test_concurrent_reads_queue():
+    """More concurrent reads than the limit wait for a slot, none get 503"""
+    print("🚦 Testing queued ASGI reads...")
+    with tempfile.TemporaryDirectory() as tmp:
+        app, asgi = make_asgi_app(os.path.join(tmp, 'asgi.db'))
+
+        async def run():
+            return await asyncio.gather(*(get(asgi, '/api/v1/places/') for _ in range(20)))
+
+        statuses = asyncio.run(run())
+        stats = heavy_stats(app)
+        assert statuses == [200] * 20, statuses
+        assert stats['queued'] > 0
+        assert stats['admitted'] == 20
+        assert stats['rejected_queue_full'] == 0
+        assert stats['active'] == 0 and stats['queue_depth'] == 0
+    print("✅ Queued ASGI reads test passed")
+
+
+def test_queue_timeout_rejects():
+    """A read that cannot get a slot within its budget gets 503"""
+    print("🚦 Testing ASGI queue timeout...")
+    with tempfile.TemporaryDirectory() as tmp:
+        app, asgi = make_asgi_app(os.path.join(tmp, 'asgi.db'), heavy_limit=(1, 32, 5.0))
+
+        async def run():
+            first = asyncio.create_task(get(asgi, '/api/v1/places/'))
+            await asyncio.sleep(0.01)
+            second = get(asgi, '/api/v1/places/', [('X-Request-Timeout', '0.01')])
+            return await asyncio.gather(first, second)
+
+        statuses = asyncio.run(run())
+        stats = heavy_stats(app)
+        assert statuses == [200, 503], statuses
+        assert stats['timed_out'] == 1
+        assert stats['active'] == 0 and stats['queue_depth'] == 0
+    print("✅ ASGI queue timeout test passed")
+
+
+if __name__ == "__main__":
+    test_concurrent_reads_queue()
+    test_queue_timeout_rejects()
@@ -0,0 +1,8 @@
+from app import create_app, warm_up
+
+app = create_app('config.ProductionConfig')
+# Built once here so preloaded workers do not each pay for it on first request
+warm_up(app)
+
+# Serve with a multi-process WSGI server, e.g.:
+#   gunicorn -c gunicorn.conf.py
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Build the frontend into dist/ with fingerprinted, precompressed assets
+
+Every referenced asset is copied as name.<hash>.ext so it can be cached
+forever (Cache-Control: immutable), references in HTML, CSS and JS are
+rewritten to the fingerprinted names, and text files get .gz (and .br
+when the brotli module is installed) variants compressed once at maximum
+level. HTML pages keep their names and are revalidated on every visit.
+
+Usage: python build_assets.py [--out dist]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIRS = ('css', 'images', 'js')
+ROOT_ASSETS = ('scripts.js',)
+TEXT_EXTENSIONS = {'.html', '.css', '.js', '.json', '.svg', '.txt'}
+# PNG/JPEG are already compressed; gzip would only cost CPU
+MIN_COMPRESS_SIZE = 256
+
+
+def list_assets():
+    """Return asset paths relative to ROOT, text assets last"""
+    assets = list(ROOT_ASSETS)
+    for directory in ASSET_DIRS:
+        for dirpath, _, filenames in os.walk(os.path.join(ROOT, directory)):
+            for filename in filenames:
+                rel = os.path.relpath(os.path.join(dirpath, filename), ROOT)
+                assets.append(rel.replace(os.sep, '/'))
+    # Binary files first, so text files can reference their fingerprinted names
+    return sorted(assets, key=lambda p: (os.path.splitext(p)[1] in TEXT_EXTENSIONS, p))
+
+
+def rewrite_references(text, mapping):
+    """Replace quoted/url() references to original paths with fingerprinted ones"""
+    if not mapping:
+        return text
+    pattern = re.compile(r'(?<=["\'(`])(%s)(?=["\')`?#])' % '|'.join(
+        re.escape(path) for path in sorted(mapping, key=len, reverse=True)))
+    return pattern.sub(lambda match: mapping[match.group(1)], text)
+
+
+def fingerprint(path, data):
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    base, ext = os.path.splitext(path)
+    return f'{base}.{digest}{ext}'
+
+
+def write_file(out_dir, rel_path, data):
+    target = os.path.join(out_dir, rel_path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'wb') as handle:
+        handle.write(data)
+    return target
+
+
+def precompress(target, data):
+    """Write .gz/.br siblings; returns {encoding: size}"""
+    sizes = {}
+    if os.path.splitext(target)[1] not in TEXT_EXTENSIONS or len(data) < MIN_COMPRESS_SIZE:
+        return sizes
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(target + '.gz', 'wb') as handle:
+            handle.write(gz)
+        sizes['gzip'] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            with open(target + '.br', 'wb') as handle:
+                handle.write(br)
+            sizes['br'] = len(br)
+    return sizes
+
+
+def build(out_dir):
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    os.makedirs(out_dir)
+
+    mapping = {}
+    report = []
+    for rel in list_assets():
+        with open(os.path.join(ROOT, rel), 'rb') as handle:
+            data = handle.read()
+        if os.path.splitext(rel)[1] in TEXT_EXTENSIONS:
+            data = rewrite_references(data.decode('utf-8'), mapping).encode('utf-8')
+        hashed = fingerprint(rel, data)
+        mapping[rel] = hashed
+        target = write_file(out_dir, hashed, data)
+        report.append((hashed, len(data), precompress(target, data)))
+
+    for page in sorted(os.listdir(ROOT)):
+        if not page.endswith('.html'):
+            continue
+        with open(os.path.join(ROOT, page), encoding='utf-8') as handle:
+            data = rewrite_references(handle.read(), mapping).encode('utf-8')
+        target = write_file(out_dir, page, data)
+        report.append((page, len(data), precompress(target, data)))
+
+    with open(os.path.join(out_dir, 'manifest.json'), 'w') as handle:
+        json.dump({'assets': mapping}, handle, indent=2, sort_keys=True)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--out', default=os.path.join(ROOT, 'dist'),
+                        help='output directory (default: part4/dist)')
+    args = parser.parse_args()
+
+    report = build(os.path.abspath(args.out))
+    total = sum(size for _, size, _ in report)
+    total_gz = sum(sizes.get('gzip', size) for _, size, sizes in report)
+    for path, size, sizes in report:
+        variants = ', '.join(f'{enc} {n}B' for enc, n in sorted(sizes.items()))
+        print(f'{path:60} {size:>9}B  {variants}')
+    print(f'\n{len(report)} files, {total}B raw, {total_gz}B with gzip'
+          + ('' if brotli else ' (install brotli for .br variants)'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
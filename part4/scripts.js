@@ -332,24 +332,42 @@ function displaySamplePlaces() {
     });
 }
 
-// Fetch place details from API with authentication
+// Run several API calls in one round trip through POST /batch
+// Each entry is {method, path, body}; resolves to [{status, headers, body}]
+async function batchRequest(token, requests) {
+    const response = await fetch(`${API_BASE_URL}/batch/`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify({ requests })
+    });
+
+    if (!response.ok) {
+        throw new Error(`Batch request failed: ${response.status}`);
+    }
+    const data = await response.json();
+    return data.responses;
+}
+
+// Fetch place details and reviews from API in a single batched request
 async function fetchPlaceDetails(token, placeId) {
     try {
-        const response = await fetch(`${API_BASE_URL}/places/${placeId}`, {
-            method: 'GET',
-            headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${token}`
-            }
-        });
+        const [placeResult, reviewsResult] = await batchRequest(token, [
+            { method: 'GET', path: `/places/${placeId}` },
+            { method: 'GET', path: `/places/${placeId}/reviews` }
+        ]);
         
-        if (response.ok) {
-            const place = await response.json();
+        if (placeResult.status === 200) {
+            const place = placeResult.body;
             displayPlaceDetails(place);
-            await loadPlaceReviews(placeId);
+            if (reviewsResult.status === 200) {
+                displayReviews(reviewsResult.body);
+            }
             return place;
         } else {
-            console.error('Failed to fetch place details:', response.statusText);
+            console.error('Failed to fetch place details:', placeResult.status);
             // Fallback to sample data if API fails
             displaySamplePlaceDetails(placeId);
             return null;